@@ -1,17 +1,24 @@
 """EGI Adapter integration init"""
 import logging
+import os
 import time
 from datetime import timedelta
+from functools import partial
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import async_get as async_get_device_registry
 
 from . import const
+from .cache import EgiEntryCache
 from .coordinator import EgiAdapterCoordinator
-from .modbus_client import get_shared_client, EgiModbusClient
+from .discovery import DISCOVER_SERVICE_SCHEMA, discover_adapters
+from .modbus_client import get_shared_client
 from .adapters import get_adapter
+from .fleet import get_solo_fleet
+from .scheduler import get_scheduler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,16 +28,88 @@ async def _async_config_entry_updated(
     hass: HomeAssistant,
     entry: ConfigEntry
 ) -> None:
-    """Reload the config entry when options are updated."""
+    """
+    Apply live-tunable option changes to the running coordinator; reload the
+    config entry only when connection data or other options changed.
+    """
+    data = hass.data.get(const.DOMAIN, {}).get(entry.entry_id)
+    if data is not None:
+        applied_data, applied_options = data["applied"]
+        changed = {
+            key for key in set(entry.options) | set(applied_options)
+            if entry.options.get(key, const.OPTION_DEFAULTS.get(key))
+            != applied_options.get(key, const.OPTION_DEFAULTS.get(key))
+        }
+        if entry.data == applied_data and changed <= const.LIVE_OPTIONS:
+            if changed and "coordinator" in data:
+                _LOGGER.debug("Applying options %s live for %s", sorted(changed), entry.entry_id)
+                data["coordinator"].apply_options(entry.options)
+            data["applied"] = (dict(entry.data), dict(entry.options))
+            return
     _LOGGER.debug("Config entry %s updated, reloading", entry.entry_id)
     await hass.config_entries.async_reload(entry.entry_id)
 
+@callback
+def _async_track_disabled_units(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coord: EgiAdapterCoordinator
+) -> None:
+    """Keep the coordinator's read plan in sync with disabled climate entities."""
+    registry = er.async_get(hass)
+    prefix = f"{entry.entry_id}_"
+
+    def _unit_key(reg_entry):
+        if reg_entry is None or reg_entry.config_entry_id != entry.entry_id:
+            return None
+        if reg_entry.domain != "climate" or not reg_entry.unique_id.startswith(prefix):
+            return None
+        if reg_entry.unique_id.startswith(f"{prefix}zone_"):
+            return None
+        return reg_entry.unique_id[len(prefix):]
+
+    for reg_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        key = _unit_key(reg_entry)
+        if key and reg_entry.disabled_by is not None:
+            coord.set_unit_enabled(key, False)
+
+    @callback
+    def _async_registry_updated(event) -> None:
+        if event.data.get("action") != "update":
+            return
+        if "disabled_by" not in event.data.get("changes", {}):
+            return
+        reg_entry = registry.async_get(event.data["entity_id"])
+        key = _unit_key(reg_entry)
+        if key is None:
+            return
+        enabled = reg_entry.disabled_by is None
+        coord.set_unit_enabled(key, enabled)
+        if enabled:
+            hass.async_create_task(coord.async_request_refresh())
+
+    entry.async_on_unload(
+        hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, _async_registry_updated)
+    )
+
+@callback
+def _async_register_discovery_service(hass: HomeAssistant) -> None:
+    if hass.services.has_service(const.DOMAIN, "discover_adapters"):
+        return
+
+    async def _discover(call):
+        await discover_adapters(hass, dict(call.data))
+    hass.services.async_register(
+        const.DOMAIN, "discover_adapters", _discover, schema=DISCOVER_SERVICE_SCHEMA
+    )
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry
 ) -> bool:
     """Set up a config entry."""
     hass.data.setdefault(const.DOMAIN, {})
+    _async_register_discovery_service(hass)
 
     # Monitor-only: just sensor & select
     if entry.data.get("adapter_type") == "none":
@@ -44,6 +123,9 @@ async def async_setup_entry(
             manufacturer="EGI",
             model="Logging Dashboard Only",
         )
+        hass.data[const.DOMAIN][entry.entry_id] = {
+            "applied": (dict(entry.data), dict(entry.options)),
+        }
         await hass.config_entries.async_forward_entry_setups(entry, ["sensor", "select"])
         entry.async_on_unload(entry.add_update_listener(_async_config_entry_updated))
         return True
@@ -51,13 +133,16 @@ async def async_setup_entry(
     # Normal mode
     start = time.perf_counter()
     adapter_type = entry.data.get("adapter_type", "light")
-    adapter = get_adapter(adapter_type)
+    # Adapter modules and pymodbus are imported on first use: keep that
+    # (and creating a new bus client) off the event loop
+    adapter = await hass.async_add_executor_job(get_adapter, adapter_type)
     _LOGGER.info("Initializing EGI adapter %s", adapter_type)
 
     conn = entry.data.get("connection_type", "serial")
     sid = entry.data.get("slave_id", const.DEFAULT_SLAVE_ID)
     if conn == "serial":
-        client = get_shared_client(
+        client = await hass.async_add_executor_job(partial(
+            get_shared_client,
             connection_type="serial",
             slave_id=sid,
             port=entry.data.get("port"),
@@ -65,34 +150,63 @@ async def async_setup_entry(
             parity=entry.data.get("parity", const.DEFAULT_PARITY),
             stopbits=entry.data.get("stopbits", const.DEFAULT_STOPBITS),
             bytesize=entry.data.get("bytesize", const.DEFAULT_BYTESIZE),
-        )
+        ))
     else:
-        client = EgiModbusClient(
+        client = await hass.async_add_executor_job(partial(
+            get_shared_client,
+            connection_type="tcp",
+            slave_id=sid,
             host=entry.data.get("host"),
             port=entry.data.get("port", 502),
-            unit_id=sid,
-        )
+        ))
 
-    if not await hass.async_add_executor_job(client.connect):
-        raise ConfigEntryNotReady("Cannot connect to Modbus")
+    # Warm start: create entities from the cached scan and state right away,
+    # connect, rescan and poll in the background once setup is done
+    cache = EgiEntryCache(hass, entry)
+    if await cache.async_load():
+        units = cache.units
+        _LOGGER.info("Warm start for %s with %d cached units", entry.entry_id, len(units))
+    else:
+        units = []
 
-    units = await hass.async_add_executor_job(adapter.scan_devices, client)
-    if not units:
-        _LOGGER.error("No devices found on adapter %s", entry.entry_id)
-        return False
+    interval = timedelta(seconds=entry.options.get("poll_interval", const.DEFAULT_POLL_INTERVAL))
+    scheduler = get_scheduler(hass)
+    if adapter_type == "solo" and conn == "serial" and entry.options.get("fleet_mode", True):
+        fleet = get_solo_fleet(hass, client.bus_key, interval, scheduler)
+        coord = EgiAdapterCoordinator(hass, client, adapter, units, interval, scheduler, fleet)
+        fleet.add_member(coord, interval)
+        entry.async_on_unload(lambda: fleet.remove_member(coord))
+    else:
+        coord = EgiAdapterCoordinator(hass, client, adapter, units, interval, scheduler)
+        scheduler.register(coord)
+        entry.async_on_unload(lambda: scheduler.unregister(coord))
+    entry.async_on_unload(coord.async_shutdown)
+    coord.apply_options(entry.options)
+    _async_track_disabled_units(hass, entry, coord)
+    if cache.data is not None:
+        coord.async_restore(cache.status, cache.adapter_info)
+        coord.cold_setup_duration = cache.cold_setup_duration
+    else:
+        if not await hass.async_add_executor_job(client.connect):
+            raise ConfigEntryNotReady("Cannot connect to Modbus")
 
-    interval = timedelta(seconds=entry.options.get("poll_interval", 2))
-    coord = EgiAdapterCoordinator(hass, client, adapter, units, interval)
-    try:
-        await coord.async_config_entry_first_refresh()
-    except Exception as e:
-        _LOGGER.error("First refresh failed: %s", e)
-        raise ConfigEntryNotReady from e
+        # Stepwise scan, so other entries on the same bus keep being served
+        units = await coord.async_scan_units()
+        if not units:
+            _LOGGER.error("No devices found on adapter %s", entry.entry_id)
+            return False
+        coord.async_apply_scan(units)
+        try:
+            await coord.async_config_entry_first_refresh()
+        except Exception as e:
+            _LOGGER.error("First refresh failed: %s", e)
+            raise ConfigEntryNotReady from e
 
     hass.data[const.DOMAIN][entry.entry_id] = {
         "client": client,
         "coordinator": coord,
         "adapter": adapter,
+        "applied": (dict(entry.data), dict(entry.options)),
     }
 
     # Register services
@@ -100,14 +214,60 @@ async def async_setup_entry(
         data = hass.data[const.DOMAIN].get(eid, {})
         obj, cli = data.get("adapter"), data.get("client")
         if obj and cli and hasattr(obj, method):
-            await hass.async_add_executor_job(getattr(obj, method), cli, *args)
+            await data["coordinator"].async_command_call(getattr(obj, method), cli, *args)
             _LOGGER.info("Called %s on %s", method, eid)
         else:
             _LOGGER.warning("%s/%s not found", method, eid)
     hass.services.async_register(const.DOMAIN, "set_system_time", lambda call: _call("write_system_time", call.data.get("entry_id")))
-    hass.services.async_register(const.DOMAIN, "set_brand_code", lambda call: _call("write_brand_code", call.data.get("entry_id"), call.data.get("brand_code")))
-    if not hass.services.has_service(const.DOMAIN, "scan_idus"): 
-        hass.services.async_register(const.DOMAIN, "scan_idus", lambda call: coord.async_request_refresh())
+    async def _set_brand_code(call):
+        data = hass.data[const.DOMAIN].get(call.data.get("entry_id"), {})
+        if "coordinator" not in data:
+            _LOGGER.warning("write_brand_code/%s not found", call.data.get("entry_id"))
+            return
+        await data["coordinator"].async_run_restart_command(
+            "write_brand_code", call.data.get("brand_code")
+        )
+    hass.services.async_register(const.DOMAIN, "set_brand_code", _set_brand_code)
+    async def _scan_idus(call):
+        eid = call.data.get("entry_id")
+        for entry_id in [eid] if eid else list(hass.data[const.DOMAIN]):
+            coordinator = hass.data[const.DOMAIN].get(entry_id, {}).get("coordinator")
+            if coordinator is None:
+                if eid:
+                    _LOGGER.warning("scan_idus/%s not found", eid)
+                continue
+            await coordinator.async_rescan()
+    if not hass.services.has_service(const.DOMAIN, "scan_idus"):
+        hass.services.async_register(const.DOMAIN, "scan_idus", _scan_idus)
+    @callback
+    def _cancel_scan(call):
+        eid = call.data.get("entry_id")
+        for entry_id in [eid] if eid else list(hass.data[const.DOMAIN]):
+            coordinator = hass.data[const.DOMAIN].get(entry_id, {}).get("coordinator")
+            if coordinator is not None:
+                coordinator.async_cancel_rescan()
+                coordinator.async_cancel_explore()
+    if not hass.services.has_service(const.DOMAIN, "cancel_scan"):
+        hass.services.async_register(const.DOMAIN, "cancel_scan", _cancel_scan)
+    @callback
+    def _explore_registers(call):
+        eid = call.data.get("entry_id")
+        coordinator = hass.data[const.DOMAIN].get(eid, {}).get("coordinator")
+        if coordinator is None:
+            _LOGGER.warning("explore_registers/%s not found", eid)
+            return
+        start = int(call.data.get("start", 0))
+        count = min(int(call.data.get("count", 1)), 65536 - start)
+        filename = os.path.basename(
+            call.data.get("filename") or f"egi_registers_{eid}_{start}-{start + count - 1}.json"
+        )
+        block_size = call.data.get("block_size")
+        if coordinator.async_start_explore(
+            start, count, hass.config.path(filename), int(block_size) if block_size else None
+        ) is None:
+            _LOGGER.warning("A register sweep is already running for %s", eid)
+    if not hass.services.has_service(const.DOMAIN, "explore_registers"):
+        hass.services.async_register(const.DOMAIN, "explore_registers", _explore_registers)
     hass.services.async_register(const.DOMAIN, "set_log_level", lambda call: _call("set_log_level", call.data.get("entry_id"), call.data.get("level")))
 
     # Register device
@@ -120,10 +280,18 @@ async def async_setup_entry(
         manufacturer="EGI",
         model=f"{adapter.display_type} - {adapter.get_brand_name(coord.gateway_brand_code)}",
     )
-    if coord.gateway_brand_code:
+    # Skip the update (and its registry write) when nothing changed since the last start
+    if coord.gateway_brand_code and (dev.sw_version, dev.name_by_user) != ("1.0", adapter.name):
         registry.async_update_device(dev.id, sw_version="1.0", name_by_user=adapter.name)
 
+    # Unit devices are registered in bulk by the climate platform
+    registered = time.perf_counter()
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    coord.registration_duration = time.perf_counter() - registered
+    _LOGGER.debug(
+        "Registered %d indoor units in %.3f s",
+        len(coord.devices), coord.registration_duration
+    )
     entry.async_on_unload(entry.add_update_listener(_async_config_entry_updated))
 
     # Update title
@@ -134,12 +302,29 @@ async def async_setup_entry(
     unit = getattr(client, "unit_id", sid)
     port = entry.data.get("port") if conn == "serial" else f"{entry.data.get('host')}:{entry.data.get('port',502)}"
     title = f"{adapter.name} - {brand} (ID {unit} / {port})"
-    hass.config_entries.async_update_entry(entry, title=title)
+    if entry.title != title:
+        hass.config_entries.async_update_entry(entry, title=title)
 
     coord.setup_duration = time.perf_counter() - start
-    _LOGGER.debug("Setup completed in %.2f s", coord.setup_duration)
+    if coord.warm_start:
+        coord.async_begin_warm_start(start)
+    else:
+        coord.ready_duration = coord.cold_setup_duration = coord.setup_duration
+        await cache.async_save(coord)
+    entry.async_on_unload(coord.async_add_listener(lambda: cache.async_schedule_save(coord)))
+    _LOGGER.debug(
+        "Setup completed in %.2f s (%s start)",
+        coord.setup_duration, "warm" if coord.warm_start else "cold"
+    )
     return True
 
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry
+) -> None:
+    """Drop the warm start cache of a removed entry."""
+    await EgiEntryCache(hass, entry).async_remove()
+
 async def async_unload_entry(
     hass: HomeAssistant,
     entry: ConfigEntry
@@ -161,7 +346,7 @@ async def async_unload_entry(
         pass
     # remove services if none remain
     if not hass.data[const.DOMAIN]:
-        for s in ("set_system_time","set_brand_code","scan_idus","set_log_level"):
+        for s in ("set_system_time","set_brand_code","scan_idus","cancel_scan","explore_registers","set_log_level","discover_adapters"):
             if hass.services.has_service(const.DOMAIN,s):
                 hass.services.async_remove(const.DOMAIN,s)
     _LOGGER.debug("Unloaded entry %s", entry.entry_id)
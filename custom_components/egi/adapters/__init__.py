@@ -1,8 +1,13 @@
 """Adapter factory logic for EGI VRF integration."""
+import importlib
 
-from .solo import AdapterSolo
-from .vrf_light import AdapterVrfLight
-from .vrf_pro import AdapterVrfPro
+# Adapter modules are imported on first use, so only the profiles of
+# configured adapter types get loaded
+ADAPTER_CLASSES = {
+    "solo": ("solo", "AdapterSolo"),
+    "light": ("vrf_light", "AdapterVrfLight"),
+    "pro": ("vrf_pro", "AdapterVrfPro"),
+}
 
 def get_adapter(adapter_type: str):
     """
@@ -10,9 +15,6 @@ def get_adapter(adapter_type: str):
     Valid types: 'solo', 'light', 'pro'.
     Defaults to VRF Light if type is unknown.
     """
-    if adapter_type == "solo":
-        return AdapterSolo()
-    elif adapter_type == "pro":
-        return AdapterVrfPro()
-    else:
-        return AdapterVrfLight()
+    module_name, class_name = ADAPTER_CLASSES.get(adapter_type, ADAPTER_CLASSES["light"])
+    module = importlib.import_module(f".{module_name}", __name__)
+    return getattr(module, class_name)()
@@ -1,31 +1,73 @@
 """Base class for EGI VRF adapter profiles."""
 import logging
 
+from ..modbus_client import PROBE_NO_RESPONSE, PROBE_OK, PROBE_UNSUPPORTED
+from ..state import UNAVAILABLE
+
 class BaseAdapter:
     """
     Base interface for an EGI VRF adapter profile.
-    Each subclass must implement the read/write methods according to its Modbus mapping.
+    Register access is driven by the compiled RegisterMap of the subclass
+    (see register_map.py and profiles.py); subclasses add scanning and the
+    adapter-wide commands (restart, brand code, ...).
     """
 
+    # Compiled register layout, set by subclasses
+    register_map = None
+
     def __init__(self):
         # Common flags or info; subclasses can override
         self._log = logging.getLogger(f"custom_components.egi.adapter.{self.__class__.__name__}")
         self.name = "BaseAdapter"
         self.max_idus = 1
         self.supports_brand_write = False
+        self.map = self.register_map
+        # Single cheap register used to check whether the adapter answers
+        self.probe_address = self.map.probe_address if self.map else 0
+        self.supports_block_read = bool(self.map and self.map.block_read)
+        # Read/Write Multiple Registers (FC23): None until the first command tells
+        self.supports_readwrite = None
 
     def scan_devices(self, client):
         """
-        Return a list of (system, index) or (address) for all discovered IDUs.
-        Subclasses that support multiple IDUs should override.
+        Return a list of (system, index) for all discovered IDUs.
+        Single-unit adapters report their fixed units; table adapters
+        block-read the whole status table (see RegisterMap.scan()).
+        """
+        if self.map is None:
+            return [(0, 0)]
+        if self.map.fixed_units:
+            return list(self.map.fixed_units)
+        found = [self.map.unit_of(slot) for slot in self.map.scan(client)]
+        self._log.info("%s scan found %d IDUs", self.name, len(found))
+        return found
+
+    def create_scan(self):
         """
-        # By default, assume single device only
-        return [(0, 0)]
+        Resumable scan (register_map.TableScan) for stepwise scanning with the
+        bus released in between, or None when scan_devices() is trivial.
+        """
+        return self.map.create_scan() if self.map is not None else None
+
+    def unit_of(self, slot):
+        """(system, index) of a status table row."""
+        return self.map.unit_of(slot)
+
+    def read_adapter_info(self, client):
+        """Read the raw adapter info group ({} if it did not answer)."""
+        try:
+            info = self.map.read_info(client)
+        except Exception as e:
+            self._log.warning("Failed to read adapter info for %s: %s", self.name, e)
+            return {}
+        if not info:
+            self._log.warning("No response for adapter info from %s", self.name)
+        return info
 
     def read_status(self, client, system, index):
         """
         Read status registers for the given IDU (system,index)
-        Return a dict with keys like:
+        Return an IduState (see state.py) with fields like:
           {
             "available": bool,
             "power": bool,
@@ -36,29 +78,122 @@ class BaseAdapter:
             "wind_code": int,
             "error_code": int,
           }
-        Subclass must implement.
         """
-        raise NotImplementedError("read_status() must be implemented by subclass.")
+        try:
+            status = self.map.read_status(client, self.slot_of(system, index))
+        except Exception as e:
+            self._log.error("Error reading status for IDU %s-%s: %s", system, index, e)
+            return UNAVAILABLE
+        if status.available:
+            self._log.debug("Read status for IDU %s-%s: %s", system, index, status)
+        else:
+            self._log.warning("No response from IDU %s-%s", system, index)
+        return status
+
+    def decode_mode(self, value):
+        return self.map.modes.get(value, self.map.default_mode)
+
+    def encode_mode(self, ha_mode):
+        return self.map.mode_codes.get(ha_mode, self.map.default_mode_code)
+
+    def decode_fan(self, value):
+        return self.map.fans.get(value, "auto")
+
+    def encode_fan(self, ha_fan):
+        return self.map.fan_codes.get(ha_fan, 0x00)
+
+    def _write_control(self, client, system, index, name, value):
+        self._log.debug("Write %s=%s to IDU %s-%s", name, value, system, index)
+        return self.map.write_field(client, self.slot_of(system, index), name, value)
 
     def write_power(self, client, system, index, power_on: bool):
-        """Turn IDU on/off. Subclass must implement."""
-        raise NotImplementedError("write_power() must be implemented by subclass.")
+        """Turn IDU on/off."""
+        return self._write_control(client, system, index, "power", bool(power_on))
 
     def write_mode(self, client, system, index, mode_code: int):
-        """Set mode (heat/cool/fan/dry). Subclass must implement."""
-        raise NotImplementedError("write_mode() must be implemented by subclass.")
+        """Set mode (heat/cool/fan/dry)."""
+        return self._write_control(client, system, index, "mode_code", mode_code)
 
     def write_temperature(self, client, system, index, temp: int):
-        """Set target temperature. Subclass must implement."""
-        raise NotImplementedError("write_temperature() must be implemented by subclass.")
+        """Set target temperature (clamped to the adapter's range)."""
+        return self._write_control(client, system, index, "target_temp", temp)
 
     def write_fan_speed(self, client, system, index, fan_code: int):
-        """Set fan speed. Subclass must implement."""
-        raise NotImplementedError("write_fan_speed() must be implemented by subclass.")
+        """Set fan speed."""
+        return self._write_control(client, system, index, "fan_code", fan_code)
 
     def write_swing(self, client, system, index, swing_code: int):
-        """Set swing/wind direction. Subclass must implement."""
-        raise NotImplementedError("write_swing() must be implemented by subclass.")
+        """Set swing/wind direction."""
+        return self._write_control(client, system, index, "wind_code", swing_code)
+
+    def write_and_read(self, client, system, index, name, value):
+        """
+        Write one control field and read the unit's status back. Uses a single
+        FC23 transaction while the adapter supports it (detected on the first
+        command, then remembered); otherwise a plain write whose result the
+        coordinator confirms with its next read. An adapter that does not
+        answer the first FC23 at all is taken as not supporting it, as many
+        gateways drop unknown function codes silently and every command would
+        otherwise wait out a timeout first. Returns (ok, IduState or None).
+        """
+        if self.supports_readwrite is not False:
+            outcome, status = self.map.write_field_read_status(
+                client, self.slot_of(system, index), name, value
+            )
+            if outcome == PROBE_OK:
+                if self.supports_readwrite is None:
+                    self._log.info("Adapter supports FC23, commands read the unit back in one transaction")
+                self.supports_readwrite = True
+                return True, status
+            if outcome == PROBE_UNSUPPORTED:
+                self._log.info("Adapter rejects FC23, using separate writes and reads")
+                self.supports_readwrite = False
+            elif outcome == PROBE_NO_RESPONSE and self.supports_readwrite is None:
+                self._log.info("Adapter did not answer FC23, using separate writes and reads")
+                self.supports_readwrite = False
+            else:
+                self._log.debug("FC23 write of %s to IDU %s-%s failed (%s), retrying as a plain write",
+                                name, system, index, outcome)
+        return self._write_control(client, system, index, name, value), None
+
+    def write_units(self, client, slots, changes):
+        """
+        Write the same {field: value} changes to many units (status table
+        slots) using as few multi-register writes as the control table
+        allows (see RegisterMap.write_units()). Returns the set of slots
+        whose writes went through.
+        """
+        written = self.map.write_units(client, slots, changes)
+        failed = set(slots) - written
+        if failed:
+            self._log.warning("Writing %s to %d IDUs failed", changes, len(failed))
+        return written
+
+    def slot_of(self, system, index):
+        """Row number of an IDU in the status table."""
+        return self.map.slot_of(system, index)
+
+    def create_table_decoder(self):
+        return self.map.create_decoder()
+
+    def create_table_reader(self):
+        return self.map.create_reader()
+
+    def decode_status_row(self, words, slot):
+        """Decode one slot's row of a block-read status table."""
+        stride = self.map.status_stride
+        return self.map.decode_row(words[slot * stride:(slot + 1) * stride])
+
+    def read_status_table(self, client, slots):
+        """
+        Block-read the status rows of the given slots.
+        Returns (words, valid_slots), see status_table.read_table().
+        """
+        return self.map.read_table(client, slots)
+
+    def probe(self, client):
+        """Return True if the adapter answers a one-register read."""
+        return client.read_holding_registers(self.probe_address, 1) is not None
 
     def read_brand_code(self, client):
         """Read global brand code from the adapter if available."""
@@ -0,0 +1,165 @@
+"""
+Register layouts of the EGI adapters, described as data.
+
+Each profile is compiled once into a RegisterMap (see register_map.py). New
+firmware variants only need a new or adjusted profile here.
+"""
+
+# Code <-> Home Assistant value tables shared by all adapters
+MODES = {
+    0x01: "heat",
+    0x02: "cool",
+    0x04: "fan_only",
+    0x08: "dry",
+}
+
+FANS = {
+    0x00: "auto",
+    0x01: "low",
+    0x02: "medium",
+    0x03: "high",
+}
+
+# VRF Adapter Light: 8 systems x 32 IDUs, status rows of 6 words from D0000,
+# control rows of 4 words from D4000, adapter info at D8000
+LIGHT_PROFILE = {
+    "name": "vrf_light",
+    "probe_address": 8000,
+    "modes": MODES,
+    "fans": FANS,
+    "status": {
+        "block_read": True,
+        "base": 0,
+        "stride": 6,
+        "slots": 256,
+        "units_per_system": 32,
+        "fields": (
+            {"name": "power", "offset": 0, "kind": "bool"},
+            {"name": "target_temp", "offset": 1},
+            {"name": "mode_code", "offset": 2, "mask": 0xFF},
+            {"name": "fan_code", "offset": 3, "mask": 0xFF},
+            {"name": "wind_code", "offset": 3, "shift": 8, "mask": 0xFF},
+            {"name": "current_temp", "offset": 4},
+            {"name": "error_code", "offset": 5},
+        ),
+    },
+    # Any non-zero status word marks an occupied slot
+    "occupancy": {"words": 6},
+    "control": {
+        "base": 4000,
+        "stride": 4,
+        "fields": (
+            {"name": "power", "offset": 0, "values": {True: 0x01, False: 0x02}},
+            {"name": "target_temp", "offset": 1, "min": 16, "max": 30},
+            {"name": "mode_code", "offset": 2, "mask": 0xFF},
+            {"name": "fan_code", "offset": 3, "mask": 0xFF},
+            {"name": "wind_code", "offset": 3, "shift": 8, "mask": 0xFF},
+        ),
+    },
+    "info": {
+        "address": 8000,
+        "count": 5,
+        "fields": (
+            {"name": "brand_code", "offset": 0, "mask": 0xFF},
+            {"name": "supported_modes", "offset": 1},
+            {"name": "supported_fan", "offset": 2},
+            {"name": "temp_limits", "offset": 3},
+            {"name": "special_info", "offset": 4},
+        ),
+    },
+}
+
+# VRF Adapter Pro: 64 IDUs, read/write rows of 16 words from D24000,
+# brand code and slave id packed into D0015
+PRO_PROFILE = {
+    "name": "vrf_pro",
+    "probe_address": 15,
+    "modes": MODES,
+    "fans": FANS,
+    "status": {
+        "block_read": True,
+        "base": 24000,
+        "stride": 16,
+        "slots": 64,
+        "fields": (
+            {"name": "power", "offset": 3, "kind": "bool"},
+            {"name": "target_temp", "offset": 4},
+            {"name": "mode_code", "offset": 5},
+            {"name": "fan_code", "offset": 6},
+            {"name": "wind_code", "offset": 7},
+            {"name": "current_temp", "offset": 10},
+            {"name": "humidity", "offset": 11},
+            {"name": "runtime_minutes", "offset": 13},
+            {"name": "error_code", "offset": 14, "kind": "ascii"},
+        ),
+    },
+    # The first 6 words are not all zero and the address words are bytes
+    "occupancy": {"words": 6, "max": {0: 255, 1: 255}},
+    "control": {
+        "base": 24000,
+        "stride": 16,
+        "fields": (
+            {"name": "power", "offset": 3, "values": {True: 1, False: 0}},
+            {"name": "target_temp", "offset": 4, "min": 16, "max": 32},
+            {"name": "mode_code", "offset": 5},
+            {"name": "fan_code", "offset": 6},
+            {"name": "wind_code", "offset": 7},
+        ),
+    },
+    "info": {
+        "address": 15,
+        "count": 1,
+        "fields": (
+            {"name": "brand_code", "offset": 0, "mask": 0xFF},
+            {"name": "slave_id", "offset": 0, "shift": 8, "mask": 0xFF},
+        ),
+    },
+}
+
+# HVAC Adapter Solo: one IDU, status D0000-D0006, control D4000-D4004,
+# brand code at D2000
+SOLO_PROFILE = {
+    "name": "solo",
+    "probe_address": 2000,
+    "modes": MODES,
+    "fans": FANS,
+    "status": {
+        "base": 0,
+        "stride": 7,
+        "slots": 1,
+        "fields": (
+            {"name": "power", "offset": 0, "kind": "bool"},
+            {"name": "mode_code", "offset": 1, "mask": 0xFF},
+            {"name": "target_temp", "offset": 2},
+            {"name": "fan_code", "offset": 3, "mask": 0x0F},
+            {"name": "wind_code", "offset": 4, "mask": 0xFF},
+            {"name": "error_code", "offset": 5},
+            {"name": "current_temp", "offset": 6},
+        ),
+    },
+    "occupancy": {"fixed_units": ((0, 0),)},
+    "control": {
+        "base": 4000,
+        "stride": 5,
+        "fields": (
+            {"name": "power", "offset": 0, "values": {True: 1, False: 0}},
+            {"name": "mode_code", "offset": 1, "mask": 0x0F},
+            {"name": "target_temp", "offset": 2, "min": 16, "max": 30},
+            {"name": "fan_code", "offset": 3, "mask": 0x0F},
+            {"name": "wind_code", "offset": 4, "mask": 0xFF},
+        ),
+    },
+    "info": {
+        "address": 2000,
+        "count": 1,
+        "fields": (
+            {"name": "brand_code", "offset": 0},
+        ),
+        "constants": {
+            "supported_modes": 0,
+            "supported_fan": 0,
+            "temp_limits": 0,
+            "special_info": 0,
+        },
+    },
+}
@@ -3,6 +3,10 @@ Adapter logic for EGI HVAC Adapter Solo (single IDU).
 """
 import logging
 from .base_adapter import BaseAdapter
+from .profiles import SOLO_PROFILE
+from ..register_map import RegisterMap
+
+REGISTER_MAP = RegisterMap(SOLO_PROFILE)
 
 BRAND_NAMES = {
     1: "Hitachi VRF (2-wire)", 2: "Daikin VRF (2-wire)", 3: "Toshiba VRF (2-wire)",
@@ -28,6 +32,7 @@ BRAND_NAMES = {
 
 class AdapterSolo(BaseAdapter):
     BRAND_NAMES = BRAND_NAMES
+    register_map = REGISTER_MAP
 
     def __init__(self):
         super().__init__()
@@ -43,80 +48,6 @@ class AdapterSolo(BaseAdapter):
     def get_brand_name(self, code):
         return BRAND_NAMES.get(code, f"Unknown ({code})")
 
-    def read_adapter_info(self, client):
-        try:
-            reg = client.read_holding_registers(2000, 1)
-            if not reg:
-                self._log.warning("Solo: No response for adapter info (D2000).")
-                return {}
-            self._log.debug("Solo adapter info: D2000 = %s", reg)
-            return {
-                "brand_code": reg[0],
-                "supported_modes": 0,
-                "supported_fan": 0,
-                "temp_limits": 0,
-                "special_info": 0,
-            }
-        except Exception as e:
-            self._log.warning("Failed to read Solo adapter info: %s", e)
-            return {}
-
-    def scan_devices(self, client):
-        self._log.debug("Solo scan_devices always returns one device (0,0).")
-        return [(0, 0)]
-
-    def read_status(self, client, system, index):
-        data = {
-            "available": False,
-            "power": False,
-            "mode_code": 0,
-            "target_temp": 24,
-            "current_temp": 0,
-            "fan_code": 0,
-            "wind_code": 0,
-            "error_code": 0
-        }
-        try:
-            regs = client.read_holding_registers(0, 7)
-            if not regs or len(regs) < 7:
-                self._log.warning("Solo read_status: no or partial response from IDU 0-0")
-                return data
-
-            data["available"] = True
-            data["power"] = bool(regs[0])
-            data["mode_code"] = regs[1] & 0xFF
-            data["target_temp"] = regs[2]
-            data["fan_code"] = regs[3] & 0x0F
-            data["wind_code"] = regs[4] & 0xFF
-            data["error_code"] = regs[5]
-            data["current_temp"] = regs[6]
-
-            self._log.debug("Solo read_status for IDU 0-0: %s", data)
-        except Exception as e:
-            self._log.error("Error reading Solo status: %s", e)
-        return data
-
-    def write_power(self, client, system, index, power_on: bool):
-        self._log.info("Solo write_power(%s) to IDU 0-0", power_on)
-        return client.write_register(4000, 1 if power_on else 0)
-
-    def write_mode(self, client, system, index, mode_code: int):
-        self._log.info("Solo write_mode(%s) to IDU 0-0", mode_code)
-        return client.write_register(4001, mode_code & 0x0F)
-
-    def write_temperature(self, client, system, index, temp: int):
-        tval = max(16, min(30, temp))
-        self._log.info("Solo write_temperature(%s → %s) to IDU 0-0", temp, tval)
-        return client.write_register(4002, tval)
-
-    def write_fan_speed(self, client, system, index, fan_code: int):
-        self._log.info("Solo write_fan_speed(%s) to IDU 0-0", fan_code)
-        return client.write_register(4003, fan_code & 0x0F)
-
-    def write_swing(self, client, system, index, swing_code: int):
-        self._log.info("Solo write_swing(%s) to IDU 0-0", swing_code)
-        return client.write_register(4004, swing_code & 0xFF)
-
     def write_brand_code(self, client, brand_id: int):
         self._log.info("Solo write_brand_code(%s) + restart", brand_id)
         success = client.write_register(4010, brand_id & 0xFF)
@@ -132,38 +63,6 @@ class AdapterSolo(BaseAdapter):
         self._log.info("Solo factory_reset()")
         return client.write_register(4016, 1)
 
-    def decode_mode(self, value):
-        return {
-            0x01: "heat",
-            0x02: "cool",
-            0x04: "fan_only",
-            0x08: "dry",
-        }.get(value, "fan_only")
-
-    def encode_mode(self, ha_mode):
-        return {
-            "heat": 0x01,
-            "cool": 0x02,
-            "fan_only": 0x04,
-            "dry": 0x08,
-        }.get(ha_mode, 0x02)
-
-    def decode_fan(self, value):
-        return {
-            0x00: "auto",
-            0x01: "low",
-            0x02: "medium",
-            0x03: "high",
-        }.get(value, "auto")
-
-    def encode_fan(self, ha_fan):
-        return {
-            "auto": 0x00,
-            "low": 0x01,
-            "medium": 0x02,
-            "high": 0x03,
-        }.get(ha_fan, 0x00)
-
     def decode_adapter_info(self, info: dict) -> dict:
         """
         Turn raw registers from read_adapter_info() into a friendly dict.
@@ -41,11 +41,8 @@ class RestartAdapterButton(ButtonEntity):
     async def async_press(self) -> None:
         _LOGGER.info("Restarting adapter via button entity...")
         try:
-            await self.hass.async_add_executor_job(
-                self._adapter.restart_adapter,
-                self._coordinator._client
-            )
-            _LOGGER.info("Adapter restart command sent.")
+            if await self._coordinator.async_run_restart_command("restart_device"):
+                _LOGGER.info("Adapter restart command sent.")
         except Exception as e:
             _LOGGER.error("Failed to restart adapter: %s", e)
 
@@ -62,11 +59,8 @@ class FactoryResetButton(ButtonEntity):
     async def async_press(self) -> None:
         _LOGGER.info("Performing factory reset on adapter...")
         try:
-            await self.hass.async_add_executor_job(
-                self._adapter.factory_reset,
-                self._coordinator._client
-            )
-            _LOGGER.info("Factory reset command sent.")
+            if await self._coordinator.async_run_restart_command("factory_reset"):
+                _LOGGER.info("Factory reset command sent.")
         except Exception as e:
             _LOGGER.error("Factory reset failed: %s", e)
 
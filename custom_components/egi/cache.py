@@ -0,0 +1,82 @@
+"""
+Per-entry persistence of the discovered indoor units and their last-known
+state, so entities can be created right away on the next start (warm start).
+"""
+import logging
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+from . import const
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EgiEntryCache:
+    """
+    Wraps a Store holding the unit list, the last status snapshot and the
+    adapter info of one config entry. The cache is ignored when the entry's
+    connection data changed since it was written.
+    """
+
+    def __init__(self, hass, entry):
+        self._store = Store(hass, const.STORAGE_VERSION, const.STORAGE_KEY.format(entry.entry_id))
+        self._entry_data = dict(entry.data)
+        self._save_pending = False
+        self.data = None
+
+    async def async_load(self):
+        """Load the cache; returns True if it is usable for a warm start."""
+        try:
+            data = await self._store.async_load()
+        except Exception as err:
+            _LOGGER.warning("Could not load entry cache, starting cold: %s", err)
+            data = None
+        if not data or data.get("entry_data") != self._entry_data or not data.get("units"):
+            self.data = None
+            return False
+        self.data = data
+        return True
+
+    @property
+    def units(self):
+        return [tuple(unit) for unit in self.data["units"]]
+
+    @property
+    def status(self):
+        return self.data.get("status", {})
+
+    @property
+    def adapter_info(self):
+        return self.data.get("adapter_info") or {}
+
+    @property
+    def cold_setup_duration(self):
+        return self.data.get("cold_setup_duration")
+
+    def _payload(self, coordinator):
+        self._save_pending = False
+        return {
+            "entry_data": self._entry_data,
+            "units": [list(unit) for unit in coordinator.devices],
+            "status": {
+                key: status.as_dict() for key, status in coordinator.data.items()
+                if status.available
+            },
+            "adapter_info": coordinator.adapter_info,
+            "cold_setup_duration": coordinator.cold_setup_duration,
+        }
+
+    @callback
+    def async_schedule_save(self, coordinator):
+        """Write the coordinator's state after CACHE_SAVE_DELAY (once per delay window)."""
+        if self._save_pending:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(lambda: self._payload(coordinator), const.CACHE_SAVE_DELAY)
+
+    async def async_save(self, coordinator):
+        await self._store.async_save(self._payload(coordinator))
+
+    async def async_remove(self):
+        await self._store.async_remove()
@@ -1,5 +1,7 @@
 """Climate platform for EGI VRF integration."""
+import asyncio
 import logging
+from collections import Counter
 from homeassistant.components.climate import (
     ClimateEntity,
     ClimateEntityFeature,
@@ -11,13 +13,38 @@ from homeassistant.components.climate import (
 from homeassistant.const import UnitOfTemperature, ATTR_TEMPERATURE
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import slugify
 
 from . import const
+from .state import UNAVAILABLE
+from .zones import parse_zones
 
 _LOGGER = logging.getLogger(__name__)
 
+# Record fields shown by the entity besides the current temperature
+RENDERED_FIELDS = (
+    "available",
+    "power",
+    "mode_code",
+    "target_temp",
+    "fan_code",
+    "wind_code",
+    "error_code",
+    "stale",
+)
+
+HVAC_ACTIONS = {
+    HVACMode.OFF: HVACAction.OFF,
+    HVACMode.COOL: HVACAction.COOLING,
+    HVACMode.HEAT: HVACAction.HEATING,
+    HVACMode.DRY: HVACAction.DRYING,
+    HVACMode.FAN_ONLY: HVACAction.FAN,
+}
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -26,28 +53,155 @@ async def async_setup_entry(
     data = hass.data[const.DOMAIN][config_entry.entry_id]
     coord = data["coordinator"]
     adapter = data["adapter"]
+    await _async_add_units(hass, config_entry, coord, adapter, coord.devices, async_add_entities)
+    _async_add_zones(config_entry, coord, adapter, async_add_entities)
+
+    @callback
+    def _async_units_changed(added, removed):
+        if added:
+            hass.async_create_task(
+                _async_add_units(hass, config_entry, coord, adapter, added, async_add_entities)
+            )
+        if removed:
+            _async_remove_units(hass, config_entry, removed)
+
+    config_entry.async_on_unload(
+        async_dispatcher_connect(hass, coord.units_changed_signal, _async_units_changed)
+    )
+
+    # The unit devices carry the brand in their model
+    brand_code = coord.gateway_brand_code
+
+    @callback
+    def _async_brand_changed():
+        nonlocal brand_code
+        if coord.gateway_brand_code != brand_code:
+            brand_code = coord.gateway_brand_code
+            _async_register_unit_devices(hass, config_entry, coord, adapter, coord.devices)
+
+    config_entry.async_on_unload(coord.async_add_listener(_async_brand_changed))
+
+async def _async_add_units(hass, config_entry, coord, adapter, units, async_add_entities):
+    """
+    Register the devices of all units in one pass, then add their climate
+    entities in batches, yielding to the event loop between batches.
+    """
+    units = list(units)
+    _async_register_unit_devices(hass, config_entry, coord, adapter, units)
     entities = [
         EgiVrfClimate(coord, adapter, config_entry, system, index)
-        for (system, index) in coord.devices
+        for (system, index) in units
     ]
-    async_add_entities(entities)
+    batch = const.ENTITY_ADD_BATCH
+    for start in range(0, len(entities), batch):
+        async_add_entities(entities[start:start + batch])
+        await asyncio.sleep(0)
 
-class EgiVrfClimate(CoordinatorEntity, ClimateEntity):
-    _attr_supported_features = (
-        ClimateEntityFeature.TARGET_TEMPERATURE |
-        ClimateEntityFeature.FAN_MODE |
-        ClimateEntityFeature.SWING_MODE
+@callback
+def _async_add_zones(config_entry, coord, adapter, async_add_entities):
+    """Add a zone climate entity for every zone in the entry's options."""
+    try:
+        zones = parse_zones(config_entry.options.get("zones", ""))
+    except ValueError as err:
+        _LOGGER.error("Ignoring zone definitions: %s", err)
+        return
+    known = set(coord.devices)
+    entities = []
+    for name, units in zones.items():
+        unknown = [f"{system}-{index}" for system, index in units if (system, index) not in known]
+        if unknown:
+            _LOGGER.warning("Zone %s: units %s not found on the adapter (yet)", name, ", ".join(unknown))
+        entities.append(EgiZoneClimate(coord, adapter, config_entry, name, units))
+    if entities:
+        async_add_entities(entities)
+
+@callback
+def _async_register_unit_devices(hass, config_entry, coord, adapter, units):
+    """
+    Create or update the devices of many indoor units at once. Devices that
+    are unchanged since the last start are reused as they are, so adding the
+    entities afterwards finds nothing left to write.
+    """
+    dev_reg = dr.async_get(hass)
+    entry_id = config_entry.entry_id
+    gateway = dev_reg.async_get_device(identifiers={(const.DOMAIN, f"gateway_{entry_id}")})
+    model = f"{adapter.get_brand_name(coord.gateway_brand_code)} Indoor Unit"
+    existing = {
+        identifier: device
+        for device in dr.async_entries_for_config_entry(dev_reg, entry_id)
+        for domain, identifier in device.identifiers
+        if domain == const.DOMAIN
+    }
+    created = updated = 0
+    for system, index in units:
+        name = f"Indoor Unit {system}-{index}"
+        identifier = f"{entry_id}_idu_{system}-{index}"
+        device = existing.get(identifier)
+        if device is None:
+            dev_reg.async_get_or_create(
+                config_entry_id=entry_id,
+                identifiers={(const.DOMAIN, identifier)},
+                name=name,
+                manufacturer="EGI",
+                model=model,
+                via_device=(const.DOMAIN, f"gateway_{entry_id}"),
+            )
+            created += 1
+            continue
+        via_device_id = gateway.id if gateway else device.via_device_id
+        if (device.name, device.model, device.via_device_id) != (name, model, via_device_id):
+            dev_reg.async_update_device(
+                device.id, name=name, model=model, via_device_id=via_device_id
+            )
+            updated += 1
+    _LOGGER.debug(
+        "Unit devices: %d created, %d updated, %d reused",
+        created, updated, len(units) - created - updated
     )
+
+@callback
+def _async_remove_units(hass, config_entry, units):
+    """Drop entities and devices of indoor units that disappeared from the adapter."""
+    ent_reg = er.async_get(hass)
+    dev_reg = dr.async_get(hass)
+    entry_id = config_entry.entry_id
+    for system, index in units:
+        entity_id = ent_reg.async_get_entity_id(
+            "climate", const.DOMAIN, f"{entry_id}_{system}-{index}"
+        )
+        if entity_id:
+            ent_reg.async_remove(entity_id)
+        device = dev_reg.async_get_device(
+            identifiers={(const.DOMAIN, f"{entry_id}_idu_{system}-{index}")}
+        )
+        if device:
+            dev_reg.async_remove_device(device.id)
+        _LOGGER.info("Removed indoor unit %s-%s", system, index)
+
+# Features and modes shared by unit and zone entities
+SUPPORTED_FEATURES = (
+    ClimateEntityFeature.TARGET_TEMPERATURE |
+    ClimateEntityFeature.FAN_MODE |
+    ClimateEntityFeature.SWING_MODE
+)
+FAN_MODES = ["auto", "low", "medium", "high"]
+SWING_MODES = ["off", "on"]
+HVAC_MODES = [
+    HVACMode.OFF,
+    HVACMode.COOL,
+    HVACMode.DRY,
+    HVACMode.FAN_ONLY,
+    HVACMode.HEAT
+]
+
+class EgiVrfClimate(CoordinatorEntity, ClimateEntity):
+    _attr_supported_features = SUPPORTED_FEATURES
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
-    _attr_fan_modes = ["auto", "low", "medium", "high"]
-    _attr_swing_modes = ["off", "on"]
-    _attr_hvac_modes = [
-        HVACMode.OFF,
-        HVACMode.COOL,
-        HVACMode.DRY,
-        HVACMode.FAN_ONLY,
-        HVACMode.HEAT
-    ]
+    # Static per-unit attributes; also found on the device (model and name)
+    _unrecorded_attributes = frozenset({"brand_code", "brand_name", "system", "idu_index"})
+    _attr_fan_modes = FAN_MODES
+    _attr_swing_modes = SWING_MODES
+    _attr_hvac_modes = HVAC_MODES
 
     def __init__(self, coordinator, adapter, config_entry, system, index):
         super().__init__(coordinator)
@@ -57,72 +211,126 @@ class EgiVrfClimate(CoordinatorEntity, ClimateEntity):
         self._client = coordinator._client
         self._system = system
         self._index = index
+        # Last rendered snapshot generation of this unit and the brand it was rendered with
+        self._generation = -1
+        self._brand_code = None
+        self._record = UNAVAILABLE
+        # Record of the last state write, and whether a write waits for budget
+        self._written = None
+        self._deferred = False
         entry_id = config_entry.entry_id
         self._attr_unique_id = f"{entry_id}_{system}-{index}"
         self._attr_name = f"Indoor Unit {system}-{index}"
-        brand_name = adapter.get_brand_name(coordinator.gateway_brand_code)
+        # The device itself (name, model, via gateway) is registered in bulk
+        # by _async_register_unit_devices(); the entity only links to it
         self._attr_device_info = {
             "identifiers": {(const.DOMAIN, f"{entry_id}_idu_{system}-{index}")},
-            "name": self._attr_name,
-            "manufacturer": "EGI",
-            "model": f"{brand_name} Indoor Unit",
-            "via_device": (const.DOMAIN, f"gateway_{entry_id}")
         }
 
-    async def _refresh_idu_immediately(self):
-        try:
-            data = await self.hass.async_add_executor_job(
-                self.adapter.read_status,
-                self._client,
-                self._system,
-                self._index,
+    async def _async_command(self, changes):
+        """
+        Write the {field: value} changes of one command in order. With FC23
+        the last write reads the unit back in the same transaction and
+        confirms the command at once; otherwise the commanded values show
+        right away and the coordinator confirms or rolls them back with its
+        next read of this unit.
+        """
+        status = None
+        for name, value in changes.items():
+            ok, status = await self.coordinator.async_command_call(
+                self.adapter.write_and_read, self._client, self._system, self._index, name, value
             )
-            self.coordinator.data[self._dev_key] = data
-            _LOGGER.debug("Refreshed IDU %s status: %s", self._dev_key, data)
-            self.async_write_ha_state()
-        except Exception as e:
-            _LOGGER.error("Immediate IDU refresh failed (%s): %s", self._dev_key, e)
+            if not ok:
+                _LOGGER.warning("IDU %s: writing %s=%s failed", self._dev_key, name, value)
+                # Earlier writes may have gone through: just read the unit back
+                self.coordinator.async_apply_optimistic(self._dev_key, {})
+                return
+        if status is not None:
+            self.coordinator.async_confirm_command(self._dev_key, changes, status)
+        else:
+            self.coordinator.async_apply_optimistic(self._dev_key, changes)
+
+    @property
+    def _status(self):
+        """This unit's record from one consistent snapshot generation."""
+        snapshot = self.coordinator.data
+        generation = snapshot.generation_of(self._dev_key)
+        if generation != self._generation:
+            self._generation = generation
+            self._record = snapshot.get(self._dev_key, UNAVAILABLE)
+        return self._record
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """
+        Only write state for visible changes. Current temperature changes
+        below the entry's threshold are skipped, and writes for temperature
+        changes alone are limited by the coordinator's per-cycle budget.
+        """
+        coordinator = self.coordinator
+        generation = coordinator.data.generation_of(self._dev_key)
+        brand_code = coordinator.gateway_brand_code
+        if generation == self._generation and brand_code == self._brand_code and not self._deferred:
+            return
+        record = self._status
+        written = self._written
+        if (
+            written is not None and brand_code == self._brand_code
+            and all(record.get(name) == written.get(name) for name in RENDERED_FIELDS)
+        ):
+            temp, last = record.get("current_temp"), written.get("current_temp")
+            if temp == last or (
+                temp is not None and last is not None
+                and abs(temp - last) < coordinator.temp_threshold
+            ):
+                if self._deferred:
+                    self._deferred = False
+                    coordinator.async_cancel_write(self._dev_key)
+                return
+            if not coordinator.async_claim_write(self._dev_key):
+                self._deferred = True
+                return
+        self._deferred = False
+        self._brand_code = brand_code
+        self._written = record
+        self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        self.coordinator.async_cancel_write(self._dev_key)
+        await super().async_will_remove_from_hass()
 
     @property
     def available(self):
-        data = self.coordinator.data.get(self._dev_key)
-        return data.get("available", False) if data else False
+        return self._status.get("available", False)
 
     @property
     def current_temperature(self):
-        return self.coordinator.data.get(self._dev_key, {}).get("current_temp")
+        return self._status.get("current_temp")
 
     @property
     def target_temperature(self):
-        return self.coordinator.data.get(self._dev_key, {}).get("target_temp")
+        return self._status.get("target_temp")
 
     @property
     def fan_mode(self):
-        code = self.coordinator.data.get(self._dev_key, {}).get("fan_code", 0)
+        code = self._status.get("fan_code", 0)
         return self.adapter.decode_fan(code)
 
     @property
     def swing_mode(self):
-        code = self.coordinator.data.get(self._dev_key, {}).get("wind_code", const.SWING_OFF)
+        code = self._status.get("wind_code", const.SWING_OFF)
         return "on" if code == const.SWING_ON else "off"
 
     @property
     def hvac_mode(self):
-        data = self.coordinator.data.get(self._dev_key, {})
+        data = self._status
         if not data.get("power", False):
             return HVACMode.OFF
         return self.adapter.decode_mode(data.get("mode_code", 0))
 
     @property
     def hvac_action(self):
-        mode = self.hvac_mode
-        return {
-            HVACMode.OFF: HVACAction.OFF,
-            HVACMode.COOL: HVACAction.COOLING,
-            HVACMode.HEAT: HVACAction.HEATING,
-            HVACMode.DRY: HVACAction.DRYING,
-            HVACMode.FAN_ONLY: HVACAction.FAN
-        }.get(mode, HVACAction.IDLE)
+        return HVAC_ACTIONS.get(self.hvac_mode, HVACAction.IDLE)
 
     @property
     def min_temp(self):
@@ -134,11 +342,16 @@ class EgiVrfClimate(CoordinatorEntity, ClimateEntity):
 
     @property
     def extra_state_attributes(self):
-        data = self.coordinator.data.get(self._dev_key, {})
+        if self.coordinator.slim_attributes:
+            return {
+                "error_code": self._status.get("error_code"),
+                "stale": bool(self._status.get("stale")),
+            }
         return {
             "brand_code": self.coordinator.gateway_brand_code,
             "brand_name": self.coordinator.gateway_brand_name,
-            "error_code": data.get("error_code"),
+            "error_code": self._status.get("error_code"),
+            "stale": bool(self._status.get("stale")),
             "system": self._system,
             "idu_index": self._index
         }
@@ -147,56 +360,165 @@ class EgiVrfClimate(CoordinatorEntity, ClimateEntity):
         temp = kwargs.get(ATTR_TEMPERATURE)
         if temp is None:
             return
-        await self.hass.async_add_executor_job(
-            self.adapter.write_temperature,
-            self._client,
-            self._system,
-            self._index,
-            int(temp),
-        )
-        await self._refresh_idu_immediately()
+        await self._async_command({"target_temp": int(temp)})
 
     async def async_set_fan_mode(self, fan_mode):
-        code = self.adapter.encode_fan(fan_mode)
-        await self.hass.async_add_executor_job(
-            self.adapter.write_fan_speed,
-            self._client,
-            self._system,
-            self._index,
-            code,
-        )
-        await self._refresh_idu_immediately()
+        await self._async_command({"fan_code": self.adapter.encode_fan(fan_mode)})
 
     async def async_set_swing_mode(self, swing_mode: str):
         wind_code = const.SWING_MODE_HA_TO_MODBUS.get(swing_mode, const.SWING_OFF)
-        await self.hass.async_add_executor_job(
-            self.adapter.write_swing,
-            self._client,
-            self._system,
-            self._index,
-            wind_code,
-        )
-        await self._refresh_idu_immediately()
+        await self._async_command({"wind_code": wind_code})
 
     async def async_set_hvac_mode(self, hvac_mode):
-        power_on = hvac_mode != HVACMode.OFF
-        mode_code = self.adapter.encode_mode(hvac_mode)
-
-        await self.hass.async_add_executor_job(
-            self.adapter.write_power,
-            self._client,
-            self._system,
-            self._index,
-            power_on,
-        )
+        if hvac_mode == HVACMode.OFF:
+            await self._async_command({"power": False})
+            return
+        await self._async_command({"power": True, "mode_code": self.adapter.encode_mode(hvac_mode)})
 
-        if power_on:
-            await self.hass.async_add_executor_job(
-                self.adapter.write_mode,
-                self._client,
-                self._system,
-                self._index,
-                mode_code,
-            )
+class EgiZoneClimate(CoordinatorEntity, ClimateEntity):
+    """
+    A zone: several indoor units of this adapter controlled as one climate
+    entity. State is aggregated from the coordinator snapshot (majority mode
+    and fan of the running units, mean temperatures); commands go to all
+    available units as bulk writes, see coordinator.async_zone_command().
+    """
+
+    _attr_supported_features = SUPPORTED_FEATURES
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    _unrecorded_attributes = frozenset({"units"})
+    _attr_fan_modes = FAN_MODES
+    _attr_swing_modes = SWING_MODES
+    _attr_hvac_modes = HVAC_MODES
+
+    def __init__(self, coordinator, adapter, config_entry, name, units):
+        super().__init__(coordinator)
+        self.adapter = adapter
+        self._keys = [f"{system}-{index}" for system, index in units]
+        # Snapshot generations of the member units at the last state write
+        self._generations = None
+        entry_id = config_entry.entry_id
+        self._attr_unique_id = f"{entry_id}_zone_{slugify(name)}"
+        self._attr_name = name
+        self._attr_device_info = {
+            "identifiers": {(const.DOMAIN, f"gateway_{entry_id}")},
+        }
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.coordinator.set_zone_members(self._attr_unique_id, self._keys)
+
+    async def async_will_remove_from_hass(self) -> None:
+        self.coordinator.set_zone_members(self._attr_unique_id, None)
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write state when a member unit got a new record."""
+        snapshot = self.coordinator.data
+        generations = tuple(snapshot.generation_of(key) for key in self._keys)
+        if generations == self._generations:
+            return
+        self._generations = generations
+        self.async_write_ha_state()
+
+    @property
+    def _records(self):
+        """Records of the available member units."""
+        snapshot = self.coordinator.data
+        records = (snapshot.get(key, UNAVAILABLE) for key in self._keys)
+        return [record for record in records if record.get("available")]
+
+    @property
+    def _running(self):
+        """Records of the powered units, or of all available units if none runs."""
+        records = self._records
+        return [record for record in records if record.get("power")] or records
 
-        await self._refresh_idu_immediately()
+    @staticmethod
+    def _majority(records, name):
+        values = Counter(record.get(name) for record in records if record.get(name) is not None)
+        return values.most_common(1)[0][0] if values else None
+
+    @staticmethod
+    def _mean(records, name):
+        values = [record.get(name) for record in records if record.get(name) is not None]
+        return sum(values) / len(values) if values else None
+
+    async def _async_command(self, changes):
+        written = await self.coordinator.async_zone_command(self._keys, changes)
+        skipped = len(self._keys) - len(written)
+        if skipped:
+            _LOGGER.warning("Zone %s: %s not written to %d of %d units",
+                            self.name, changes, skipped, len(self._keys))
+
+    @property
+    def available(self):
+        return bool(self._records)
+
+    @property
+    def current_temperature(self):
+        temp = self._mean(self._records, "current_temp")
+        return round(temp, 1) if temp is not None else None
+
+    @property
+    def target_temperature(self):
+        temp = self._mean(self._running, "target_temp")
+        return round(temp * 2) / 2 if temp is not None else None
+
+    @property
+    def fan_mode(self):
+        return self.adapter.decode_fan(self._majority(self._running, "fan_code") or 0)
+
+    @property
+    def swing_mode(self):
+        code = self._majority(self._running, "wind_code")
+        return "on" if code == const.SWING_ON else "off"
+
+    @property
+    def hvac_mode(self):
+        running = [record for record in self._records if record.get("power")]
+        if not running:
+            return HVACMode.OFF
+        return self.adapter.decode_mode(self._majority(running, "mode_code") or 0)
+
+    @property
+    def hvac_action(self):
+        return HVAC_ACTIONS.get(self.hvac_mode, HVACAction.IDLE)
+
+    @property
+    def min_temp(self):
+        return 16
+
+    @property
+    def max_temp(self):
+        return 30
+
+    @property
+    def extra_state_attributes(self):
+        snapshot = self.coordinator.data
+        records = {key: snapshot.get(key, UNAVAILABLE) for key in self._keys}
+        return {
+            "units": self._keys,
+            "units_on": sum(1 for record in records.values() if record.get("power")),
+            "units_unavailable": [key for key, record in records.items() if not record.get("available")],
+            "errors": {key: record.get("error_code") for key, record in records.items() if record.get("error_code")},
+        }
+
+    async def async_set_temperature(self, **kwargs):
+        temp = kwargs.get(ATTR_TEMPERATURE)
+        if temp is None:
+            return
+        await self._async_command({"target_temp": int(temp)})
+
+    async def async_set_fan_mode(self, fan_mode):
+        await self._async_command({"fan_code": self.adapter.encode_fan(fan_mode)})
+
+    async def async_set_swing_mode(self, swing_mode: str):
+        wind_code = const.SWING_MODE_HA_TO_MODBUS.get(swing_mode, const.SWING_OFF)
+        await self._async_command({"wind_code": wind_code})
+
+    async def async_set_hvac_mode(self, hvac_mode):
+        if hvac_mode == HVACMode.OFF:
+            await self._async_command({"power": False})
+            return
+        await self._async_command({"power": True, "mode_code": self.adapter.encode_mode(hvac_mode)})
@@ -5,6 +5,7 @@ from homeassistant.core import callback
 
 from . import const
 from .adapters import get_adapter
+from .discovery import async_autodetect_serial
 from .modbus_client import get_shared_client
 from .options_flow import EgiVrfOptionsFlowHandler
 
@@ -18,6 +19,9 @@ class EgiVrfConfigFlow(config_entries.ConfigFlow, domain=const.DOMAIN):
     def __init__(self):
         self._connection_type = None
         self._adapter_type = None
+        self._discovered = None
+        self._detected = None
+        self._detected_rtt = None
 
     async def async_step_user(self, user_input=None):
         """Initial config step: choose adapter or monitor mode."""
@@ -45,6 +49,9 @@ class EgiVrfConfigFlow(config_entries.ConfigFlow, domain=const.DOMAIN):
         """Handle serial connection setup."""
         errors = {}
         if user_input is not None:
+            user_input = dict(user_input)
+            if user_input.pop("auto_detect", False):
+                return await self._async_autodetect_serial(user_input)
             full_input = {
                 "connection_type": "serial",
                 "adapter_type": self._adapter_type,
@@ -52,7 +59,7 @@ class EgiVrfConfigFlow(config_entries.ConfigFlow, domain=const.DOMAIN):
             }
             error = await self._async_test_connection(full_input)
             if error is None:
-                adapter = get_adapter(self._adapter_type)
+                adapter = await self._async_get_adapter(self._adapter_type)
                 port = full_input["port"]
                 return self.async_create_entry(
                     title=f"{adapter.name} (Serial {port})",
@@ -60,15 +67,80 @@ class EgiVrfConfigFlow(config_entries.ConfigFlow, domain=const.DOMAIN):
                 )
             errors["base"] = error
 
-        schema = vol.Schema({
-            vol.Required("port", default=const.DEFAULT_PORT): str,
-            vol.Optional("baudrate", default=const.DEFAULT_BAUDRATE): int,
-            vol.Optional("parity", default=const.DEFAULT_PARITY): vol.In(["N", "E", "O"]),
-            vol.Optional("stopbits", default=const.DEFAULT_STOPBITS): vol.In([1, 2]),
-            vol.Optional("bytesize", default=const.DEFAULT_BYTESIZE): vol.In([7, 8]),
-            vol.Optional("slave_id", default=const.DEFAULT_SLAVE_ID): int,
+        return self.async_show_form(
+            step_id="serial", data_schema=self._serial_schema(), errors=errors
+        )
+
+    @staticmethod
+    def _serial_schema(defaults=None):
+        defaults = defaults or {}
+        return vol.Schema({
+            vol.Required("port", default=defaults.get("port", const.DEFAULT_PORT)): str,
+            vol.Optional("baudrate", default=defaults.get("baudrate", const.DEFAULT_BAUDRATE)): int,
+            vol.Optional("parity", default=defaults.get("parity", const.DEFAULT_PARITY)): vol.In(["N", "E", "O"]),
+            vol.Optional("stopbits", default=defaults.get("stopbits", const.DEFAULT_STOPBITS)): vol.In([1, 2]),
+            vol.Optional("bytesize", default=defaults.get("bytesize", const.DEFAULT_BYTESIZE)): vol.In([7, 8]),
+            vol.Optional("slave_id", default=defaults.get("slave_id", const.DEFAULT_SLAVE_ID)): int,
+            vol.Optional("auto_detect", default=False): bool,
         })
-        return self.async_show_form(step_id="serial", data_schema=schema, errors=errors)
+
+    async def _async_autodetect_serial(self, user_input):
+        """Sweep line settings on the given port and offer the first confirmed match."""
+        slave_id = user_input.get("slave_id", const.DEFAULT_SLAVE_ID)
+        detected = await async_autodetect_serial(
+            self.hass, user_input["port"], slave_id,
+            user_input.get("bytesize", const.DEFAULT_BYTESIZE)
+        )
+        if detected is None:
+            return self.async_show_form(
+                step_id="serial",
+                data_schema=self._serial_schema(user_input),
+                errors={"base": "autodetect_failed"},
+            )
+        if detected["adapter_type"] != self._adapter_type:
+            _LOGGER.info(
+                "Auto-detect found a %s adapter (selected: %s)",
+                detected["adapter_type"], self._adapter_type
+            )
+        self._detected = {
+            "connection_type": "serial",
+            "adapter_type": detected["adapter_type"],
+            "slave_id": slave_id,
+            **{key: detected[key] for key in ("port", "baudrate", "parity", "stopbits", "bytesize")},
+        }
+        self._detected_rtt = detected["rtt"]
+        return await self.async_step_serial_detected()
+
+    async def async_step_serial_detected(self, user_input=None):
+        """
+        Show the detected line settings, adapter type and measured RTT; the
+        user confirms with the adapter type they selected or the detected one.
+        """
+        detected_type = self._detected["adapter_type"]
+        selected_type = self._adapter_type or detected_type
+        if user_input is not None:
+            adapter_type = user_input.get("adapter_type", selected_type)
+            adapter = await self._async_get_adapter(adapter_type)
+            return self.async_create_entry(
+                title=f"{adapter.name} (Serial {self._detected['port']})",
+                data={**self._detected, "adapter_type": adapter_type},
+            )
+        adapter = await self._async_get_adapter(detected_type)
+        rtt = self._detected_rtt
+        return self.async_show_form(
+            step_id="serial_detected",
+            data_schema=vol.Schema({
+                vol.Required("adapter_type", default=selected_type): vol.In(["solo", "light", "pro"]),
+            }),
+            description_placeholders={
+                "adapter": adapter.name,
+                "detected_type": detected_type,
+                "selected_type": selected_type,
+                "baudrate": str(self._detected["baudrate"]),
+                "framing": f"{self._detected['bytesize']}{self._detected['parity']}{self._detected['stopbits']}",
+                "rtt_ms": f"{rtt * 1000:.1f}" if rtt is not None else "?",
+            },
+        )
 
     async def async_step_tcp(self, user_input=None):
         """Handle TCP connection setup."""
@@ -81,7 +153,7 @@ class EgiVrfConfigFlow(config_entries.ConfigFlow, domain=const.DOMAIN):
             }
             error = await self._async_test_connection(full_input)
             if error is None:
-                adapter = get_adapter(self._adapter_type)
+                adapter = await self._async_get_adapter(self._adapter_type)
                 host = full_input["host"]
                 port = full_input["port"]
                 return self.async_create_entry(
@@ -97,6 +169,39 @@ class EgiVrfConfigFlow(config_entries.ConfigFlow, domain=const.DOMAIN):
         })
         return self.async_show_form(step_id="tcp", data_schema=schema, errors=errors)
 
+    async def async_step_integration_discovery(self, discovery_info):
+        """Adapter found by the egi.discover_adapters service."""
+        self._discovered = dict(discovery_info)
+        self._adapter_type = self._discovered["adapter_type"]
+        self._connection_type = self._discovered["connection_type"]
+        where = (
+            self._discovered.get("port") if self._connection_type == "serial"
+            else f"{self._discovered.get('host')}:{self._discovered.get('port')}"
+        )
+        await self.async_set_unique_id(f"{where}/{self._discovered['slave_id']}")
+        self._abort_if_unique_id_configured()
+        adapter = await self._async_get_adapter(self._adapter_type)
+        self.context["title_placeholders"] = {
+            "name": f"{adapter.name} (ID {self._discovered['slave_id']} / {where})"
+        }
+        return await self.async_step_discovery_confirm()
+
+    async def async_step_discovery_confirm(self, user_input=None):
+        """Confirm adding a discovered adapter."""
+        if user_input is not None:
+            return self.async_create_entry(
+                title=self.context["title_placeholders"]["name"],
+                data=self._discovered,
+            )
+        return self.async_show_form(
+            step_id="discovery_confirm",
+            description_placeholders=self.context["title_placeholders"],
+        )
+
+    async def _async_get_adapter(self, adapter_type):
+        """Adapter modules are imported on first use, so load them off the event loop."""
+        return await self.hass.async_add_executor_job(get_adapter, adapter_type)
+
     async def _async_test_connection(self, config):
         def _try_connect():
             try:
@@ -9,6 +9,116 @@ DEFAULT_STOPBITS = 1
 DEFAULT_BYTESIZE = 8
 DEFAULT_SLAVE_ID = 1
 
+# Default polling/transport options
+DEFAULT_POLL_INTERVAL = 2
+DEFAULT_REQUEST_TIMEOUT = 3
+
+# Options applied to the running coordinator/transport without a reload;
+# any other option or connection data change reloads the entry
+LIVE_OPTIONS = {
+    "poll_interval",
+    "request_timeout",
+    "rescan_interval",
+    "remove_vanished_units",
+    "temp_threshold",
+    "slim_attributes",
+    "write_budget",
+    "unavailable_after",
+    "max_data_age",
+}
+
+# Recorder load: current temperature changes smaller than the threshold (°C)
+# do not write a state, and temperature-only state writes per poll cycle are
+# capped by the budget (0 = off for both)
+DEFAULT_TEMP_THRESHOLD = 0.0
+DEFAULT_WRITE_BUDGET = 0
+
+# Availability hysteresis: a unit whose read fails keeps its last-known
+# values (marked stale) until this many reads in a row failed or its data is
+# older than this many seconds (0 = off for both; off = unavailable at once)
+DEFAULT_UNAVAILABLE_AFTER = 0
+DEFAULT_MAX_DATA_AGE = 0
+
+# Indoor units whose climate entity is disabled are only polled every
+# N coordinator cycles, so their last-known state stays roughly current
+DISABLED_UNIT_HEARTBEAT_CYCLES = 30
+
+# Climate entities are added in batches of this size, yielding to the event
+# loop in between, so registering hundreds of units does not stall it
+ENTITY_ADD_BATCH = 32
+
+# Integration-wide poll scheduler (hass.data key) and the maximum number
+# of buses doing Modbus I/O at the same time
+SCHEDULER_KEY = f"{DOMAIN}_scheduler"
+MAX_CONCURRENT_BUS_IO = 4
+
+# Bus access priorities (lower wins): control commands jump ahead of polls,
+# scan steps only get the bus when nothing else is waiting for it
+BUS_PRIORITY_COMMAND = 0
+BUS_PRIORITY_POLL = 1
+BUS_PRIORITY_SCAN = 2
+
+# Solo adapters sharing a serial port are polled by one fleet coordinator
+# (hass.data key); adapter info is only re-read every N fleet cycles
+FLEET_KEY = f"{DOMAIN}_solo_fleets"
+SOLO_FLEET_INFO_EVERY = 30
+
+# Resync after an adapter reboot (restart, brand change, factory reset):
+# wait before the first probe, probe interval and give-up time (seconds)
+RESTART_SETTLE_SECONDS = 5
+RESTART_PROBE_INTERVAL = 2
+RESTART_MAX_SECONDS = 180
+
+# Commanded values show right away; the next poll or one batched read of all
+# recently commanded units this many seconds later confirms or rolls them back
+CONFIRM_DELAY = 1.0
+
+# Dispatcher signal sent with (added, removed) units after a rescan
+SIGNAL_UNITS_CHANGED = f"{DOMAIN}_units_changed_{{}}"
+
+# Rescans: rows retried per bus call when a scan block failed, default
+# background rescan cadence (minutes, 0 = off)
+SCAN_RETRY_ROWS = 8
+DEFAULT_RESCAN_INTERVAL = 0
+
+# Value of every entry option while it is not set; the options flow writes
+# all of them on save, so a missing option and its default are the same
+OPTION_DEFAULTS = {
+    "poll_interval": DEFAULT_POLL_INTERVAL,
+    "request_timeout": DEFAULT_REQUEST_TIMEOUT,
+    "fleet_mode": True,
+    "rescan_interval": DEFAULT_RESCAN_INTERVAL,
+    "remove_vanished_units": False,
+    "temp_threshold": DEFAULT_TEMP_THRESHOLD,
+    "slim_attributes": False,
+    "write_budget": DEFAULT_WRITE_BUDGET,
+    "unavailable_after": DEFAULT_UNAVAILABLE_AFTER,
+    "max_data_age": DEFAULT_MAX_DATA_AGE,
+    "zones": "",
+}
+
+# Discovery: probe timeouts (seconds), TCP hosts probed at once and the
+# event fired with partial results
+DISCOVERY_SERIAL_TIMEOUT = 0.3
+DISCOVERY_TCP_TIMEOUT = 0.5
+DISCOVERY_MAX_HOSTS = 16
+# Serial auto-detection: line settings in the order they are tried and the
+# number of reads used to measure the round-trip time of a confirmed match
+SERIAL_BAUDRATES = (9600, 19200, 38400, 115200, 57600, 4800, 2400)
+SERIAL_FRAMINGS = (("E", 1), ("N", 1), ("N", 2), ("O", 1))
+SERIAL_RTT_SAMPLES = 3
+# Subnet sweeps: TCP connect probes in flight and their timeout (seconds)
+DISCOVERY_CONNECT_LIMIT = 256
+DISCOVERY_CONNECT_TIMEOUT = 0.5
+# Largest range a subnet sweep accepts (a /20 for IPv4)
+DISCOVERY_MAX_SUBNET_ADDRESSES = 4096
+EVENT_DISCOVERY_PROGRESS = f"{DOMAIN}_discovery_progress"
+
+# Per-entry cache of scan results and last-known unit state (warm start)
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.entry_cache.{{}}"
+CACHE_SAVE_DELAY = 60
+
 # Modbus function codes (for reference)
 FUNC_READ_HOLDING = 0x03
 FUNC_WRITE_SINGLE = 0x06
@@ -1,15 +1,126 @@
 """
 Coordinator for polling the EGI adapters.
 """
+import asyncio
+import json
 import logging
 import time
+from datetime import timedelta
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from . import const
+from .explorer import RegisterExplorer
+from .state import UNAVAILABLE, IduState, StatusSnapshot
+
 _LOGGER = logging.getLogger(__name__)
 
-class EgiAdapterCoordinator(DataUpdateCoordinator):
+# Phase-grid polling replaces the DataUpdateCoordinator timer through these
+# internals, which have changed between Home Assistant releases. Without them
+# the coordinators fall back to HA's own timer (polls are not staggered).
+_TIMER_INTERNALS = ("_schedule_refresh", "_async_unsub_refresh", "_handle_refresh_interval")
+_HAS_TIMER_INTERNALS = all(hasattr(DataUpdateCoordinator, name) for name in _TIMER_INTERNALS)
+
+def _write_json(path, data):
+    """Write a register map file (executor)."""
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(data, handle)
+
+class EgiScheduledCoordinator(DataUpdateCoordinator):
+    """
+    DataUpdateCoordinator whose timer and bus access are driven by the
+    integration-wide EgiPollScheduler.
+    """
+    def __init__(self, hass, name, update_interval, scheduler=None, bus_key=None):
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=name,
+            update_interval=update_interval
+        )
+        self._scheduler = scheduler
+        # Key of the shared bus (serial port or host) this coordinator polls
+        self._bus_key = bus_key
+        self._phase_timer = _HAS_TIMER_INTERNALS and hasattr(self, "_unsub_refresh")
+        if scheduler is not None and not self._phase_timer:
+            _LOGGER.warning("%s: coordinator timer internals not found, polls are not staggered", name)
+
+    @property
+    def bus_key(self):
+        return self._bus_key
+
+    @property
+    def poll_load(self):
+        """Fraction of the poll interval spent on the bus during the last cycle."""
+        if self._scheduler is None:
+            return None
+        return self._scheduler.load_of(self)
+
+    @property
+    def poll_interval_seconds(self):
+        interval = self.update_interval
+        return interval.total_seconds() if interval else None
+
+    def scheduling_stats(self):
+        """Scheduler figures (phase, bus load) for diagnostics sensors."""
+        if self._scheduler is None:
+            return {}
+        return self._scheduler.stats(self)
+
+    async def async_bus_call(self, func, *args, priority=const.BUS_PRIORITY_POLL):
+        """
+        Run a blocking adapter/client call in the executor while holding this
+        bus and one of the scheduler's global I/O slots.
+        """
+        if self._scheduler is None:
+            return await self.hass.async_add_executor_job(func, *args)
+        async with self._scheduler.bus_slot(self, self.bus_key, priority):
+            return await self.hass.async_add_executor_job(func, *args)
+
+    async def async_command_call(self, func, *args):
+        """async_bus_call() for control traffic, which goes ahead of polls and scans."""
+        return await self.async_bus_call(func, *args, priority=const.BUS_PRIORITY_COMMAND)
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next poll on the phase grid assigned by the scheduler."""
+        if self._scheduler is None or self.update_interval is None or not self._phase_timer:
+            super()._schedule_refresh()
+            return
+        if self.config_entry and self.config_entry.pref_disable_polling:
+            return
+        self._async_unsub_refresh()
+        loop = self.hass.loop
+        next_refresh = self._scheduler.next_fire_time(self, loop.time())
+        self._unsub_refresh = loop.call_at(
+            next_refresh, self._async_handle_scheduled_refresh
+        ).cancel
+
+    @callback
+    def async_reschedule(self) -> None:
+        """Re-plan a pending poll after an interval change (no-op if none is pending)."""
+        if getattr(self, "_unsub_refresh", None) is not None:
+            self._schedule_refresh()
+
+    @callback
+    def _async_handle_scheduled_refresh(self) -> None:
+        self.hass.async_create_background_task(
+            self._handle_refresh_interval(None),
+            name=f"{self.name} scheduled refresh",
+        )
+
+    def _report_cycle(self):
+        if self._scheduler is not None:
+            self._scheduler.report_cycle(self)
+
+
+class EgiAdapterCoordinator(EgiScheduledCoordinator):
     """
     Coordinates data updates for EGI adapters using Modbus.
+    When fleet is given, polling is delegated to a shared fleet coordinator
+    and this coordinator only holds the entry's data for its entities.
     """
     def __init__(
         self,
@@ -17,65 +128,718 @@ class EgiAdapterCoordinator(DataUpdateCoordinator):
         modbus_client,
         adapter,
         indoor_units,
-        update_interval
+        update_interval,
+        scheduler=None,
+        fleet=None
     ):
         super().__init__(
             hass,
-            _LOGGER,
             name="egi_coordinator",
-            update_interval=update_interval
+            update_interval=None if fleet else update_interval,
+            scheduler=scheduler,
+            bus_key=getattr(modbus_client, "bus_key", None)
         )
         self._client = modbus_client
         self._adapter = adapter
+        self.fleet = fleet
+        # Whole-table decoder for adapters that support block polling
+        self._decoder = adapter.create_table_decoder() if adapter.supports_block_read else None
+        # Block reader of those adapters; remembers unreadable rows between polls
+        self._reader = adapter.create_table_reader() if adapter.supports_block_read else None
         self.devices = indoor_units
         # Initialize data: each key maps to initial availability
-        self.data = {f"{sys}-{idx}": {"available": False} for sys, idx in indoor_units}
+        self.data = StatusSnapshot(dict.fromkeys(self._unit_keys, UNAVAILABLE))
+        # Monotonic time of the last targeted refresh per unit
+        self._published_at = {}
+        # Availability hysteresis (see apply_options): consecutive failed reads
+        # and monotonic time of the last good read per unit
+        self._unavailable_after = const.DEFAULT_UNAVAILABLE_AFTER
+        self._max_data_age = const.DEFAULT_MAX_DATA_AGE
+        self._failures = {}
+        self._last_good = {}
+        # State write filtering for climate entities (see apply_options)
+        self.temp_threshold = const.DEFAULT_TEMP_THRESHOLD
+        self.slim_attributes = False
+        self._write_budget = const.DEFAULT_WRITE_BUDGET
+        self._writes_left = 0
+        # Units whose temperature write was deferred; served before new ones
+        self._deferred_writes = set()
+        # Optimistic command results awaiting confirmation: key -> (changes, commanded at)
+        self._unconfirmed = {}
+        self._unsub_confirm = None
 
         self.gateway_brand_code = 0
         self.gateway_brand_name = "Unknown"
         self.adapter_info = {}
         self.last_update_duration = None
 
-    async def _async_update_data(self):
+        # Keys ("sys-idx") of units whose entities are disabled in the registry
+        self.disabled_units = set()
+        # Keys of units in enabled zone entities, by zone; these are polled
+        # regularly even if their own entities are disabled
+        self._zone_members = {}
+        self.zone_units = set()
+        # Keys of units a rescan no longer found; held unavailable, not polled
+        self.vanished_units = set()
+        self.remove_vanished_units = False
+        self._rescan_interval = None
+        self._unsub_rescan = None
+        self._rescan_task = None
+        self._explore_task = None
+        # Fraction of the running scan done (None when no scan runs)
+        self.scan_progress = None
+        self.last_scan_duration = None
+        self._cycle = 0
+
+        # Set while the adapter reboots; normal polling is paused meanwhile
+        self.restarting = False
+        self.last_restart_outage = None
+        self._resync_task = None
+
+        # Setup timing; warm_start is set when entities start from cached state
+        self.warm_start = False
+        self.setup_duration = None
+        self.ready_duration = None
+        self.cold_setup_duration = None
+        # Time spent registering the devices and entities of all units
+        self.registration_duration = None
+        self._warm_start_task = None
+
+    @property
+    def devices(self):
+        return self._devices
+
+    @devices.setter
+    def devices(self, units):
+        """Set the unit list and precompute the "sys-idx" key of every unit once."""
+        self._devices = list(units)
+        self._unit_keys = {f"{sys}-{idx}": (sys, idx) for sys, idx in self._devices}
+
+    def set_unit_enabled(self, key, enabled):
         """
-        Fetch updated data from the adapter, including adapter info and unit statuses.
+        Include or exclude a unit from the regular read plan.
+        Disabled units are still read on a rare heartbeat.
         """
-        start_time = time.perf_counter()
+        if enabled:
+            if key in self.disabled_units:
+                self.disabled_units.discard(key)
+                _LOGGER.info("Unit %s enabled, resuming regular polling", key)
+        elif key not in self.disabled_units:
+            self.disabled_units.add(key)
+            _LOGGER.info("Unit %s disabled, polling on heartbeat only", key)
 
-        # Ensure underlying client is connected
-        await self.hass.async_add_executor_job(self._client.connect)
+    def set_zone_members(self, zone, keys):
+        """Track the units of an enabled zone entity (keys=None drops the zone)."""
+        if keys:
+            self._zone_members[zone] = set(keys)
+        else:
+            self._zone_members.pop(zone, None)
+        self.zone_units = set().union(*self._zone_members.values())
 
-        # 1) Read adapter-level info
+    def on_heartbeat(self, key):
+        """True if a unit is only read on heartbeat cycles (disabled, in no zone)."""
+        return key in self.disabled_units and key not in self.zone_units
+
+    @property
+    def unit_id(self):
+        return getattr(self._client, "unit_id", None)
+
+    @property
+    def poll_load(self):
+        if self.fleet is not None:
+            return self.fleet.poll_load
+        return super().poll_load
+
+    @property
+    def poll_interval_seconds(self):
+        if self.fleet is not None:
+            return self.fleet.poll_interval_seconds
+        return super().poll_interval_seconds
+
+    def scheduling_stats(self):
+        if self.fleet is not None:
+            return {**self.fleet.scheduling_stats(), "fleet_members": len(self.fleet.members)}
+        stats = super().scheduling_stats()
+        if self._reader is not None:
+            stats = {**stats, "unreadable_rows": sorted(self._reader.holes)}
+        return stats
+
+    def apply_options(self, options):
+        """Apply live-tunable entry options (see const.LIVE_OPTIONS) in place."""
+        interval = timedelta(
+            seconds=options.get("poll_interval", const.DEFAULT_POLL_INTERVAL)
+        )
+        if self.fleet is not None:
+            self.fleet.set_member_interval(self, interval)
+        elif interval != self.update_interval:
+            self.update_interval = interval
+            if self._scheduler is not None:
+                self._scheduler.restagger()
+            self.async_reschedule()
+            _LOGGER.info("Poll interval changed to %s s", interval.total_seconds())
+
+        timeout = options.get("request_timeout")
+        if timeout is not None and hasattr(self._client, "set_timeout"):
+            self._client.set_timeout(timeout)
+
+        self.remove_vanished_units = options.get("remove_vanished_units", False)
+        self.temp_threshold = options.get("temp_threshold", const.DEFAULT_TEMP_THRESHOLD)
+        self.slim_attributes = options.get("slim_attributes", False)
+        self._write_budget = options.get("write_budget", const.DEFAULT_WRITE_BUDGET)
+        self._unavailable_after = options.get("unavailable_after", const.DEFAULT_UNAVAILABLE_AFTER)
+        self._max_data_age = options.get("max_data_age", const.DEFAULT_MAX_DATA_AGE)
+        self._set_rescan_interval(options.get("rescan_interval", const.DEFAULT_RESCAN_INTERVAL))
+
+    def _set_rescan_interval(self, minutes):
+        """(Re)arm the periodic background rescan; 0 disables it."""
+        if minutes == self._rescan_interval:
+            return
+        self._rescan_interval = minutes
+        if self._unsub_rescan is not None:
+            self._unsub_rescan()
+            self._unsub_rescan = None
+        if minutes:
+            self._unsub_rescan = async_track_time_interval(
+                self.hass, self._async_periodic_rescan, timedelta(minutes=minutes)
+            )
+            _LOGGER.info("Background rescan every %s min", minutes)
+
+    @callback
+    def _async_periodic_rescan(self, now):
+        if not self.restarting:
+            self.async_start_rescan()
+
+    def apply_adapter_info(self, info):
+        """Store adapter-level info and track gateway brand changes."""
+        if not isinstance(info, dict):
+            _LOGGER.warning("Adapter returned non-dict info: %s", info)
+            return
+        self.adapter_info = info
+        new_code = info.get("brand_code", 0)
+        if new_code != self.gateway_brand_code:
+            self.gateway_brand_code = new_code
+            self.gateway_brand_name = self._adapter.get_brand_name(new_code)
+            _LOGGER.info(
+                "Detected adapter: brand_code=0x%02X name=%s",
+                self.gateway_brand_code, self.gateway_brand_name
+            )
+
+    def clear_adapter_info(self):
+        self.gateway_brand_code = 0
+        self.gateway_brand_name = "Unknown"
+        self.adapter_info = {}
+
+    def read_unit(self, system, index, read_info=False):
+        """
+        Read one unit's status, and the adapter info first when read_info is
+        set; returns (info or None, IduState). Blocking, runs in the executor
+        while the caller holds the bus (used by the Solo fleet).
+        """
+        info = None
+        if read_info:
+            try:
+                info = self._adapter.read_adapter_info(self._client)
+            except Exception as err:
+                _LOGGER.warning("Slave %s adapter info failed: %s", self.unit_id, err)
         try:
-            info = await self.hass.async_add_executor_job(
-                self._adapter.read_adapter_info,
-                self._client
+            status = self._adapter.read_status(self._client, system, index)
+        except Exception as err:
+            _LOGGER.error("Error polling slave %s: %s", self.unit_id, err)
+            status = UNAVAILABLE
+        return info, status
+
+    @property
+    def units_changed_signal(self):
+        entry_id = self.config_entry.entry_id if self.config_entry else id(self)
+        return const.SIGNAL_UNITS_CHANGED.format(entry_id)
+
+    @callback
+    def async_apply_scan(self, units):
+        """
+        Replace the unit list with a fresh scan result and tell the platforms
+        which units were added or removed.
+        """
+        old = self._unit_keys
+        self.devices = units
+        new = self._unit_keys
+        added = [unit for key, unit in new.items() if key not in old]
+        removed = [unit for key, unit in old.items() if key not in new]
+        if not added and not removed:
+            return added, removed
+        removed_keys = [f"{sys}-{idx}" for sys, idx in removed]
+        self.disabled_units.difference_update(removed_keys)
+        self.vanished_units.difference_update(removed_keys)
+        self.data = self.data.evolve(
+            {f"{sys}-{idx}": UNAVAILABLE for sys, idx in added},
+            removed=removed_keys,
+        )
+        _LOGGER.info("Rescan: %d units added %s, %d removed %s",
+                     len(added), added, len(removed), removed)
+        async_dispatcher_send(self.hass, self.units_changed_signal, added, removed)
+        return added, removed
+
+    async def async_scan_units(self):
+        """
+        Scan for indoor units one block read per bus call at scan priority, so
+        pending commands and polls get the bus between the steps. Cancelling
+        the calling task stops the scan after the current step.
+        """
+        scan = self._adapter.create_scan()
+        if scan is None:
+            return await self.async_bus_call(self._adapter.scan_devices, self._client)
+        priority = const.BUS_PRIORITY_SCAN
+        start = time.perf_counter()
+        self.scan_progress = 0.0
+        try:
+            while not scan.blocks_done:
+                await self.async_bus_call(scan.read_next_block, self._client, priority=priority)
+                self.scan_progress = scan.progress
+                _LOGGER.debug("Scan %.0f%% done", scan.progress * 100)
+            incomplete = scan.incomplete_slots()
+            for first in range(0, len(incomplete), const.SCAN_RETRY_ROWS):
+                await self.async_bus_call(
+                    scan.retry_rows, self._client,
+                    incomplete[first:first + const.SCAN_RETRY_ROWS], priority=priority
+                )
+        finally:
+            self.scan_progress = None
+        self.last_scan_duration = time.perf_counter() - start
+        return [self._adapter.unit_of(slot) for slot in scan.occupied_slots()]
+
+    @callback
+    def async_start_rescan(self):
+        """Start an incremental rescan in the background (or return the running one)."""
+        if self._rescan_task is None or self._rescan_task.done():
+            self._rescan_task = self.hass.async_create_background_task(
+                self._async_rescan(),
+                name=f"{self.name} rescan",
             )
-            if isinstance(info, dict):
-                self.adapter_info = info
-                new_code = info.get("brand_code", 0)
-                if new_code != self.gateway_brand_code:
-                    self.gateway_brand_code = new_code
-                    self.gateway_brand_name = self._adapter.get_brand_name(new_code)
-                    _LOGGER.info(
-                        "Detected adapter: brand_code=0x%02X name=%s",
-                        self.gateway_brand_code, self.gateway_brand_name
+        return self._rescan_task
+
+    async def async_rescan(self):
+        """Rescan and apply the result; returns (added, vanished) unit lists."""
+        task = self.async_start_rescan()
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if task.cancelled():
+                return [], []
+            raise
+
+    @callback
+    def async_cancel_rescan(self):
+        """Stop a running rescan after its current step; returns True if one was running."""
+        if self._rescan_task is None or self._rescan_task.done():
+            return False
+        self._rescan_task.cancel()
+        _LOGGER.info("Rescan cancelled at %.0f%%", (self.scan_progress or 0) * 100)
+        return True
+
+    @callback
+    def async_start_explore(self, start, count, path, max_block=None):
+        """
+        Sweep a register range in the background at scan priority and write
+        its map to path; returns None if a sweep is already running.
+        """
+        if self._explore_task is not None and not self._explore_task.done():
+            return None
+        self._explore_task = self.hass.async_create_background_task(
+            self._async_explore(start, count, path, max_block),
+            name=f"{self.name} register sweep",
+        )
+        return self._explore_task
+
+    @callback
+    def async_cancel_explore(self):
+        """Stop a running register sweep after its current read; returns True if one was running."""
+        if self._explore_task is None or self._explore_task.done():
+            return False
+        self._explore_task.cancel()
+        return True
+
+    async def _async_explore(self, start, count, path, max_block):
+        explorer = RegisterExplorer(start, count, max_block)
+        started = time.perf_counter()
+        _LOGGER.info("Sweeping registers %d-%d of %s", start, start + count - 1, self.bus_key)
+        try:
+            while not explorer.done:
+                await self.async_bus_call(
+                    explorer.read_next, self._client, priority=const.BUS_PRIORITY_SCAN
+                )
+        except asyncio.CancelledError:
+            _LOGGER.info("Register sweep cancelled at %.0f%%", explorer.progress * 100)
+            raise
+        result = explorer.as_dict()
+        result["duration"] = round(time.perf_counter() - started, 2)
+        await self.hass.async_add_executor_job(_write_json, path, result)
+        _LOGGER.info(
+            "Register sweep %d-%d done in %.1f s (%d reads): %d readable ranges, map written to %s",
+            start, start + count - 1, result["duration"], result["reads"],
+            len(result["readable"]), path
+        )
+
+    async def _async_rescan(self):
+        start = time.perf_counter()
+        try:
+            units = await self.async_scan_units()
+        except Exception as err:
+            _LOGGER.warning("Rescan failed: %s", err)
+            return [], []
+        if not units:
+            _LOGGER.warning("Rescan found no units, keeping the current unit list")
+            return [], []
+
+        found = set(units)
+        vanished = [unit for unit in self.devices if unit not in found]
+        revived = False
+        if not self.remove_vanished_units:
+            # Keep vanished units (and their entities) but hold them unavailable
+            vanished_keys = {f"{sys}-{idx}" for sys, idx in vanished}
+            revived = bool(self.vanished_units - vanished_keys)
+            self.vanished_units = vanished_keys
+            known = set(self.devices)
+            units = self.devices + [unit for unit in units if unit not in known]
+            if vanished_keys:
+                self.async_publish_units(dict.fromkeys(vanished_keys, UNAVAILABLE))
+        added, _ = self.async_apply_scan(units)
+        _LOGGER.info(
+            "Rescan in %.2f s: %d units, %d new, %d vanished (%s)",
+            time.perf_counter() - start, len(found), len(added), len(vanished),
+            "removed" if self.remove_vanished_units else "held unavailable"
+        )
+        if added or revived:
+            await self.async_request_refresh()
+        return added, vanished
+
+    @callback
+    def async_restore(self, status, adapter_info):
+        """Seed the snapshot and adapter info with last-known values from the entry cache."""
+        if adapter_info:
+            self.apply_adapter_info(adapter_info)
+        self.data = self.data.evolve({
+            key: IduState.from_dict(values) for key, values in status.items()
+            if key in self._unit_keys
+        })
+        self.warm_start = True
+
+    @callback
+    def async_begin_warm_start(self, started):
+        """Connect, verify the cached unit list and do the first poll in the background."""
+        self._warm_start_task = self.hass.async_create_background_task(
+            self._async_warm_start(started),
+            name=f"{self.name} warm start",
+        )
+
+    async def _async_warm_start(self, started):
+        try:
+            if not await self.hass.async_add_executor_job(self._client.connect):
+                _LOGGER.warning("Warm start: cannot connect yet, keeping cached units")
+            else:
+                units = await self.async_scan_units()
+                if units:
+                    self.async_apply_scan(units)
+                else:
+                    _LOGGER.warning("Warm start: scan found no units, keeping cached units")
+        except Exception as err:
+            _LOGGER.warning("Warm start scan failed, keeping cached units: %s", err)
+        await self.async_refresh()
+        self.ready_duration = time.perf_counter() - started
+        _LOGGER.info(
+            "Warm start: %d units verified and polled %.2f s after setup began",
+            len(self.devices), self.ready_duration
+        )
+
+    async def async_run_restart_command(self, method, *args):
+        """
+        Run an adapter command that reboots the gateway (restart, brand write,
+        factory reset) and resync once it is back.
+        """
+        func = getattr(self._adapter, method, None)
+        if func is None:
+            _LOGGER.warning("%s does not support %s", self._adapter.name, method)
+            return False
+        ok = await self.async_command_call(func, self._client, *args)
+        if ok:
+            self.async_begin_resync(method)
+        else:
+            _LOGGER.warning("Adapter command %s failed, not waiting for a restart", method)
+        return ok
+
+    @callback
+    def async_begin_resync(self, reason):
+        """Pause polling until the adapter answers again, then rescan and resume."""
+        if self._resync_task is not None and not self._resync_task.done():
+            return
+        self.restarting = True
+        self._resync_task = self.hass.async_create_background_task(
+            self._async_resync(reason),
+            name=f"{self.name} resync",
+        )
+
+    async def _async_resync(self, reason):
+        start = time.monotonic()
+        _LOGGER.info("Adapter restarting (%s), polling paused", reason)
+        try:
+            await asyncio.sleep(const.RESTART_SETTLE_SECONDS)
+            while not await self.async_bus_call(self._adapter.probe, self._client):
+                if time.monotonic() - start > const.RESTART_MAX_SECONDS:
+                    _LOGGER.warning(
+                        "Adapter did not answer within %d s after %s, resuming polling",
+                        const.RESTART_MAX_SECONDS, reason
                     )
+                    break
+                await asyncio.sleep(const.RESTART_PROBE_INTERVAL)
             else:
-                _LOGGER.warning("Adapter returned non-dict info: %s", info)
+                self.last_restart_outage = time.monotonic() - start
+                _LOGGER.info("Adapter back after %.1f s, rescanning indoor units",
+                             self.last_restart_outage)
+                # Firmware or brand may have changed: learn unreadable rows anew
+                if self._reader is not None:
+                    self._reader.reset()
+                units = await self.async_scan_units()
+                if units:
+                    self.async_apply_scan(units)
+        finally:
+            self.restarting = False
+        await self.async_refresh()
+
+    async def async_shutdown(self) -> None:
+        if self._unsub_rescan is not None:
+            self._unsub_rescan()
+            self._unsub_rescan = None
+        if self._unsub_confirm is not None:
+            self._unsub_confirm()
+            self._unsub_confirm = None
+        for task in (
+            self._resync_task, self._warm_start_task, self._rescan_task, self._explore_task
+        ):
+            if task is not None and not task.done():
+                task.cancel()
+        await super().async_shutdown()
+
+    def apply_hysteresis(self, polled, results):
+        """
+        Bridge failed reads of the polled units: a unit that was available
+        keeps its last-known values, marked stale, until unavailable_after
+        reads in a row failed or its last good read is older than
+        max_data_age. Polled units without a result read fine (unchanged).
+        """
+        now = time.monotonic()
+        limit, max_age = self._unavailable_after, self._max_data_age
+        for key in polled:
+            record = results.get(key)
+            current = self.data.get(key, UNAVAILABLE)
+            if record is None or record.get("available"):
+                self._failures.pop(key, None)
+                self._last_good[key] = now
+                if record is None and current.get("stale"):
+                    results[key] = current.replace(stale=None)
+                continue
+            failures = self._failures.get(key, 0) + 1
+            self._failures[key] = failures
+            if not current.get("available"):
+                continue
+            age = now - self._last_good.get(key, now)
+            if (limit or max_age) and (not limit or failures < limit) and (not max_age or age < max_age):
+                if not current.get("stale"):
+                    _LOGGER.debug("Read of IDU %s failed, keeping its last-known values", key)
+                    results[key] = current.replace(stale=True)
+                else:
+                    del results[key]
+            elif limit or max_age:
+                _LOGGER.info(
+                    "IDU %s unavailable after %d failed reads (%.0f s without data)",
+                    key, failures, age
+                )
+        return results
+
+    def start_write_cycle(self):
+        """Refill the state write budget; called once per poll cycle."""
+        self._writes_left = self._write_budget
+
+    @callback
+    def async_claim_write(self, key):
+        """
+        Take one temperature-only state write from this cycle's budget.
+        Units deferred in earlier cycles are served before new ones.
+        """
+        if not self._write_budget:
+            return True
+        if key in self._deferred_writes:
+            allowed = self._writes_left > 0
+        else:
+            allowed = self._writes_left > len(self._deferred_writes)
+        if allowed:
+            self._writes_left -= 1
+            self._deferred_writes.discard(key)
+        else:
+            self._deferred_writes.add(key)
+        return allowed
+
+    @callback
+    def async_cancel_write(self, key):
+        """Drop a deferred state write that is no longer needed."""
+        self._deferred_writes.discard(key)
+
+    @callback
+    def async_apply_optimistic(self, key, changes):
+        """
+        Show the values of a successful command right away. The next poll, or
+        one batched read of all recently commanded units CONFIRM_DELAY seconds
+        later, confirms them or rolls them back to what the unit reports.
+        """
+        self.async_apply_optimistic_units((key,), changes)
+
+    @callback
+    def async_apply_optimistic_units(self, keys, changes):
+        """async_apply_optimistic() for many units, published as one snapshot."""
+        now = time.monotonic()
+        updates = {}
+        for key in keys:
+            pending, _ = self._unconfirmed.get(key, ({}, None))
+            self._unconfirmed[key] = ({**pending, **changes}, now)
+            record = self.data.get(key, UNAVAILABLE)
+            if changes and record.get("available"):
+                updates[key] = record.replace(**changes)
+        if updates:
+            self.async_publish_units(updates)
+        if self._unsub_confirm is None:
+            self._unsub_confirm = async_call_later(
+                self.hass, const.CONFIRM_DELAY, self._async_confirm_later
+            )
+
+    async def async_zone_command(self, keys, changes):
+        """
+        Send the same {field: value} changes to a group of units in as few
+        multi-register writes as possible (see BaseAdapter.write_units()).
+        Unavailable units are skipped. The written units show the changes
+        right away and are confirmed together by one batched read.
+        Returns the keys of the written units.
+        """
+        slot_keys = {}
+        for key in keys:
+            if key in self._unit_keys and self.data.get(key, UNAVAILABLE).get("available"):
+                slot_keys[self._adapter.slot_of(*self._unit_keys[key])] = key
+        if not slot_keys:
+            return []
+        try:
+            slots = await self.async_command_call(
+                self._adapter.write_units, self._client, list(slot_keys), changes
+            )
         except Exception as err:
-            _LOGGER.warning("Failed to read adapter info: %s", err)
-            self.gateway_brand_code = 0
-            self.gateway_brand_name = "Unknown"
-            self.adapter_info = {}
+            _LOGGER.error("Error writing %s to %d units: %s", changes, len(slot_keys), err)
+            slots = set()
+        written = [slot_keys[slot] for slot in sorted(slots)]
+        if written:
+            self.async_apply_optimistic_units(written, changes)
+        return written
+
+    @callback
+    def async_confirm_command(self, key, changes, status):
+        """
+        Handle the status read back in the same transaction as a command
+        (FC23). The adapter may not have applied the command to its status
+        table yet, so a status that disagrees is not rolled back right away:
+        the values go the optimistic route and a later read decides.
+        """
+        if all(status.get(name) == value for name, value in changes.items()):
+            self._unconfirmed.pop(key, None)
+            self.async_publish_units({key: status})
+            return
+        _LOGGER.debug("IDU %s read back %s right after the command, confirming later", key, status)
+        self.async_apply_optimistic(key, changes)
 
-        # 2) Read each unit's status
+    @callback
+    def _async_confirm_later(self, _now):
+        self._unsub_confirm = None
+        if self._unconfirmed and not self.restarting:
+            self.hass.async_create_background_task(
+                self._async_confirm(), name=f"{self.name} confirm commands"
+            )
+
+    async def _async_confirm(self):
+        """Read back all units with unconfirmed commands in one go."""
+        units = {key: self._unit_keys[key] for key in self._unconfirmed if key in self._unit_keys}
+        if not units:
+            self._unconfirmed.clear()
+            return
+        if self._reader is None:
+            results, read_started = await self._async_poll_units(units)
+        else:
+            slots = {key: self._adapter.slot_of(*unit) for key, unit in units.items()}
+            started = time.monotonic()
+            try:
+                words, valid = await self.async_bus_call(
+                    self._reader.read, self._client, list(slots.values())
+                )
+            except Exception as err:
+                _LOGGER.error("Error reading back commanded units: %s", err)
+                return
+            results = {
+                key: self._adapter.decode_status_row(words, slot) if slot in valid else UNAVAILABLE
+                for key, slot in slots.items()
+            }
+            read_started = dict.fromkeys(slots, started)
+        results = self.apply_hysteresis(units, results)
+        results = self.async_settle_reads(results, read_started)
+        if results:
+            self.async_publish_units(results)
+
+    @callback
+    def async_settle_reads(self, results, read_started):
+        """
+        Confirm or roll back optimistic values with freshly read records.
+        Returns the results without the reads that started before the last
+        command to their unit.
+        """
+        for key in [key for key in results if key in self._unconfirmed]:
+            changes, commanded = self._unconfirmed[key]
+            if read_started[key] < commanded:
+                del results[key]
+                continue
+            record = results[key]
+            if record.get("stale") or not record.get("available"):
+                continue  # read failed, a later one decides
+            del self._unconfirmed[key]
+            rejected = {
+                name: value for name, value in changes.items() if record.get(name) != value
+            }
+            if rejected:
+                _LOGGER.warning(
+                    "IDU %s did not take %s (reports %s), rolled back",
+                    key, rejected, {name: record.get(name) for name in rejected}
+                )
+        return results
+
+    @callback
+    def async_publish_units(self, updates):
+        """
+        Publish targeted per-unit status updates as a new snapshot generation
+        and notify listeners, without resetting the poll timer.
+        """
+        now = time.monotonic()
+        for key in updates:
+            self._published_at[key] = now
+        if self._decoder is not None:
+            self._decoder.invalidate(
+                self._adapter.slot_of(*self._unit_keys[key])
+                for key in updates if key in self._unit_keys
+            )
+        snapshot = self.data.evolve(updates)
+        if snapshot is self.data:
+            return
+        self.data = snapshot
+        self.async_update_listeners()
+
+    async def _async_poll_units(self, units):
+        """Read unit statuses one by one. Returns (results, read start times)."""
         results = {}
-        for system, index in self.devices:
-            key = f"{system}-{index}"
+        read_started = {}
+        for key, (system, index) in units.items():
+            read_started[key] = time.monotonic()
             unit_start = time.perf_counter()
             try:
-                status = await self.hass.async_add_executor_job(
+                status = await self.async_bus_call(
                     self._adapter.read_status,
                     self._client,
                     system,
@@ -90,16 +854,96 @@ class EgiAdapterCoordinator(DataUpdateCoordinator):
                 results[key] = status
             except Exception as err:
                 _LOGGER.error("Error polling unit %s: %s", key, err)
-                results[key] = {"available": False}
+                results[key] = UNAVAILABLE
+        return results, read_started
 
-        self.data = results
+    async def _async_poll_table(self, units):
+        """
+        Block-read the status rows of all units and decode the whole table at
+        once. Only units whose rows changed (or became unreadable) get a result.
+        """
+        slots = {key: self._adapter.slot_of(*unit) for key, unit in units.items()}
+        # Rows of units with unconfirmed commands are decoded even if unchanged
+        self._decoder.invalidate(slots[key] for key in self._unconfirmed if key in slots)
+        started = time.monotonic()
+        try:
+            words, valid = await self.async_bus_call(
+                self._reader.read,
+                self._client,
+                list(slots.values())
+            )
+        except Exception as err:
+            _LOGGER.error("Error block-polling status table: %s", err)
+            words, valid = None, set()
+        records = {}
+        if words is not None:
+            records, changed = self._decoder.decode(words, valid)
+            _LOGGER.debug(
+                "Status table: %d/%d rows valid, %d changed",
+                len(valid), len(slots), sum(changed)
+            )
+        results = {}
+        for key, slot in slots.items():
+            if slot not in valid:
+                results[key] = UNAVAILABLE
+            elif slot in records:
+                results[key] = records[slot]
+        return results, dict.fromkeys(slots, started)
+
+    async def _async_update_data(self):
+        """
+        Fetch updated data from the adapter, including adapter info and unit statuses.
+        """
+        if self.restarting:
+            return self.data
+        if self.fleet is not None:
+            return await self.fleet.async_poll_member(self)
+
+        start_time = time.perf_counter()
+
+        # Ensure underlying client is connected
+        await self.hass.async_add_executor_job(self._client.connect)
+
+        # 1) Read adapter-level info
+        try:
+            info = await self.async_bus_call(
+                self._adapter.read_adapter_info,
+                self._client
+            )
+            self.apply_adapter_info(info)
+        except Exception as err:
+            _LOGGER.warning("Failed to read adapter info: %s", err)
+            self.clear_adapter_info()
+
+        # 2) Read each unit's status (disabled units only on heartbeat cycles)
+        heartbeat = self._cycle % const.DISABLED_UNIT_HEARTBEAT_CYCLES == 0
+        self._cycle += 1
+        units = {
+            key: unit for key, unit in self._unit_keys.items()
+            if (heartbeat or not self.on_heartbeat(key))
+            and key not in self.vanished_units
+        }
+        if self._decoder is not None:
+            results, read_started = await self._async_poll_table(units)
+        else:
+            results, read_started = await self._async_poll_units(units)
+        results = self.apply_hysteresis(units, results)
+
+        # Don't let a read that started before a targeted refresh overwrite it
+        for key, published in self._published_at.items():
+            if key in results and published > read_started[key]:
+                del results[key]
+        self._published_at.clear()
+        results = self.async_settle_reads(results, read_started)
+        self.start_write_cycle()
 
         # 3) Record duration
         duration = time.perf_counter() - start_time
         self.last_update_duration = duration
+        self._report_cycle()
         _LOGGER.debug(
-            "Update cycle completed for %d units in %.2f sec",
-            len(self.devices), duration
+            "Update cycle completed for %d units (%d disabled) in %.2f sec",
+            len(self.devices), len(self.disabled_units), duration
         )
 
-        return results
+        return self.data.evolve(results)
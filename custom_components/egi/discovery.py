@@ -1,5 +1,22 @@
+"""
+Discovery of EGI adapters on a serial line or on Modbus TCP hosts.
+
+Every slave ID is fingerprinted with as few reads as possible: the first
+signature read doubles as presence check, so an empty slave costs one short
+timeout. TCP hosts are probed concurrently; a whole subnet can be swept
+with non-blocking connect probes first, so only hosts with an open Modbus
+port get fingerprinted. Partial results are fired as EVENT_DISCOVERY_PROGRESS
+events while the sweep runs.
+"""
+import asyncio
+import ipaddress
 import logging
-from .modbus_client import get_shared_client
+from functools import lru_cache
+
+import voluptuous as vol
+from homeassistant import config_entries
+
+from .modbus_client import PROBE_NO_RESPONSE, PROBE_OK, ProbeConnection
 from .adapters import get_adapter
 from . import const
 
@@ -7,107 +24,325 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_SLAVES = list(range(1, 11))  # Default scan range if not specified
 
-async def discover_adapters(hass, config):
-    """Scan a line or TCP network for EGI-compatible Modbus devices and create config entries."""
-    connection_type = config.get("connection_type")
-    slave_range = config.get("slave_range", DEFAULT_SLAVES)
+# Adapter types in signature probe order: the Pro info word carries the
+# slave ID, so it is the most selective first read
+SIGNATURE_ORDER = ("pro", "light", "solo")
 
-    if connection_type not in ("serial", "tcp"):
-        _LOGGER.warning("Unsupported connection_type: %s", connection_type)
-        return []
+SERIAL_KEYS = ("port", "baudrate", "parity", "stopbits", "bytesize")
+SERIAL_DEFAULTS = {
+    "baudrate": const.DEFAULT_BAUDRATE,
+    "parity": const.DEFAULT_PARITY,
+    "stopbits": const.DEFAULT_STOPBITS,
+    "bytesize": const.DEFAULT_BYTESIZE,
+}
 
-    discovered = []
-    attempted = 0
-
-    for slave_id in slave_range:
-        attempted += 1
-        try:
-            if connection_type == "serial":
-                client = get_shared_client(
-                    connection_type="serial",
-                    slave_id=slave_id,
-                    port=config.get("port"),
-                    baudrate=config.get("baudrate", 9600),
-                    parity=config.get("parity", "E"),
-                    stopbits=config.get("stopbits", 1),
-                    bytesize=config.get("bytesize", 8),
+# egi.discover_adapters: number selectors send floats (9600.0), which must
+# not reach the config entry data or the serial client
+DISCOVER_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("baudrate"): vol.Coerce(int),
+        vol.Optional("stopbits"): vol.Coerce(int),
+        vol.Optional("bytesize"): vol.Coerce(int),
+        vol.Optional("slave_range"): [vol.Coerce(int)],
+        vol.Optional("ports"): [vol.Coerce(int)],
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+@lru_cache(maxsize=1)
+def _signatures():
+    """(adapter_type, RegisterMap) pairs; imports the adapter profiles on first use."""
+    return tuple((adapter_type, get_adapter(adapter_type).map) for adapter_type in SIGNATURE_ORDER)
+
+
+@lru_cache(maxsize=1)
+def _pro_brands():
+    return frozenset(get_adapter("pro").BRAND_NAMES)
+
+
+def _is_pro(client, register_map, info, slave_id):
+    """
+    D0015 is a status word (IDU 0-2 fan/wind) on a Light adapter, so the Pro
+    info word alone is not proof: the brand must be known and the Pro status
+    table, outside every other adapter's registers, must answer.
+    """
+    if info.get("slave_id") != slave_id or info.get("brand_code") not in _pro_brands():
+        return False
+    outcome, regs, _ = client.probe_registers(register_map.status_base, register_map.status_stride)
+    return outcome == PROBE_OK and bool(regs)
+
+
+def fingerprint(client, slave_id):
+    """
+    Identify the adapter answering at a slave ID. Returns
+    {"adapter_type", "slave_id", "info", "rtt"} or None if nothing answers.
+    Runs in the executor.
+    """
+    for position, (adapter_type, register_map) in enumerate(_signatures()):
+        outcome, regs, rtt = client.probe_registers(
+            register_map.info_address, register_map.info_count
+        )
+        if outcome == PROBE_NO_RESPONSE and position == 0:
+            return None
+        if outcome != PROBE_OK or not regs or len(regs) != register_map.info_count:
+            continue
+        info = register_map.decode_info(regs)
+        if "slave_id" in info and not _is_pro(client, register_map, info, slave_id):
+            continue
+        return {"adapter_type": adapter_type, "slave_id": slave_id, "info": info, "rtt": rtt}
+    _LOGGER.debug("Slave %d answers but matches no EGI adapter signature", slave_id)
+    return None
+
+
+def _confirm_line(client, slave_id):
+    """Fingerprint a slave and measure the mean round-trip time of its info read."""
+    result = fingerprint(client, slave_id)
+    if result is None:
+        return None
+    register_map = dict(_signatures())[result["adapter_type"]]
+    samples = [result["rtt"]]
+    for _ in range(const.SERIAL_RTT_SAMPLES):
+        outcome, _, rtt = client.probe_registers(register_map.info_address, register_map.info_count)
+        if outcome == PROBE_OK:
+            samples.append(rtt)
+    result["rtt"] = sum(samples) / len(samples)
+    return result
+
+
+async def async_autodetect_serial(hass, port, slave_id, bytesize=const.DEFAULT_BYTESIZE):
+    """
+    Try serial line settings in likely order (const.SERIAL_BAUDRATES x
+    SERIAL_FRAMINGS) until an EGI adapter signature answers at slave_id.
+    Returns the line settings plus the fingerprint and mean RTT, or None.
+    """
+    for baudrate in const.SERIAL_BAUDRATES:
+        for parity, stopbits in const.SERIAL_FRAMINGS:
+            params = {
+                "port": port,
+                "baudrate": baudrate,
+                "parity": parity,
+                "stopbits": stopbits,
+                "bytesize": bytesize,
+            }
+            connection = ProbeConnection("serial", const.DISCOVERY_SERIAL_TIMEOUT, **params)
+            if connection.shared:
+                _LOGGER.warning("%s is in use by a configured adapter, not auto-detecting", port)
+                return None
+            if not await hass.async_add_executor_job(connection.connect):
+                _LOGGER.warning("Cannot open %s for auto-detection", port)
+                return None
+            try:
+                result = await hass.async_add_executor_job(
+                    _confirm_line, connection.for_slave(slave_id), slave_id
                 )
-            else:
-                client = get_shared_client(
-                    connection_type="tcp",
-                    slave_id=slave_id,
-                    host=config.get("host"),
-                    port=config.get("port", 502),
+            finally:
+                await hass.async_add_executor_job(connection.close)
+            _LOGGER.debug(
+                "Auto-detect %s at %d baud %d%s%d: %s", port, baudrate, bytesize, parity, stopbits,
+                "match" if result else "no match"
+            )
+            if result is not None:
+                _LOGGER.info(
+                    "Detected %s adapter on %s at %d baud %d%s%d, RTT %.1f ms",
+                    result["adapter_type"], port, baudrate, bytesize, parity, stopbits,
+                    result["rtt"] * 1000
                 )
+                return {**params, **result}
+    return None
+
+
+class DiscoveryProgress:
+    """Counts probed slaves and fires progress events with partial results."""
+
+    def __init__(self, hass, total):
+        self.hass = hass
+        self.total = total
+        self.done = 0
+        self.found = []
 
-            await hass.async_add_executor_job(client.connect)
-            _LOGGER.debug("Connected to slave %d, attempting identification...", slave_id)
-
-            found_match = False
-            for adapter_type in ("light", "pro", "solo"):
-                adapter = get_adapter(adapter_type)
-                _LOGGER.debug("Trying adapter type '%s' at slave %d", adapter_type, slave_id)
-                info = await hass.async_add_executor_job(adapter.read_adapter_info, client)
-                if not info:
-                    _LOGGER.debug("Adapter type '%s' at slave %d gave no info response", adapter_type, slave_id)
-                _LOGGER.debug("Adapter '%s' at slave %d returned: %s", adapter_type, slave_id, info)
-
-                if info and info.get("brand_code") is not None:
-                    # Avoid duplicate config entry creation
-                    already_exists = False
-                    for entry in hass.config_entries.async_entries(domain=const.DOMAIN):
-                        if (
-                            entry.data.get("adapter_type") == adapter_type and
-                            entry.data.get("connection_type") == connection_type and
-                            entry.data.get("slave_id") == slave_id and
-                            entry.data.get("port") == config.get("port") and
-                            entry.data.get("host") == config.get("host")
-                        ):
-                            already_exists = True
-                            _LOGGER.info("Adapter already configured: %s", entry.data)
-                            break
-
-                    if already_exists:
-                        found_match = True
-                        break
-
-                    _LOGGER.info("Discovered %s adapter at slave %d: %s", adapter_type, slave_id, info)
-
-                    discovery_data = {
-                        "adapter_type": adapter_type,
-                        "connection_type": connection_type,
-                        "slave_id": slave_id,
-                    }
-                    if connection_type == "serial":
-                        discovery_data.update({
-                            "port": config.get("port"),
-                            "baudrate": config.get("baudrate", 9600),
-                            "parity": config.get("parity", "E"),
-                            "stopbits": config.get("stopbits", 1),
-                            "bytesize": config.get("bytesize", 8),
-                        })
-                    else:
-                        discovery_data.update({
-                            "host": config.get("host"),
-                            "port": config.get("port", 502),
-                        })
-
-                    await hass.config_entries.flow.async_init(
-                        const.DOMAIN,
-                        context={"source": "user"},
-                        data=discovery_data
+    def step(self, bus_key, result):
+        self.done += 1
+        if result is not None:
+            self.found.append(result)
+            _LOGGER.info(
+                "Found %s adapter at %s slave %d (%.0f ms)",
+                result["adapter_type"], bus_key, result["slave_id"], result["rtt"] * 1000
+            )
+        self.hass.bus.async_fire(const.EVENT_DISCOVERY_PROGRESS, {
+            "done": self.done,
+            "total": self.total,
+            "found": [
+                {"adapter_type": item["adapter_type"], "slave_id": item["slave_id"],
+                 "host": item.get("host"), "port": item.get("port")}
+                for item in self.found
+            ],
+        })
+
+
+async def async_probe_bus(hass, connection_type, params, slaves, progress, timeout):
+    """Fingerprint the slaves of one bus (serial port or TCP host) one after another."""
+    connection = ProbeConnection(connection_type, timeout, **params)
+    if not await hass.async_add_executor_job(connection.connect):
+        _LOGGER.debug("Cannot open %s for discovery", connection.bus_key)
+        for _ in slaves:
+            progress.step(connection.bus_key, None)
+        return []
+    # A bus in use by configured adapters is probed one slave per scheduler
+    # bus slot at scan priority, so polls and commands go first
+    scheduler = hass.data.get(const.SCHEDULER_KEY) if connection.shared else None
+    found = []
+    try:
+        for slave_id in slaves:
+            if scheduler is None:
+                result = await hass.async_add_executor_job(connection.probe, fingerprint, slave_id)
+            else:
+                async with scheduler.bus_slot(None, connection.bus_key, const.BUS_PRIORITY_SCAN):
+                    result = await hass.async_add_executor_job(
+                        connection.probe, fingerprint, slave_id
                     )
+            if result is not None:
+                result = {**result, "connection_type": connection_type, **params}
+                found.append(result)
+            progress.step(connection.bus_key, result)
+    finally:
+        await hass.async_add_executor_job(connection.close)
+    return found
+
+
+async def _async_port_open(host, port, timeout):
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return True
+
 
-                    discovered.append(discovery_data)
-                    found_match = True
-                    break  # only break if an actual adapter match was found
+async def async_sweep_subnet(
+    cidr,
+    ports=(502,),
+    limit=const.DISCOVERY_CONNECT_LIMIT,
+    timeout=const.DISCOVERY_CONNECT_TIMEOUT,
+):
+    """
+    Return the (host, port) pairs of a CIDR range that accept TCP connections,
+    using at most limit connect probes in flight. Probes are created as
+    workers get free. Ranges larger than DISCOVERY_MAX_SUBNET_ADDRESSES raise
+    ValueError, as do malformed ones.
+    """
+    network = ipaddress.ip_network(cidr, strict=False)
+    if network.num_addresses > const.DISCOVERY_MAX_SUBNET_ADDRESSES:
+        raise ValueError(
+            f"{cidr} has {network.num_addresses} addresses, at most "
+            f"{const.DISCOVERY_MAX_SUBNET_ADDRESSES} can be swept"
+        )
+    hosts = list(network.hosts()) or [network.network_address]
+    targets = ((str(host), port) for host in hosts for port in ports)
+    open_ports = []
 
-            if not found_match:
-                _LOGGER.debug("No matching adapter found at slave %d", slave_id)
+    async def _worker():
+        for host, port in targets:
+            if await _async_port_open(host, port, timeout):
+                open_ports.append((host, port))
 
-        except Exception as e:
-            _LOGGER.warning("No response from slave %d (%s): %s", slave_id, connection_type, e)
+    await asyncio.gather(*(_worker() for _ in range(min(limit, len(hosts) * len(ports)))))
+    open_ports.sort(key=lambda target: (ipaddress.ip_address(target[0]), target[1]))
+    _LOGGER.info(
+        "Swept %s (%d hosts x %d ports): %d open", cidr, len(hosts), len(ports), len(open_ports)
+    )
+    return open_ports
+
+
+def _entry_data(result):
+    data = {
+        "adapter_type": result["adapter_type"],
+        "connection_type": result["connection_type"],
+        "slave_id": result["slave_id"],
+    }
+    if result["connection_type"] == "serial":
+        data.update({key: result[key] for key in SERIAL_KEYS})
+    else:
+        data.update({"host": result["host"], "port": result["port"]})
+    return data
+
+
+def _already_configured(hass, data):
+    for entry in hass.config_entries.async_entries(domain=const.DOMAIN):
+        if (
+            entry.data.get("adapter_type") == data["adapter_type"] and
+            entry.data.get("connection_type") == data["connection_type"] and
+            entry.data.get("slave_id") == data["slave_id"] and
+            entry.data.get("port") == data.get("port") and
+            entry.data.get("host") == data.get("host")
+        ):
+            _LOGGER.info("Adapter already configured: %s", entry.data)
+            return True
+    return False
+
+
+async def async_create_discovered_flows(hass, results):
+    """Start a discovery config flow for every adapter not configured yet."""
+    discovered = []
+    for result in results:
+        data = _entry_data(result)
+        if _already_configured(hass, data):
             continue
+        await hass.config_entries.flow.async_init(
+            const.DOMAIN,
+            context={"source": config_entries.SOURCE_INTEGRATION_DISCOVERY},
+            data=data,
+        )
+        discovered.append(data)
+    return discovered
+
+
+async def discover_adapters(hass, config):
+    """Scan a line or TCP hosts for EGI-compatible Modbus devices and offer config entries."""
+    connection_type = config.get("connection_type")
+    slave_range = list(config.get("slave_range", DEFAULT_SLAVES))
+
+    if connection_type not in ("serial", "tcp"):
+        _LOGGER.warning("Unsupported connection_type: %s", connection_type)
+        return []
+
+    if connection_type == "serial":
+        params = {key: config.get(key, SERIAL_DEFAULTS.get(key)) for key in SERIAL_KEYS}
+        progress = DiscoveryProgress(hass, len(slave_range))
+        results = await async_probe_bus(
+            hass, "serial", params, slave_range, progress, const.DISCOVERY_SERIAL_TIMEOUT
+        )
+    else:
+        if config.get("subnet"):
+            ports = [int(port) for port in config.get("ports") or [config.get("port", 502)]]
+            try:
+                targets = await async_sweep_subnet(config["subnet"], ports)
+            except ValueError as err:
+                _LOGGER.warning("Not sweeping subnet: %s", err)
+                return []
+        else:
+            port = int(config.get("port", 502))
+            targets = [(host, port) for host in config.get("hosts") or [config.get("host")]]
+        progress = DiscoveryProgress(hass, len(targets) * len(slave_range))
+        in_flight = asyncio.Semaphore(const.DISCOVERY_MAX_HOSTS)
+
+        async def _probe_host(host, port):
+            async with in_flight:
+                return await async_probe_bus(
+                    hass, "tcp", {"host": host, "port": port}, slave_range, progress,
+                    const.DISCOVERY_TCP_TIMEOUT
+                )
+
+        per_host = await asyncio.gather(*(_probe_host(host, port) for host, port in targets))
+        results = [result for found in per_host for result in found]
 
-    _LOGGER.info("Discovery summary: tried %d slaves, found %d adapters", attempted, len(discovered))
+    discovered = await async_create_discovered_flows(hass, results)
+    _LOGGER.info(
+        "Discovery summary: tried %d slaves, found %d adapters (%d new)",
+        progress.done, len(results), len(discovered)
+    )
     return discovered
@@ -0,0 +1,170 @@
+"""
+Register-space explorer for mapping the layout of new adapter firmware.
+
+Sweeps an address range with as few reads as possible. Blocks start at the
+requested size, double after every successful read and halve after a hole.
+A block answered with an exception (illegal address) is bisected to find how
+much of it is readable; the end of the hole behind it is found by galloping
+single-word reads followed by another bisection. While the hole answers with
+exceptions the stride is capped at HOLE_STRIDE, so a readable window is only
+missed if it is narrower than that. Every unanswered read costs a full
+timeout, so the stride doubles with each silent read in a row up to
+SILENT_STRIDE: a silent range costs about one timeout per SILENT_STRIDE
+words, and readable windows narrower than the stride reached there may be
+missed. Each step is one read, so callers can release the bus between steps.
+
+The result is a compact map: readable and unreadable address ranges plus the
+runs of non-zero values inside the readable ones.
+"""
+import logging
+
+from .modbus_client import PROBE_NO_RESPONSE, PROBE_OK
+
+_LOGGER = logging.getLogger(__name__)
+
+# Modbus limit for one read holding registers request
+MAX_BLOCK = 125
+# Largest step between the single-word reads that look for the end of a
+# hole answering with exceptions, and of a silent one (doubling up to it)
+HOLE_STRIDE = 4
+SILENT_STRIDE = 256
+# Give up when this many first reads all go unanswered (adapter offline);
+# other timeouts are treated like exceptions, as some firmware stays silent
+# on illegal addresses
+MAX_SILENT_READS = 16
+
+
+class RegisterExplorer:
+    """Stepwise sweep of [start, start + count); call read_next() until done."""
+
+    def __init__(self, start, count, max_block=None):
+        self.start = start
+        self.end = start + count
+        self.max_block = max(1, min(max_block or MAX_BLOCK, MAX_BLOCK))
+        self.position = start
+        self.reads = 0
+        self.timeouts = 0
+        self.aborted = None
+        self._readable = []
+        self._unreadable = []
+        self._values = {}
+        self._steps = self._explore()
+        self._request = next(self._steps, None)
+
+    @property
+    def done(self):
+        return self._request is None
+
+    @property
+    def progress(self):
+        """Fraction of the address range already classified."""
+        span = self.end - self.start
+        return (self.position - self.start) / span if span else 1.0
+
+    def read_next(self, client):
+        """Perform the next read of the sweep. Runs in the executor."""
+        address, count = self._request
+        outcome, regs, _ = client.probe_registers(address, count)
+        self.reads += 1
+        if outcome == PROBE_NO_RESPONSE:
+            self.timeouts += 1
+            if self.timeouts == self.reads == MAX_SILENT_READS:
+                self.aborted = f"no response to the first {self.reads} reads"
+                _LOGGER.warning("Register sweep stopped: %s", self.aborted)
+                self._request = None
+                return
+        if outcome == PROBE_OK and (not regs or len(regs) != count):
+            outcome = PROBE_NO_RESPONSE
+        try:
+            self._request = self._steps.send(
+                (outcome == PROBE_OK, regs, outcome == PROBE_NO_RESPONSE)
+            )
+        except StopIteration:
+            self._request = None
+
+    def _explore(self):
+        """Generator yielding (address, count) reads and receiving (ok, registers, silent)."""
+        address = self.start
+        block = self.max_block
+        while address < self.end:
+            count = min(block, self.end - address)
+            ok, regs, _ = yield address, count
+            if ok:
+                self._record(address, regs)
+                address = self.position = address + count
+                block = min(block * 2, self.max_block)
+                continue
+
+            # Bisect for the longest readable prefix of the failed block
+            readable, failing, prefix = 0, count, None
+            while failing - readable > 1:
+                middle = (readable + failing) // 2
+                ok, regs, _ = yield address, middle
+                if ok:
+                    readable, prefix = middle, regs
+                else:
+                    failing = middle
+            if readable:
+                self._record(address, prefix)
+                address += readable
+
+            # address is unreadable: gallop to a readable word, then bisect
+            # back to the first one
+            last_bad, step, first_good, stride = 0, 1, None, 1
+            while address + step < self.end:
+                ok, _, silent = yield address + step, 1
+                if ok:
+                    first_good = step
+                    break
+                stride = min(stride * 2, SILENT_STRIDE) if silent else min(step, HOLE_STRIDE)
+                last_bad, step = step, step + stride
+            if first_good is None:
+                first_good = self.end - address
+            while first_good - last_bad > 1:
+                middle = (last_bad + first_good) // 2
+                ok, _, _ = yield address + middle, 1
+                if ok:
+                    first_good = middle
+                else:
+                    last_bad = middle
+            self._unreadable.append((address, first_good))
+            address = self.position = address + first_good
+            block = max(1, block // 2)
+        self.position = self.end
+
+    def _record(self, address, regs):
+        self._readable.append((address, len(regs)))
+        for offset, value in enumerate(regs):
+            if value:
+                self._values[address + offset] = value
+
+    @staticmethod
+    def _ranges(spans):
+        """Merge adjacent (address, count) spans into [first, last] pairs."""
+        merged = []
+        for address, count in sorted(spans):
+            if merged and merged[-1][1] + 1 == address:
+                merged[-1][1] = address + count - 1
+            else:
+                merged.append([address, address + count - 1])
+        return merged
+
+    def as_dict(self):
+        """Compact map of the sweep: ranges plus runs of non-zero values."""
+        runs = []
+        for address in sorted(self._values):
+            if runs and runs[-1][0] + len(runs[-1][1]) == address:
+                runs[-1][1].append(self._values[address])
+            else:
+                runs.append([address, [self._values[address]]])
+        return {
+            "start": self.start,
+            "end": self.end - 1,
+            "complete": self.done and self.aborted is None and self.position >= self.end,
+            "aborted": self.aborted,
+            "reads": self.reads,
+            "timeouts": self.timeouts,
+            "readable": self._ranges(self._readable),
+            "unreadable": self._ranges(self._unreadable),
+            "values": runs,
+        }
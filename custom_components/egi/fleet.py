@@ -0,0 +1,137 @@
+"""
+Fleet coordinator polling every Solo adapter on one RS-485 line in a single sweep.
+"""
+import logging
+import time
+
+from homeassistant.core import callback
+
+from . import const
+from .coordinator import EgiScheduledCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Solo adapters control exactly one indoor unit
+SOLO_UNIT_KEY = "0-0"
+
+
+def get_solo_fleet(hass, bus_key, update_interval, scheduler):
+    """Return the fleet for a serial bus, creating and scheduling it on first use."""
+    fleets = hass.data.setdefault(const.FLEET_KEY, {})
+    fleet = fleets.get(bus_key)
+    if fleet is None:
+        fleet = EgiSoloFleetCoordinator(hass, bus_key, update_interval, scheduler)
+        fleets[bus_key] = fleet
+        if scheduler is not None:
+            scheduler.register(fleet)
+    return fleet
+
+
+class EgiSoloFleetCoordinator(EgiScheduledCoordinator):
+    """
+    Polls all Solo entries sharing a serial port in one cycle and fans the
+    results out to the per-entry member coordinators. Each slave is read in
+    its own bus slot, so commands get the bus between two slaves; adapter
+    info (D2000) is only read every SOLO_FLEET_INFO_EVERY cycles.
+    """
+
+    def __init__(self, hass, bus_key, update_interval, scheduler=None):
+        super().__init__(
+            hass,
+            name=f"egi_solo_fleet {bus_key}",
+            update_interval=update_interval,
+            scheduler=scheduler,
+            bus_key=bus_key
+        )
+        self.members = {}
+        self._intervals = {}
+        self._cycle = 0
+        self._unsub_keepalive = None
+        self.last_update_duration = None
+
+    def add_member(self, member, update_interval):
+        """Join a Solo entry's coordinator; the fleet polls at the fastest member interval."""
+        self.members[member.unit_id] = member
+        self._intervals[member.unit_id] = update_interval
+        self._apply_interval()
+        if self._unsub_keepalive is None:
+            # Members carry the entities, so keep our own timer running
+            self._unsub_keepalive = self.async_add_listener(lambda: None)
+        _LOGGER.info(
+            "Solo slave %s joined fleet on %s (%d members)",
+            member.unit_id, self._bus_key, len(self.members)
+        )
+
+    def set_member_interval(self, member, update_interval):
+        """A member's poll interval option changed."""
+        self._intervals[member.unit_id] = update_interval
+        self._apply_interval()
+
+    def remove_member(self, member):
+        """Leave the fleet; the last member tears it down."""
+        self.members.pop(member.unit_id, None)
+        self._intervals.pop(member.unit_id, None)
+        if self.members:
+            self._apply_interval()
+            return
+        if self._unsub_keepalive is not None:
+            self._unsub_keepalive()
+            self._unsub_keepalive = None
+        if self._scheduler is not None:
+            self._scheduler.unregister(self)
+        self.hass.data.get(const.FLEET_KEY, {}).pop(self._bus_key, None)
+        _LOGGER.info("Solo fleet on %s has no members left, stopped", self._bus_key)
+
+    def _apply_interval(self):
+        interval = min(self._intervals.values())
+        if interval != self.update_interval:
+            self.update_interval = interval
+            if self._scheduler is not None:
+                self._scheduler.restagger()
+            self.async_reschedule()
+
+    async def async_poll_member(self, member):
+        """Poll a single member right away (first refresh, force poll)."""
+        info, status = await self.async_bus_call(member.read_unit, 0, 0, True)
+        if info is not None:
+            member.apply_adapter_info(info)
+        return member.data.evolve({SOLO_UNIT_KEY: status})
+
+    async def _async_update_data(self):
+        start_time = time.perf_counter()
+        heartbeat = self._cycle % const.DISABLED_UNIT_HEARTBEAT_CYCLES == 0
+        read_info = self._cycle % const.SOLO_FLEET_INFO_EVERY == 0
+        self._cycle += 1
+
+        members = [
+            self.members[slave] for slave in sorted(self.members)
+            if not self.members[slave].restarting
+            and (heartbeat or not self.members[slave].on_heartbeat(SOLO_UNIT_KEY))
+        ]
+        # One bus call per slave, so commands on this port get the bus
+        # between two slaves instead of waiting for the whole sweep
+        results = []
+        for member in members:
+            started = time.monotonic()
+            info, status = await self.async_bus_call(member.read_unit, 0, 0, read_info)
+            results.append((info, status, started))
+        self.last_update_duration = time.perf_counter() - start_time
+        self._report_cycle()
+        for member, (info, status, started) in zip(members, results):
+            self._async_fan_out(member, info, status, started)
+
+        _LOGGER.debug(
+            "Solo fleet sweep on %s: %d slaves in %.2f sec",
+            self._bus_key, len(members), self.last_update_duration
+        )
+        return {member.unit_id: status for member, (_, status, _) in zip(members, results)}
+
+    @callback
+    def _async_fan_out(self, member, info, status, started):
+        if info is not None:
+            member.apply_adapter_info(info)
+        member.last_update_duration = self.last_update_duration
+        updates = member.apply_hysteresis((SOLO_UNIT_KEY,), {SOLO_UNIT_KEY: status})
+        updates = member.async_settle_reads(updates, {SOLO_UNIT_KEY: started})
+        member.start_write_cycle()
+        member.async_set_updated_data(member.data.evolve(updates))
@@ -2,12 +2,47 @@
 
 import threading
 import logging
-from pymodbus.client import ModbusSerialClient, ModbusTcpClient
+import time
+
+# pymodbus is imported on first client creation (see _create_client), so
+# monitor-only entries and the config flow never load its transport stacks
 
 _LOGGER = logging.getLogger(__name__)
 
 # Global pool for shared Modbus clients by connection key
 _client_pool = {}
+# One lock per pooled client: every slave on a bus shares it
+_client_locks = {}
+
+# Outcomes of EgiModbusClient.probe_registers()
+PROBE_OK = "ok"
+PROBE_EXCEPTION = "exception"  # a Modbus exception reply: something answers at this slave
+PROBE_NO_RESPONSE = "no_response"
+# Returned by readwrite_registers() when the slave or transport lacks FC23
+PROBE_UNSUPPORTED = "unsupported"
+
+# Modbus exception code for a function code the slave does not implement
+ILLEGAL_FUNCTION = 0x01
+
+def _create_client(connection_type, timeout=3, retries=3, **kwargs):
+    if connection_type == "serial":
+        from pymodbus.client import ModbusSerialClient
+        return ModbusSerialClient(
+            port=kwargs.get("port"),
+            baudrate=kwargs.get("baudrate", 9600),
+            parity=kwargs.get("parity", "E"),
+            stopbits=kwargs.get("stopbits", 1),
+            bytesize=kwargs.get("bytesize", 8),
+            timeout=timeout,
+            retries=retries,
+        )
+    from pymodbus.client import ModbusTcpClient
+    return ModbusTcpClient(
+        host=kwargs.get("host"),
+        port=kwargs.get("port", 502),
+        timeout=timeout,
+        retries=retries,
+    )
 
 def get_shared_client(connection_type, slave_id=1, **kwargs):
     """Create or reuse a shared Modbus client based on unique connection key."""
@@ -15,23 +50,10 @@ def get_shared_client(connection_type, slave_id=1, **kwargs):
 
     if key not in _client_pool:
         if connection_type == "serial":
-            port = kwargs.get("port")
-            _LOGGER.info("Creating new ModbusSerialClient for port: %s", port)
-            client = ModbusSerialClient(
-                port=port,
-                baudrate=kwargs.get("baudrate", 9600),
-                parity=kwargs.get("parity", "E"),
-                stopbits=kwargs.get("stopbits", 1),
-                bytesize=kwargs.get("bytesize", 8),
-                timeout=3,
-            )
+            _LOGGER.info("Creating new ModbusSerialClient for port: %s", kwargs.get("port"))
         else:
             _LOGGER.info("Creating new ModbusTcpClient for host: %s", kwargs.get("host"))
-            client = ModbusTcpClient(
-                host=kwargs.get("host"),
-                port=kwargs.get("port", 502),
-                timeout=3,
-            )
+        client = _create_client(connection_type, **kwargs)
 
         connected = client.connect()
         if connected:
@@ -40,10 +62,16 @@ def get_shared_client(connection_type, slave_id=1, **kwargs):
             _LOGGER.warning("Modbus client failed to connect: %s", key)
 
         _client_pool[key] = client
+        _client_locks[key] = threading.Lock()
     else:
         _LOGGER.debug("Reusing existing Modbus client for key: %s", key)
 
-    return EgiModbusClient(_client_pool[key], slave_id=slave_id)
+    return EgiModbusClient(
+        _client_pool[key],
+        slave_id=slave_id,
+        lock=_client_locks[key],
+        bus_key=key,
+    )
 
 def _get_client_key(connection_type, **kwargs):
     """Generate unique key for each client based on port or host."""
@@ -55,13 +83,129 @@ def _get_client_key(connection_type, **kwargs):
         port = kwargs.get("port", 502)
         return f"tcp::{host}:{port}"
 
+class ProbeConnection:
+    """
+    Short-timeout connection for discovery probes, without retries: a silent
+    slave costs one timeout, not (retries + 1). A bus that is already in use
+    by an entry is probed through its pooled client (and lock), switched to
+    the probe timeout and no retries for each probe; otherwise a private
+    client is opened and closed again by close().
+    """
+
+    def __init__(self, connection_type, timeout, **kwargs):
+        self.bus_key = _get_client_key(connection_type, **kwargs)
+        self._timeout = timeout
+        pooled = _client_pool.get(self.bus_key)
+        self._owned = pooled is None
+        if self._owned:
+            self._client = _create_client(connection_type, timeout=timeout, retries=0, **kwargs)
+            self._lock = threading.Lock()
+        else:
+            self._client = pooled
+            self._lock = _client_locks[self.bus_key]
+
+    @property
+    def shared(self):
+        """True if the bus is already open for an entry and probed through its client."""
+        return not self._owned
+
+    def connect(self):
+        if not self._owned:
+            return True
+        try:
+            return bool(self._client.connect())
+        except Exception as e:
+            _LOGGER.debug("Probe connect to %s failed: %s", self.bus_key, e)
+            return False
+
+    def for_slave(self, slave_id):
+        return EgiModbusClient(self._client, slave_id=slave_id, lock=self._lock, bus_key=self.bus_key)
+
+    def probe(self, func, slave_id):
+        """
+        Return func(client, slave_id). A pooled client runs it with the probe
+        timeout and no retries and gets its own settings back afterwards;
+        callers hold the bus (scheduler bus slot) meanwhile.
+        """
+        client = self.for_slave(slave_id)
+        if self._owned:
+            return func(client, slave_id)
+        previous, retries = client.timeout, client.retries
+        client.set_timeout(self._timeout)
+        client.set_retries(0)
+        try:
+            return func(client, slave_id)
+        finally:
+            if previous is not None:
+                client.set_timeout(previous)
+            if retries is not None:
+                client.set_retries(retries)
+
+    def close(self):
+        if self._owned:
+            self._client.close()
+
 class EgiModbusClient:
     """Wraps pymodbus client and applies slave ID + thread lock. Shared client safety."""
 
-    def __init__(self, modbus_client, slave_id=1):
+    def __init__(self, modbus_client, slave_id=1, lock=None, bus_key=None):
         self._client = modbus_client
         self._slave_id = slave_id
-        self._lock = threading.Lock()
+        self._lock = lock or threading.Lock()
+        # Identifies the physical bus (serial port or TCP host) this slave lives on
+        self.bus_key = bus_key or f"client::{id(modbus_client)}"
+
+    @property
+    def unit_id(self):
+        return self._slave_id
+
+    @property
+    def timeout(self):
+        """Response timeout of the underlying client (None if unknown)."""
+        params = getattr(self._client, "comm_params", None)
+        return getattr(params, "timeout_connect", None)
+
+    def set_timeout(self, seconds):
+        """
+        Change the response timeout of the underlying (shared) client.
+        Applies to every slave on the same bus.
+        """
+        with self._lock:
+            params = getattr(self._client, "comm_params", None)
+            if params is not None:
+                params.timeout_connect = seconds
+            sock = getattr(self._client, "socket", None)
+            if sock is not None:
+                if hasattr(sock, "settimeout"):
+                    sock.settimeout(seconds)
+                elif hasattr(sock, "timeout"):
+                    sock.timeout = seconds
+        _LOGGER.debug("Modbus timeout for %s set to %.2f s", self.bus_key, seconds)
+
+    @property
+    def retries(self):
+        """Retries per request of the underlying client (None if unknown)."""
+        transaction = getattr(self._client, "transaction", None)
+        for holder in (transaction, self._client, getattr(self._client, "params", None)):
+            retries = getattr(holder, "retries", None)
+            if retries is not None:
+                return retries
+        return None
+
+    def set_retries(self, retries):
+        """
+        Change the retries per request of the underlying (shared) client;
+        pymodbus keeps them on the client or its transaction manager
+        depending on the release.
+        """
+        with self._lock:
+            for holder in (
+                getattr(self._client, "transaction", None),
+                self._client,
+                getattr(self._client, "params", None),
+            ):
+                if holder is not None and hasattr(holder, "retries"):
+                    holder.retries = retries
 
     def connect(self):
         _LOGGER.debug("connect() skipped — using pre-connected shared client.")
@@ -91,6 +235,67 @@ class EgiModbusClient:
                 return None
             return getattr(result, "registers", None)
 
+    def probe_registers(self, address, count=1):
+        """
+        Read registers for discovery. Returns (outcome, registers, rtt seconds);
+        unlike read_holding_registers() it tells a Modbus exception reply
+        (PROBE_EXCEPTION, the slave exists) from no reply at all.
+        """
+        with self._lock:
+            start = time.perf_counter()
+            try:
+                result = self._client.read_holding_registers(
+                    address=address,
+                    count=count,
+                    slave=self._slave_id
+                )
+            except Exception as e:
+                _LOGGER.debug("Probe of slave %s at addr=%s: no response (%s)", self._slave_id, address, e)
+                return PROBE_NO_RESPONSE, None, time.perf_counter() - start
+            rtt = time.perf_counter() - start
+        if hasattr(result, "isError") and result.isError():
+            if getattr(result, "exception_code", None) is not None:
+                return PROBE_EXCEPTION, None, rtt
+            return PROBE_NO_RESPONSE, None, rtt
+        return PROBE_OK, getattr(result, "registers", None), rtt
+
+    def readwrite_registers(self, read_address, read_count, write_address, values):
+        """
+        Write registers and read registers in one Read/Write Multiple
+        Registers (FC23) transaction; the write happens first. Returns
+        (outcome, registers) with PROBE_UNSUPPORTED if the slave answers
+        "illegal function" or the transport has no FC23.
+        """
+        readwrite = getattr(self._client, "readwrite_registers", None)
+        if readwrite is None:
+            return PROBE_UNSUPPORTED, None
+        with self._lock:
+            try:
+                result = readwrite(
+                    read_address=read_address,
+                    read_count=read_count,
+                    write_address=write_address,
+                    values=values,
+                    slave=self._slave_id
+                )
+                _LOGGER.debug(
+                    "Read/write registers write=%s %s read=%s+%s → %s",
+                    write_address, values, read_address, read_count, result
+                )
+            except Exception as e:
+                _LOGGER.error("Modbus readwrite_registers exception: %s", e)
+                return PROBE_NO_RESPONSE, None
+        if hasattr(result, "isError") and result.isError():
+            code = getattr(result, "exception_code", None)
+            if code == ILLEGAL_FUNCTION:
+                return PROBE_UNSUPPORTED, None
+            _LOGGER.warning("Modbus read/write error at addr=%s: %s", write_address, result)
+            return PROBE_EXCEPTION if code is not None else PROBE_NO_RESPONSE, None
+        regs = getattr(result, "registers", None)
+        if not regs or len(regs) != read_count:
+            return PROBE_NO_RESPONSE, None
+        return PROBE_OK, regs
+
     def write_register(self, address, value):
         if self._client is None:
             _LOGGER.error("Modbus client is not initialized")
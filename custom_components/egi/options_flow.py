@@ -3,6 +3,9 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
 
+from . import const
+from .zones import parse_zones
+
 _LOGGER = logging.getLogger(__name__)
 
 class EgiVrfOptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
@@ -12,11 +15,39 @@ class EgiVrfOptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
         """Initial options form: poll interval + optional restart/reset."""
         _LOGGER.debug("Entered options flow for entry_id: %s", self.config_entry.entry_id)
         errors = {}
-        poll_interval_default = self.config_entry.options.get("poll_interval", 2)
+        poll_interval_default = self.config_entry.options.get("poll_interval", const.DEFAULT_POLL_INTERVAL)
+        request_timeout_default = self.config_entry.options.get("request_timeout", const.DEFAULT_REQUEST_TIMEOUT)
+        fleet_mode_default = self.config_entry.options.get("fleet_mode", True)
+        rescan_interval_default = self.config_entry.options.get("rescan_interval", const.DEFAULT_RESCAN_INTERVAL)
+        remove_vanished_default = self.config_entry.options.get("remove_vanished_units", False)
+        temp_threshold_default = self.config_entry.options.get("temp_threshold", const.DEFAULT_TEMP_THRESHOLD)
+        slim_attributes_default = self.config_entry.options.get("slim_attributes", False)
+        write_budget_default = self.config_entry.options.get("write_budget", const.DEFAULT_WRITE_BUDGET)
+        unavailable_after_default = self.config_entry.options.get("unavailable_after", const.DEFAULT_UNAVAILABLE_AFTER)
+        max_data_age_default = self.config_entry.options.get("max_data_age", const.DEFAULT_MAX_DATA_AGE)
+        zones_default = self.config_entry.options.get("zones", "")
 
         if user_input is not None:
+            try:
+                parse_zones(user_input.get("zones", zones_default))
+            except ValueError as err:
+                _LOGGER.warning("Invalid zone definition: %s", err)
+                errors["zones"] = "invalid_zones"
+                zones_default = user_input.get("zones", zones_default)
+
+        if user_input is not None and not errors:
             updated_options = dict(self.config_entry.options)
             updated_options["poll_interval"] = user_input.get("poll_interval", poll_interval_default)
+            updated_options["request_timeout"] = user_input.get("request_timeout", request_timeout_default)
+            updated_options["fleet_mode"] = user_input.get("fleet_mode", fleet_mode_default)
+            updated_options["rescan_interval"] = user_input.get("rescan_interval", rescan_interval_default)
+            updated_options["remove_vanished_units"] = user_input.get("remove_vanished_units", remove_vanished_default)
+            updated_options["temp_threshold"] = user_input.get("temp_threshold", temp_threshold_default)
+            updated_options["slim_attributes"] = user_input.get("slim_attributes", slim_attributes_default)
+            updated_options["write_budget"] = user_input.get("write_budget", write_budget_default)
+            updated_options["unavailable_after"] = user_input.get("unavailable_after", unavailable_after_default)
+            updated_options["max_data_age"] = user_input.get("max_data_age", max_data_age_default)
+            updated_options["zones"] = user_input.get("zones", zones_default).strip()
             _LOGGER.debug("Options updated for entry_id %s: %s", self.config_entry.entry_id, updated_options)
 
             # Handle optional actions
@@ -35,6 +66,28 @@ class EgiVrfOptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
             vol.Required("poll_interval", default=poll_interval_default): vol.All(
                 int, vol.Range(min=1, max=60)
             ),
+            vol.Optional("request_timeout", default=request_timeout_default): vol.All(
+                vol.Coerce(float), vol.Range(min=0.2, max=10)
+            ),
+            vol.Optional("fleet_mode", default=fleet_mode_default): bool,
+            vol.Optional("rescan_interval", default=rescan_interval_default): vol.All(
+                int, vol.Range(min=0, max=1440)
+            ),
+            vol.Optional("remove_vanished_units", default=remove_vanished_default): bool,
+            vol.Optional("temp_threshold", default=temp_threshold_default): vol.All(
+                vol.Coerce(float), vol.Range(min=0, max=5)
+            ),
+            vol.Optional("slim_attributes", default=slim_attributes_default): bool,
+            vol.Optional("write_budget", default=write_budget_default): vol.All(
+                int, vol.Range(min=0, max=1000)
+            ),
+            vol.Optional("unavailable_after", default=unavailable_after_default): vol.All(
+                int, vol.Range(min=0, max=100)
+            ),
+            vol.Optional("max_data_age", default=max_data_age_default): vol.All(
+                int, vol.Range(min=0, max=3600)
+            ),
+            vol.Optional("zones", default=zones_default): str,
             vol.Optional("trigger_restart", default=False): bool,
             vol.Optional("trigger_factory_reset", default=False): bool,
         })
@@ -52,13 +105,12 @@ class EgiVrfOptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
     async def _execute_adapter_command(self, command):
         """Call adapter restart or factory reset if supported."""
         entry_id = self.config_entry.entry_id
-        adapter = self.hass.data.get("egi", {}).get(entry_id, {}).get("adapter")
-        client = self.hass.data.get("egi", {}).get(entry_id, {}).get("client")
+        coordinator = self.hass.data.get("egi", {}).get(entry_id, {}).get("coordinator")
 
-        if adapter and hasattr(adapter, command):
+        if coordinator is not None:
             _LOGGER.debug("Calling adapter.%s() for entry %s", command, entry_id)
             try:
-                await self.hass.async_add_executor_job(getattr(adapter, command), client)
+                await coordinator.async_run_restart_command(command)
             except Exception as e:
                 _LOGGER.error("Error running adapter.%s(): %s", command, e)
         else:
@@ -0,0 +1,414 @@
+"""
+Declarative register maps for EGI adapters.
+
+An adapter profile (see adapters/profiles.py) describes its Modbus layout as
+plain data: the status table (base, stride, slots, bit-sliced fields), the
+control table with writable fields, the adapter info group and the rule that
+tells an occupied slot from an empty one. RegisterMap compiles a profile once
+at import time into field tuples, precomputed read plans and write encoders,
+so polling, scanning and writes share one code path for every adapter.
+
+Field specs are dicts with the keys:
+    name    IduState field (status) or control name
+    offset  word offset inside the row / group
+    shift   right shift before masking (default 0)
+    mask    bit mask after shifting (default 0xFFFF)
+    kind    "int", "bool" or "ascii" (default "int")
+    scale   multiplier applied to ints (default None = raw)
+Control fields additionally accept:
+    values  {python value: raw value} for enumerations such as power
+    min/max clamp range for the raw value
+"""
+import logging
+from functools import lru_cache
+
+from .modbus_client import PROBE_OK
+from .state import UNAVAILABLE, IduState
+from .status_table import (
+    FIELD_ASCII,
+    BlockReader,
+    FIELD_BOOL,
+    FIELD_INT,
+    StatusTableDecoder,
+    decode_row,
+    plan_block_reads,
+    read_table,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Modbus limit for one write multiple registers (FC16) request
+MAX_WRITE_BLOCK = 123
+
+
+def _compile_field(spec):
+    """Return the (name, offset, shift, mask, kind, scale) tuple of a field spec."""
+    kind = spec.get("kind", FIELD_INT)
+    if kind not in (FIELD_INT, FIELD_BOOL, FIELD_ASCII):
+        raise ValueError(f"Unknown field kind {kind!r} for {spec['name']}")
+    return (
+        spec["name"],
+        spec["offset"],
+        spec.get("shift", 0),
+        spec.get("mask", 0xFFFF),
+        kind,
+        spec.get("scale"),
+    )
+
+
+class ControlField:
+    """Encoder for one writable bit slice of a control row."""
+
+    __slots__ = ("name", "offset", "shift", "mask", "values", "minimum", "maximum", "shared")
+
+    def __init__(self, spec):
+        self.name = spec["name"]
+        self.offset = spec["offset"]
+        self.shift = spec.get("shift", 0)
+        self.mask = spec.get("mask", 0xFFFF)
+        self.values = spec.get("values")
+        self.minimum = spec.get("min")
+        self.maximum = spec.get("max")
+        # Set by RegisterMap when another field lives in the same register
+        self.shared = False
+
+    def raw(self, value):
+        """Raw (unshifted) value for a Python value."""
+        if self.values is not None:
+            value = self.values[value]
+        value = int(value)
+        if self.minimum is not None:
+            value = max(self.minimum, value)
+        if self.maximum is not None:
+            value = min(self.maximum, value)
+        return value & self.mask
+
+    def encode(self, value, word=0):
+        """Return word with this field's bits replaced by value."""
+        keep = word & ~(self.mask << self.shift) & 0xFFFF
+        return keep | (self.raw(value) << self.shift)
+
+
+class RegisterMap:
+    """A compiled adapter profile."""
+
+    def __init__(self, profile):
+        self.name = profile["name"]
+        self.probe_address = profile["probe_address"]
+        self.modes = dict(profile["modes"])
+        self.mode_codes = {name: code for code, name in self.modes.items()}
+        self.default_mode = profile.get("default_mode", "fan_only")
+        self.default_mode_code = self.mode_codes.get(profile.get("default_write_mode", "cool"))
+        self.fans = dict(profile["fans"])
+        self.fan_codes = {name: code for code, name in self.fans.items()}
+
+        status = profile["status"]
+        self.block_read = status.get("block_read", False)
+        self.status_base = status["base"]
+        self.status_stride = status["stride"]
+        self.status_slots = status["slots"]
+        self.units_per_system = status.get("units_per_system", self.status_slots)
+        self.status_fields = tuple(_compile_field(spec) for spec in status["fields"])
+        for field in self.status_fields:
+            if field[0] not in IduState.__slots__:
+                raise ValueError(f"{self.name}: status field {field[0]} is not an IduState field")
+        self.full_plan = tuple(plan_block_reads(range(self.status_slots), self.status_stride))
+
+        occupancy = profile.get("occupancy", {})
+        self.fixed_units = tuple(occupancy.get("fixed_units", ()))
+        self.occupancy_words = occupancy.get("words", self.status_stride)
+        self.occupancy_limits = tuple(sorted(occupancy.get("max", {}).items()))
+
+        control = profile["control"]
+        self.control_base = control["base"]
+        self.control_stride = control["stride"]
+        self.controls = {spec["name"]: ControlField(spec) for spec in control["fields"]}
+        by_offset = {}
+        for field in self.controls.values():
+            by_offset.setdefault(field.offset, []).append(field)
+        for fields in by_offset.values():
+            if len(fields) > 1:
+                for field in fields:
+                    field.shared = True
+        self._fields_at = by_offset
+
+        info = profile.get("info")
+        if info:
+            self.info_address = info["address"]
+            self.info_count = info["count"]
+            self.info_fields = tuple(_compile_field(spec) for spec in info["fields"])
+            self.info_constants = dict(info.get("constants", {}))
+        else:
+            self.info_address = None
+            self.info_count = 0
+            self.info_fields = ()
+            self.info_constants = {}
+
+    def __repr__(self):
+        return f"RegisterMap({self.name})"
+
+    # Addressing
+
+    def slot_of(self, system, index):
+        """Row number of an IDU in the status table."""
+        return system * self.units_per_system + index
+
+    def unit_of(self, slot):
+        """(system, index) of a status table row."""
+        return divmod(slot, self.units_per_system)
+
+    def status_address(self, slot):
+        return self.status_base + slot * self.status_stride
+
+    def control_address(self, slot, name):
+        return self.control_base + slot * self.control_stride + self.controls[name].offset
+
+    # Status
+
+    @lru_cache(maxsize=32)
+    def _plan(self, slots):
+        return tuple(plan_block_reads(slots, self.status_stride))
+
+    def plan(self, slots):
+        """Cached block read plan for a set of slots."""
+        return self._plan(frozenset(slots))
+
+    def create_decoder(self):
+        return StatusTableDecoder(self.status_stride, self.status_fields)
+
+    def create_reader(self):
+        """Block reader that learns and reads around unreadable rows."""
+        return BlockReader(self.status_base, self.status_stride, self.status_slots)
+
+    def read_table(self, client, slots):
+        """Block-read the status rows of the given slots, see status_table.read_table()."""
+        return read_table(
+            client, self.status_base, self.status_stride, self.status_slots, slots,
+            plan=self.plan(slots)
+        )
+
+    def decode_row(self, row):
+        return IduState(available=True, **decode_row(self.status_fields, row))
+
+    def read_status(self, client, slot):
+        """Read and decode one status row; UNAVAILABLE if it did not answer."""
+        regs = client.read_holding_registers(self.status_address(slot), self.status_stride)
+        if not regs or len(regs) != self.status_stride:
+            return UNAVAILABLE
+        return self.decode_row(regs)
+
+    def is_occupied(self, row):
+        """True if a status row (at least occupancy_words long) holds a unit."""
+        words = row[:self.occupancy_words]
+        if not any(words):
+            return False
+        return all(words[offset] <= limit for offset, limit in self.occupancy_limits)
+
+    def create_scan(self):
+        """Resumable whole-table scan, or None for adapters with fixed units."""
+        if self.fixed_units:
+            return None
+        return TableScan(self)
+
+    def scan(self, client):
+        """Return the occupied status table slots (blocking, one go)."""
+        scan = TableScan(self)
+        while not scan.blocks_done:
+            scan.read_next_block(client)
+        scan.retry_rows(client, scan.incomplete_slots())
+        return scan.occupied_slots()
+
+    # Controls
+
+    def encode_row(self, row, changes):
+        """Return a copy of a control row with the given {name: value} changes encoded."""
+        row = list(row)
+        for name, value in changes.items():
+            field = self.controls[name]
+            row[field.offset] = field.encode(value, row[field.offset])
+        return row
+
+    def plan_unit_writes(self, slots, changes):
+        """
+        Plan writing the same {name: value} changes to many units as few
+        multi-register writes. Only the registers of the changes are written:
+        adjacent ones (within a unit or across neighbouring units) share a
+        write, any gap splits it, so no register the changes do not cover is
+        ever written back.
+
+        Returns [(address, count, slots, needs_read)]: needs_read is set when
+        a register is shared with a field that is not changed, whose bits
+        must be read from the adapter first.
+        """
+        fields = [self.controls[name] for name in changes]
+        offsets = sorted({field.offset for field in fields})
+        partial = any(
+            other.name not in changes for field in fields for other in self._fields_at[field.offset]
+        )
+        runs = []
+        for slot in sorted(set(slots)):
+            base = self.control_base + slot * self.control_stride
+            for offset in offsets:
+                address = base + offset
+                if runs and address == runs[-1][0] + runs[-1][1] and runs[-1][1] < MAX_WRITE_BLOCK:
+                    runs[-1][1] += 1
+                    runs[-1][2].add(slot)
+                else:
+                    runs.append([address, 1, {slot}, partial])
+        return [tuple(run) for run in runs]
+
+    def write_units(self, client, slots, changes):
+        """
+        Write the same {name: value} changes to many units with the writes of
+        plan_unit_writes(). Runs with shared registers are read first (one
+        FC03) and written back with only the changed bits replaced.
+        Returns the set of slots whose writes all went through.
+        """
+        written, failed = set(), set()
+        for address, count, run_slots, needs_read in self.plan_unit_writes(slots, changes):
+            if needs_read:
+                words = client.read_holding_registers(address, count)
+                if not words or len(words) != count:
+                    _LOGGER.debug("%s: control read at %d (+%d) failed", self.name, address, count)
+                    failed.update(run_slots)
+                    continue
+                words = list(words)
+            else:
+                words = [0] * count
+            for slot in run_slots:
+                for name, value in changes.items():
+                    index = self.control_address(slot, name) - address
+                    if 0 <= index < count:
+                        words[index] = self.controls[name].encode(value, words[index])
+            _LOGGER.debug("%s: write %d registers at %d for %d IDUs",
+                          self.name, count, address, len(run_slots))
+            (written if client.write_registers(address, words) else failed).update(run_slots)
+        return written - failed
+
+    def write_field(self, client, slot, name, value):
+        """
+        Write one control field. Fields sharing a register with others are
+        read-modify-written so the neighbouring bits are preserved.
+        """
+        field = self.controls[name]
+        address = self.control_address(slot, name)
+        word = 0
+        if field.shared:
+            regs = client.read_holding_registers(address, 1)
+            if not regs:
+                return False
+            word = regs[0]
+        return client.write_register(address, field.encode(value, word))
+
+    def write_field_read_status(self, client, slot, name, value):
+        """
+        Write one control field and read the slot's status row back in a
+        single FC23 transaction (shared fields still read their register
+        first). Returns (outcome, IduState or None), see readwrite_registers();
+        outcome is None if that first read failed and no FC23 was sent.
+        """
+        field = self.controls[name]
+        address = self.control_address(slot, name)
+        word = 0
+        if field.shared:
+            regs = client.read_holding_registers(address, 1)
+            if not regs:
+                return None, None
+            word = regs[0]
+        outcome, regs = client.readwrite_registers(
+            self.status_address(slot), self.status_stride, address, [field.encode(value, word)]
+        )
+        if outcome != PROBE_OK:
+            return outcome, None
+        return outcome, self.decode_row(regs)
+
+    # Adapter info
+
+    def read_info(self, client):
+        """Read and decode the adapter info group; {} if it did not answer."""
+        if self.info_address is None:
+            return {}
+        regs = client.read_holding_registers(self.info_address, self.info_count)
+        if not regs or len(regs) != self.info_count:
+            return {}
+        return self.decode_info(regs)
+
+    def decode_info(self, regs):
+        info = decode_row(self.info_fields, regs)
+        info.update(self.info_constants)
+        return info
+
+
+class TableScan:
+    """
+    A whole status table scan split into steps that can run one at a time,
+    so callers can release the bus between them.
+
+    The table is read with the precomputed maximum-size block plan; occupancy
+    is decided per row once all blocks are done. Rows of failed blocks can be
+    retried one at a time, unless no block answered at all (adapter offline).
+    """
+
+    def __init__(self, register_map):
+        self.map = register_map
+        self.plan = register_map.full_plan
+        self._words = [0] * (register_map.status_slots * register_map.status_stride)
+        self._read = bytearray(len(self._words))
+        self._next = 0
+        self.blocks_ok = 0
+
+    @property
+    def blocks_done(self):
+        return self._next >= len(self.plan)
+
+    @property
+    def progress(self):
+        """Fraction of the block plan read so far."""
+        return self._next / len(self.plan) if self.plan else 1.0
+
+    def read_next_block(self, client):
+        """Read the next block of the plan; returns False if it failed."""
+        offset, count = self.plan[self._next]
+        self._next += 1
+        regs = client.read_holding_registers(self.map.status_base + offset, count)
+        if not regs or len(regs) != count:
+            _LOGGER.debug("%s: scan block at %d (+%d) failed",
+                          self.map.name, self.map.status_base + offset, count)
+            return False
+        self._words[offset:offset + count] = regs
+        self._read[offset:offset + count] = b"\x01" * count
+        self.blocks_ok += 1
+        return True
+
+    def incomplete_slots(self):
+        """Slots whose row was not fully read (empty if no block answered)."""
+        if not self.blocks_ok:
+            return []
+        stride = self.map.status_stride
+        return [
+            slot for slot in range(self.map.status_slots)
+            if not all(self._read[slot * stride:(slot + 1) * stride])
+        ]
+
+    def retry_rows(self, client, slots):
+        """Read the given rows one by one."""
+        stride = self.map.status_stride
+        for slot in slots:
+            regs = client.read_holding_registers(self.map.status_address(slot), stride)
+            if regs and len(regs) == stride:
+                self._words[slot * stride:(slot + 1) * stride] = regs
+                self._read[slot * stride:(slot + 1) * stride] = b"\x01" * stride
+
+    def occupied_slots(self):
+        if not self.blocks_ok:
+            _LOGGER.warning("%s: status table did not answer, scan found nothing", self.map.name)
+            return []
+        stride = self.map.status_stride
+        found = []
+        for slot in range(self.map.status_slots):
+            start = slot * stride
+            if all(self._read[start:start + stride]) and self.map.is_occupied(
+                self._words[start:start + stride]
+            ):
+                found.append(slot)
+        return found
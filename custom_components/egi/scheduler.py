@@ -0,0 +1,194 @@
+"""
+Integration-wide poll scheduler shared by all EGI coordinators.
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import time
+from contextlib import asynccontextmanager
+
+from . import const
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def get_scheduler(hass):
+    """Return the scheduler for this Home Assistant instance, creating it on first use."""
+    scheduler = hass.data.get(const.SCHEDULER_KEY)
+    if scheduler is None:
+        scheduler = EgiPollScheduler(hass)
+        hass.data[const.SCHEDULER_KEY] = scheduler
+    return scheduler
+
+
+class PriorityBusLock:
+    """
+    Exclusive bus lock that hands the bus to the waiter with the lowest
+    priority value on release (FIFO within a priority).
+    """
+
+    def __init__(self):
+        self._locked = False
+        self._waiters = []
+        self._seq = itertools.count()
+
+    @property
+    def locked(self):
+        return self._locked
+
+    def waiting(self, priority=None):
+        """Number of live waiters, optionally only those more urgent than priority."""
+        return sum(
+            1 for prio, _, future in self._waiters
+            if not future.done() and (priority is None or prio < priority)
+        )
+
+    async def acquire(self, priority):
+        if not self._locked and not self.waiting():
+            self._locked = True
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The bus was handed over just as we were cancelled
+                self.release()
+            raise
+
+    def release(self):
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                # Ownership passes to the waiter, the lock stays taken
+                future.set_result(None)
+                return
+        self._locked = False
+
+
+class EgiPollScheduler:
+    """
+    Knows every active coordinator and the bus it polls.
+
+    Coordinators get evenly spread phase offsets so that gateways on the same
+    interval don't all fire at once, bus I/O is serialized per bus (commands
+    before polls before scan steps) and limited to MAX_CONCURRENT_BUS_IO buses
+    integration-wide, and the bus time used by each coordinator is tracked as
+    a load figure.
+    """
+
+    def __init__(self, hass, max_concurrent_io=const.MAX_CONCURRENT_BUS_IO):
+        self.hass = hass
+        self._coordinators = []
+        self._phases = {}
+        self._io_slots = asyncio.Semaphore(max_concurrent_io)
+        self._bus_locks = {}
+        self._busy = {}
+        self._load = {}
+
+    def register(self, coordinator):
+        """Add a coordinator and re-spread all phases."""
+        if coordinator in self._coordinators:
+            return
+        self._coordinators.append(coordinator)
+        self._busy[coordinator] = 0.0
+        self._load[coordinator] = 0.0
+        self.restagger()
+
+    def unregister(self, coordinator):
+        """Remove a coordinator and re-spread the remaining phases."""
+        if coordinator not in self._coordinators:
+            return
+        self._coordinators.remove(coordinator)
+        self._phases.pop(coordinator, None)
+        self._busy.pop(coordinator, None)
+        self._load.pop(coordinator, None)
+        self.restagger()
+
+    def restagger(self):
+        """Spread coordinator phases evenly across their poll intervals."""
+        count = len(self._coordinators)
+        for slot, coordinator in enumerate(self._coordinators):
+            interval = self._interval_of(coordinator)
+            self._phases[coordinator] = interval * slot / count if interval else 0.0
+        _LOGGER.debug(
+            "Poll phases: %s",
+            {c.name: round(p, 3) for c, p in self._phases.items()},
+        )
+
+    @staticmethod
+    def _interval_of(coordinator):
+        interval = coordinator.update_interval
+        return interval.total_seconds() if interval else 0.0
+
+    def phase_of(self, coordinator):
+        return self._phases.get(coordinator, 0.0)
+
+    def next_fire_time(self, coordinator, now):
+        """Next loop time on the coordinator's phase grid strictly after now."""
+        interval = self._interval_of(coordinator)
+        phase = self.phase_of(coordinator)
+        if not interval:
+            return now
+        cycles = math.floor((now - phase) / interval) + 1
+        return phase + cycles * interval
+
+    @asynccontextmanager
+    async def bus_slot(self, coordinator, bus_key, priority=const.BUS_PRIORITY_POLL):
+        """
+        Hold exclusive use of a bus plus one of the global I/O slots. Waiters
+        get the bus in priority order (see const.BUS_PRIORITY_*).
+        """
+        lock = self._bus_locks.setdefault(bus_key, PriorityBusLock())
+        await lock.acquire(priority)
+        try:
+            async with self._io_slots:
+                start = time.perf_counter()
+                try:
+                    yield
+                finally:
+                    if coordinator in self._busy:
+                        self._busy[coordinator] += time.perf_counter() - start
+        finally:
+            lock.release()
+
+    def bus_waiting(self, bus_key, priority=None):
+        """Callers queued for a bus (more urgent than priority, if given)."""
+        lock = self._bus_locks.get(bus_key)
+        return lock.waiting(priority) if lock is not None else 0
+
+    def report_cycle(self, coordinator):
+        """Close a poll cycle: turn the accumulated bus time into a load fraction."""
+        if coordinator not in self._busy:
+            return
+        interval = self._interval_of(coordinator)
+        busy = self._busy[coordinator]
+        self._busy[coordinator] = 0.0
+        self._load[coordinator] = busy / interval if interval else 0.0
+
+    def load_of(self, coordinator):
+        """Fraction of the poll interval the coordinator spent on the bus last cycle."""
+        return self._load.get(coordinator, 0.0)
+
+    def bus_load(self, bus_key):
+        """Summed load of all coordinators sharing a bus."""
+        return sum(
+            load for coordinator, load in self._load.items()
+            if coordinator.bus_key == bus_key
+        )
+
+    def stats(self, coordinator):
+        """Per-entry scheduling figures for diagnostics sensors."""
+        bus_key = coordinator.bus_key
+        return {
+            "phase_offset_s": round(self.phase_of(coordinator), 3),
+            "bus": bus_key,
+            "bus_load_pct": round(self.bus_load(bus_key) * 100, 1),
+            "coordinators_on_bus": sum(
+                1 for c in self._coordinators if c.bus_key == bus_key
+            ),
+            "coordinators_total": len(self._coordinators),
+        }
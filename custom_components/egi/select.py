@@ -110,10 +110,9 @@ class VrfBrandSelect(CoordinatorEntity, SelectEntity):
             brand_code = self._brand_reverse.get(option)
             if brand_code is not None:
                 _LOGGER.info("User selected brand: %s → code %s", option, brand_code)
-                await self.hass.async_add_executor_job(
-                    self._adapter.write_brand_code, self._client, brand_code
+                await self.coordinator.async_run_restart_command(
+                    "write_brand_code", brand_code
                 )
-                await self.coordinator.async_request_refresh()
             else:
                 _LOGGER.warning("Unknown brand selection: %s", option)
         except Exception as e:
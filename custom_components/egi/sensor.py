@@ -37,6 +37,9 @@ async def async_setup_entry(
         SetupTimeSensor(coordinator, entry.entry_id, gateway_id),
         PollIntervalSensor(coordinator, entry.entry_id, gateway_id),
         UpdateTimeSensor(coordinator, entry.entry_id, gateway_id),
+        PollLoadSensor(coordinator, entry.entry_id, gateway_id),
+        RestartOutageSensor(coordinator, entry.entry_id, gateway_id),
+        ScanProgressSensor(coordinator, entry.entry_id, gateway_id),
         LogLevelSensor(entry.entry_id, adapter, gateway_id),
         AdapterConfigSensor(entry, coordinator, gateway_id),
         AdapterInfoSensor(entry, coordinator, adapter, gateway_id),
@@ -62,6 +65,19 @@ class SetupTimeSensor(BaseEgiSensor):
         duration = getattr(self._coordinator, "setup_duration", None)
         return round(duration, 2) if duration is not None else None
 
+    @property
+    def extra_state_attributes(self):
+        """Warm vs cold start, time until the first real poll, last cold setup and registration time."""
+        def _rounded(value):
+            return round(value, 2) if value is not None else None
+        return {
+            "warm_start": self._coordinator.warm_start,
+            "ready_duration": _rounded(self._coordinator.ready_duration),
+            "last_cold_setup_duration": _rounded(self._coordinator.cold_setup_duration),
+            "registration_duration": _rounded(self._coordinator.registration_duration),
+            "units": len(self._coordinator.devices),
+        }
+
 class PollIntervalSensor(BaseEgiSensor):
     """Configured poll interval (seconds)."""
     def __init__(self, coordinator, entry_id, gateway_id):
@@ -73,7 +89,7 @@ class PollIntervalSensor(BaseEgiSensor):
 
     @property
     def state(self):
-        return self._coordinator.update_interval.total_seconds()
+        return self._coordinator.poll_interval_seconds
 
 class UpdateTimeSensor(BaseEgiSensor):
     """Measured duration of the last update (seconds)."""
@@ -89,6 +105,64 @@ class UpdateTimeSensor(BaseEgiSensor):
         duration = getattr(self._coordinator, "last_update_duration", None)
         return round(duration, 2) if duration is not None else None
 
+class PollLoadSensor(BaseEgiSensor):
+    """Share of the poll interval this entry spent on the bus (percent)."""
+    def __init__(self, coordinator, entry_id, gateway_id):
+        super().__init__(entry_id, gateway_id)
+        self._coordinator = coordinator
+        self._attr_name = "EGI Poll Load"
+        self._attr_unique_id = f"{entry_id}_poll_load"
+        self._attr_unit_of_measurement = "%"
+
+    @property
+    def state(self):
+        load = self._coordinator.poll_load
+        return round(load * 100, 1) if load is not None else None
+
+    @property
+    def extra_state_attributes(self):
+        return self._coordinator.scheduling_stats()
+
+class RestartOutageSensor(BaseEgiSensor):
+    """How long the adapter was unreachable after its last reboot (seconds)."""
+    def __init__(self, coordinator, entry_id, gateway_id):
+        super().__init__(entry_id, gateway_id)
+        self._coordinator = coordinator
+        self._attr_name = "EGI Last Restart Outage"
+        self._attr_unique_id = f"{entry_id}_restart_outage"
+        self._attr_unit_of_measurement = "s"
+
+    @property
+    def state(self):
+        outage = self._coordinator.last_restart_outage
+        return round(outage, 1) if outage is not None else None
+
+    @property
+    def extra_state_attributes(self):
+        return {"restarting": self._coordinator.restarting}
+
+class ScanProgressSensor(BaseEgiSensor):
+    """Progress of the running indoor unit scan (percent, None when idle)."""
+    def __init__(self, coordinator, entry_id, gateway_id):
+        super().__init__(entry_id, gateway_id)
+        self._coordinator = coordinator
+        self._attr_name = "EGI Scan Progress"
+        self._attr_unique_id = f"{entry_id}_scan_progress"
+        self._attr_unit_of_measurement = "%"
+
+    @property
+    def state(self):
+        progress = self._coordinator.scan_progress
+        return round(progress * 100) if progress is not None else None
+
+    @property
+    def extra_state_attributes(self):
+        duration = self._coordinator.last_scan_duration
+        return {
+            "scanning": self._coordinator.scan_progress is not None,
+            "last_scan_duration": round(duration, 2) if duration is not None else None,
+        }
+
 class LogLevelSensor(BaseEgiSensor):
     """Current log level for this adapter."""
     def __init__(self, entry_id, adapter, gateway_id):
@@ -121,7 +195,7 @@ class AdapterConfigSensor(BaseEgiSensor):
         attrs = {
             "connection_type": self._conf.get("connection_type"),
             "slave_id": self._conf.get("slave_id"),
-            "poll_interval_s": self._coordinator.update_interval.total_seconds(),
+            "poll_interval_s": self._coordinator.poll_interval_seconds,
         }
         if self._conf.get("connection_type") == "serial":
             attrs.update({
@@ -164,4 +238,5 @@ class AdapterInfoSensor(BaseEgiSensor):
         except Exception as e:
             _LOGGER.error("Failed to decode adapter info: %s", e)
             decoded = raw
-        return decoded
+        # None until the first command tried Read/Write Multiple Registers
+        return {**decoded, "supports_fc23": self._adapter.supports_readwrite}
@@ -0,0 +1,193 @@
+"""
+Per-IDU status records and versioned, copy-on-write status snapshots shared
+by the coordinator and entities.
+"""
+from collections.abc import Mapping
+
+IDU_FIELDS = (
+    "available",
+    "power",
+    "mode_code",
+    "target_temp",
+    "current_temp",
+    "fan_code",
+    "wind_code",
+    "error_code",
+    "humidity",
+    "runtime_minutes",
+    # True while a failed read is bridged with the last-known values
+    "stale",
+)
+_FIELD_SET = frozenset(IDU_FIELDS)
+
+
+class IduState:
+    """
+    Immutable, slotted status record of one indoor unit.
+
+    Replaces the per-read status dicts but keeps their read API: get() and
+    item access by the old key names. A field that is None counts as missing,
+    so get(key, default) behaves like it did on a dict without that key.
+    """
+
+    __slots__ = IDU_FIELDS
+
+    def __init__(
+        self,
+        available=False,
+        power=False,
+        mode_code=None,
+        target_temp=None,
+        current_temp=None,
+        fan_code=None,
+        wind_code=None,
+        error_code=None,
+        humidity=None,
+        runtime_minutes=None,
+        stale=None,
+    ):
+        init = object.__setattr__
+        init(self, "available", available)
+        init(self, "power", power)
+        init(self, "mode_code", mode_code)
+        init(self, "target_temp", target_temp)
+        init(self, "current_temp", current_temp)
+        init(self, "fan_code", fan_code)
+        init(self, "wind_code", wind_code)
+        init(self, "error_code", error_code)
+        init(self, "humidity", humidity)
+        init(self, "runtime_minutes", runtime_minutes)
+        init(self, "stale", stale)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{key: value for key, value in data.items() if key in _FIELD_SET})
+
+    def __setattr__(self, name, value):
+        raise AttributeError("IduState is immutable, use replace()")
+
+    def _values(self):
+        return tuple(getattr(self, name) for name in IDU_FIELDS)
+
+    def __eq__(self, other):
+        if not isinstance(other, IduState):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self):
+        return hash(self._values())
+
+    def __repr__(self):
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in IDU_FIELDS
+            if getattr(self, name) is not None
+        )
+        return f"IduState({fields})"
+
+    def __getitem__(self, key):
+        if key not in _FIELD_SET or getattr(self, key) is None:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in _FIELD_SET and getattr(self, key) is not None
+
+    def get(self, key, default=None):
+        if key not in _FIELD_SET:
+            return default
+        value = getattr(self, key)
+        return default if value is None else value
+
+    def replace(self, **changes):
+        """Return a copy with the given fields changed."""
+        values = {name: getattr(self, name) for name in IDU_FIELDS}
+        values.update(changes)
+        return IduState(**values)
+
+    def as_dict(self):
+        return {
+            name: getattr(self, name) for name in IDU_FIELDS
+            if getattr(self, name) is not None
+        }
+
+
+# Shared record for units that have not answered (yet)
+UNAVAILABLE = IduState()
+
+
+def freeze_status(status):
+    """Return an IduState for a status returned by an adapter."""
+    if isinstance(status, IduState):
+        return status
+    if not status:
+        return UNAVAILABLE
+    return IduState.from_dict(status)
+
+
+class StatusSnapshot(Mapping):
+    """
+    Immutable mapping of unit key ("sys-idx") -> status record for one generation.
+
+    Every poll or targeted refresh publishes a new snapshot via evolve().
+    Records of units that did not change are shared with the previous snapshot
+    and keep their generation, so entities can skip work by comparing
+    generation_of(key) with the generation they last rendered.
+    """
+
+    __slots__ = ("generation", "_units", "_generations")
+
+    def __init__(self, units=None, generation=0, generations=None):
+        self.generation = generation
+        self._units = {key: freeze_status(status) for key, status in (units or {}).items()}
+        if generations is None:
+            generations = dict.fromkeys(self._units, generation)
+        self._generations = generations
+
+    def __getitem__(self, key):
+        return self._units[key]
+
+    def __iter__(self):
+        return iter(self._units)
+
+    def __len__(self):
+        return len(self._units)
+
+    def __repr__(self):
+        return f"StatusSnapshot(generation={self.generation}, units={len(self._units)})"
+
+    def generation_of(self, key):
+        """Generation in which the unit's record last changed (-1 if unknown)."""
+        return self._generations.get(key, -1)
+
+    def evolve(self, updates, removed=()):
+        """
+        Return a new generation with the given per-unit updates applied.
+        Unchanged records are shared; returns self if nothing changed at all.
+        """
+        generation = self.generation + 1
+        units = None
+        generations = None
+        for key, status in updates.items():
+            old = self._units.get(key)
+            if old is not None and (old is status or old == status):
+                continue
+            if units is None:
+                units = dict(self._units)
+                generations = dict(self._generations)
+            units[key] = freeze_status(status)
+            generations[key] = generation
+        for key in removed:
+            if key not in self._units:
+                continue
+            if units is None:
+                units = dict(self._units)
+                generations = dict(self._generations)
+            units.pop(key, None)
+            generations.pop(key, None)
+        if units is None:
+            return self
+        snapshot = StatusSnapshot.__new__(StatusSnapshot)
+        snapshot.generation = generation
+        snapshot._units = units
+        snapshot._generations = generations
+        return snapshot
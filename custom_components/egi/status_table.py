@@ -0,0 +1,362 @@
+"""
+Block reads and whole-table decoding of adapter status tables.
+
+A status table is a run of fixed-stride register rows, one row per unit slot
+(Light: 256 x 6 words from D0000, Pro: 64 x 16 words from D24000). Polls read
+the rows of all active slots in as few transactions as possible and decode
+every field across all units at once - vectorized with NumPy when it is
+installed, row by row in pure Python otherwise.
+"""
+import logging
+
+from .modbus_client import PROBE_EXCEPTION, PROBE_NO_RESPONSE, PROBE_OK
+from .state import IduState
+
+try:
+    import numpy as np
+except ImportError:  # optional speedup only
+    np = None
+
+_LOGGER = logging.getLogger(__name__)
+
+# Modbus limit for one read holding registers request
+MAX_READ_REGS = 125
+# Merge runs of active slots when the gap between them is at most this many
+# words; reading a few unused words is cheaper than another transaction
+MAX_GAP_WORDS = 32
+# Rows learned to be unreadable are retried one at a time every N passes
+HOLE_RETRY_PASSES = 30
+# Stop bisecting failed blocks after this many timeouts in one pass
+BISECT_MAX_TIMEOUTS = 4
+# A row that only times out (no Modbus exception) is learned as a hole once
+# its own read has timed out in this many passes in a row
+HOLE_TIMEOUT_PASSES = 2
+
+# Field kinds
+FIELD_INT = "int"
+FIELD_BOOL = "bool"
+FIELD_ASCII = "ascii"  # two registers holding up to four ASCII characters
+
+
+def plan_block_reads(slots, stride, max_regs=MAX_READ_REGS, max_gap=MAX_GAP_WORDS, holes=()):
+    """
+    Return [(offset, count), ...] word ranges (relative to the table base)
+    covering the rows of the given slots with as few reads as possible.
+    Gaps are never merged across rows listed in holes.
+    """
+    runs = []
+    previous = None
+    for slot in sorted(set(slots)):
+        start, end = slot * stride, (slot + 1) * stride
+        if (
+            runs and start - runs[-1][1] <= max_gap
+            and not any(hole in holes for hole in range(previous + 1, slot))
+        ):
+            runs[-1][1] = end
+        else:
+            runs.append([start, end])
+        previous = slot
+    plan = []
+    for start, end in runs:
+        for offset in range(start, end, max_regs):
+            plan.append((offset, min(max_regs, end - offset)))
+    return plan
+
+
+def read_table(client, base, stride, total_slots, slots, plan=None):
+    """
+    Block-read the rows of the given slots. Returns (words, valid_slots) where
+    words covers the whole table (unread words are 0) and valid_slots are the
+    slots whose complete row was read. plan is an optional precomputed
+    plan_block_reads() result for these slots.
+    """
+    words = [0] * (total_slots * stride)
+    read = bytearray(len(words))
+    if plan is None:
+        plan = plan_block_reads(slots, stride)
+    for offset, count in plan:
+        regs = client.read_holding_registers(base + offset, count)
+        if not regs or len(regs) != count:
+            _LOGGER.debug("Block read failed at %d (+%d)", base + offset, count)
+            continue
+        words[offset:offset + count] = regs
+        read[offset:offset + count] = b"\x01" * count
+    valid = {
+        slot for slot in slots
+        if all(read[slot * stride:(slot + 1) * stride])
+    }
+    return words, valid
+
+
+class BlockReader:
+    """
+    Block reads of one status table that isolate unreadable rows.
+
+    A block that fails with a Modbus exception, or times out while other
+    reads of the same pass answered, is bisected at row boundaries until the
+    rows failing on their own are found, so the healthy rows in it still get
+    their data. A row answering with a Modbus exception is a hole at once; a
+    row that only times out is read again on its own and becomes a hole
+    after timing out alone in HOLE_TIMEOUT_PASSES passes in a row, so one
+    lost reply never drops a unit from the block plan. Holes are remembered:
+    later plans never read across them and the other rows keep being read
+    in as few blocks as possible. Wanted rows among the holes are retried
+    one at a time every HOLE_RETRY_PASSES passes.
+    """
+
+    def __init__(self, base, stride, total_slots):
+        self.base = base
+        self.stride = stride
+        self.total_slots = total_slots
+        self.holes = set()
+        self._plans = {}
+        self._suspects = {}
+        self._passes = 0
+        self._timeouts = 0
+
+    def reset(self):
+        """Forget the learned holes (e.g. after the adapter rebooted)."""
+        self.holes = set()
+        self._plans = {}
+        self._suspects = {}
+
+    def plan(self, slots):
+        """Block plan for the given slots around the known holes (cached)."""
+        key = frozenset(slots)
+        plan = self._plans.get(key)
+        if plan is None:
+            if len(self._plans) >= 32:
+                self._plans.clear()
+            plan = self._plans[key] = tuple(
+                plan_block_reads(key - self.holes, self.stride, holes=self.holes)
+            )
+        return plan
+
+    def read(self, client, slots):
+        """Same result as read_table(): (words, valid_slots)."""
+        stride = self.stride
+        words = [0] * (self.total_slots * stride)
+        read = bytearray(len(words))
+        answered = False
+        failed = []
+        for offset, count in self.plan(slots):
+            outcome = self._read(client, words, read, offset, count)
+            if outcome != PROBE_NO_RESPONSE:
+                answered = True
+            if outcome != PROBE_OK:
+                failed.append((offset, count, outcome))
+
+        # Nothing answered at all: the adapter is offline, not the rows
+        if failed and answered:
+            learned = set()
+            self._timeouts = 0
+            for offset, count, outcome in failed:
+                first = offset // stride
+                last = min(-(-(offset + count) // stride), self.total_slots)
+                self._bisect(client, words, read, first, last, learned, outcome, count == stride)
+            if learned:
+                self.holes |= learned
+                self._plans.clear()
+                _LOGGER.info(
+                    "Rows %s at %d are unreadable, reading around them",
+                    sorted(learned), self.base
+                )
+
+        self._passes += 1
+        if answered and self._passes % HOLE_RETRY_PASSES == 0:
+            self._retry_holes(client, words, read, slots)
+        valid = {
+            slot for slot in slots
+            if all(read[slot * stride:(slot + 1) * stride])
+        }
+        if self._suspects:
+            for slot in valid.intersection(self._suspects):
+                del self._suspects[slot]
+        return words, valid
+
+    def _read(self, client, words, read, offset, count):
+        outcome, regs, _ = client.probe_registers(self.base + offset, count)
+        if outcome == PROBE_OK and regs and len(regs) == count:
+            words[offset:offset + count] = regs
+            read[offset:offset + count] = b"\x01" * count
+            return PROBE_OK
+        _LOGGER.debug("Block read failed at %d (+%d): %s", self.base + offset, count, outcome)
+        return PROBE_EXCEPTION if outcome == PROBE_EXCEPTION else PROBE_NO_RESPONSE
+
+    def _bisect(self, client, words, read, first, last, learned, outcome, alone=False):
+        """
+        Split the failed rows [first, last) until the rows failing on their own
+        are known; outcome is how the read covering them failed and alone
+        whether that read was of a single row.
+        """
+        if last - first == 1:
+            self._isolate(client, words, read, first, learned, outcome, alone)
+            return
+        middle = (first + last) // 2
+        for low, high in ((first, middle), (middle, last)):
+            if self._timeouts >= BISECT_MAX_TIMEOUTS:
+                return
+            count = (high - low) * self.stride
+            part, alone = outcome, False
+            if count <= MAX_READ_REGS:
+                part, alone = self._read(client, words, read, low * self.stride, count), high - low == 1
+                if part == PROBE_OK:
+                    continue
+                if part == PROBE_NO_RESPONSE:
+                    self._timeouts += 1
+            self._bisect(client, words, read, low, high, learned, part, alone)
+
+    def _isolate(self, client, words, read, slot, learned, outcome, alone):
+        """Decide whether a single failed row is a hole."""
+        if outcome == PROBE_NO_RESPONSE:
+            # A timeout may be a lost reply: read the row on its own first
+            if not alone:
+                if self._timeouts >= BISECT_MAX_TIMEOUTS:
+                    return
+                outcome = self._read(client, words, read, slot * self.stride, self.stride)
+                if outcome == PROBE_OK:
+                    self._suspects.pop(slot, None)
+                    return
+        if outcome == PROBE_NO_RESPONSE:
+            if not alone:
+                self._timeouts += 1
+            strikes = self._suspects[slot] = self._suspects.get(slot, 0) + 1
+            if strikes < HOLE_TIMEOUT_PASSES:
+                _LOGGER.debug("Row %d at %d timed out on its own", slot, self.base)
+                return
+        self._suspects.pop(slot, None)
+        learned.add(slot)
+
+    def _retry_holes(self, client, words, read, slots):
+        healed = {
+            slot for slot in sorted(self.holes.intersection(slots))
+            if self._read(client, words, read, slot * self.stride, self.stride) == PROBE_OK
+        }
+        if healed:
+            self.holes -= healed
+            self._plans.clear()
+            _LOGGER.info("Rows %s at %d are readable again", sorted(healed), self.base)
+
+
+def _ascii_pair(hi_lo_words):
+    chars = bytes(
+        byte for reg in hi_lo_words for byte in ((reg >> 8) & 0xFF, reg & 0xFF)
+        if 0x20 <= byte <= 0x7E
+    )
+    return chars.decode("ascii").strip()
+
+
+def decode_row(fields, row):
+    """Decode one row into {name: value} using (name, offset, shift, mask, kind, scale) fields."""
+    values = {}
+    for name, offset, shift, mask, kind, scale in fields:
+        if kind == FIELD_ASCII:
+            values[name] = _ascii_pair(row[offset:offset + 2])
+        elif kind == FIELD_BOOL:
+            values[name] = bool((row[offset] >> shift) & mask)
+        elif scale is not None:
+            values[name] = ((row[offset] >> shift) & mask) * scale
+        else:
+            values[name] = (row[offset] >> shift) & mask
+    return values
+
+
+class StatusTableDecoder:
+    """
+    Decodes whole status tables into IduState records and keeps the previous
+    table, so only rows that changed since the last decode produce new records.
+
+    fields: sequence of (name, offset, shift, mask, kind, scale) per row;
+    scale is None for raw integers.
+    """
+
+    def __init__(self, stride, fields, use_numpy=None):
+        self.stride = stride
+        self.fields = tuple(fields)
+        self.use_numpy = np is not None if use_numpy is None else use_numpy and np is not None
+        self._prev = None
+        self._prev_valid = set()
+
+    def reset(self):
+        """Forget the previous table, so the next decode rebuilds every row."""
+        self._prev = None
+        self._prev_valid = set()
+
+    def invalidate(self, slots):
+        """Force the given slots to be rebuilt on the next decode."""
+        self._prev_valid.difference_update(slots)
+
+    def decode(self, words, valid_slots):
+        """
+        Return ({slot: IduState} for valid rows that changed, changed_mask)
+        where changed_mask is a list of booleans aligned with sorted(valid_slots).
+        """
+        slots = sorted(valid_slots)
+        if not slots:
+            self._prev, self._prev_valid = words, set()
+            return {}, []
+        if self.use_numpy:
+            records, changed = self._decode_numpy(words, slots)
+        else:
+            records, changed = self._decode_python(words, slots)
+        self._prev, self._prev_valid = words, set(valid_slots)
+        return records, changed
+
+    def _decode_python(self, words, slots):
+        stride = self.stride
+        prev, prev_valid = self._prev, self._prev_valid
+        records = {}
+        changed = []
+        for slot in slots:
+            start = slot * stride
+            row = words[start:start + stride]
+            if prev is not None and slot in prev_valid and prev[start:start + stride] == row:
+                changed.append(False)
+                continue
+            changed.append(True)
+            records[slot] = IduState(available=True, **decode_row(self.fields, row))
+        return records, changed
+
+    def _decode_numpy(self, words, slots):
+        table = np.asarray(words, dtype=np.uint16).reshape(-1, self.stride)
+        index = np.asarray(slots, dtype=np.intp)
+        rows = table[index]
+
+        if self._prev is not None and len(self._prev) == len(words):
+            prev_rows = np.asarray(self._prev, dtype=np.uint16).reshape(-1, self.stride)[index]
+            was_valid = np.fromiter(
+                (slot in self._prev_valid for slot in slots), dtype=bool, count=len(slots)
+            )
+            changed = (rows != prev_rows).any(axis=1) | ~was_valid
+        else:
+            changed = np.ones(len(slots), dtype=bool)
+
+        picked = rows[changed]
+        columns = {}
+        for name, offset, shift, mask, kind, scale in self.fields:
+            if kind == FIELD_ASCII:
+                pair = picked[:, offset:offset + 2]
+                chars = np.stack(
+                    (pair[:, 0] >> 8, pair[:, 0] & 0xFF, pair[:, 1] >> 8, pair[:, 1] & 0xFF),
+                    axis=1,
+                ).astype(np.uint8)
+                chars[(chars < 0x20) | (chars > 0x7E)] = 0
+                columns[name] = [
+                    row.tobytes().replace(b"\x00", b"").decode("ascii").strip()
+                    for row in chars
+                ]
+            elif kind == FIELD_BOOL:
+                columns[name] = (((picked[:, offset] >> shift) & mask) != 0).tolist()
+            elif scale is not None:
+                columns[name] = (((picked[:, offset] >> shift) & mask) * scale).tolist()
+            else:
+                columns[name] = ((picked[:, offset] >> shift) & mask).tolist()
+
+        changed_slots = index[changed].tolist()
+        records = {}
+        for i, slot in enumerate(changed_slots):
+            records[slot] = IduState(
+                available=True,
+                **{name: column[i] for name, column in columns.items()}
+            )
+        return records, changed.tolist()
@@ -0,0 +1,48 @@
+"""
+Zone definitions: named groups of indoor units on one adapter, controlled
+together by a zone climate entity.
+
+Zones are configured as one text option, one zone per line (or separated by
+";"):  name: unit, unit, ...  where a unit is "system-index" and
+"system-first..last" is a range of indices of one system, e.g.
+
+    Floor 1: 0-0..7, 1-2
+    Meeting rooms: 0-12, 0-14
+"""
+import re
+
+_UNIT = re.compile(r"^(\d+)-(\d+)(?:\.\.(?:(\d+)-)?(\d+))?$")
+
+
+def parse_zones(text):
+    """
+    Return {zone name: [(system, index), ...]} in definition order.
+    Raises ValueError naming the first malformed entry.
+    """
+    zones = {}
+    for line in re.split(r"[;\n]", text or ""):
+        line = line.strip()
+        if not line:
+            continue
+        name, sep, members = line.partition(":")
+        name = name.strip()
+        if not sep or not name:
+            raise ValueError(f"zone without a name: {line!r}")
+        if name in zones:
+            raise ValueError(f"zone {name!r} defined twice")
+        units = []
+        for item in members.split(","):
+            item = item.replace(" ", "")
+            match = _UNIT.match(item)
+            if match is None:
+                raise ValueError(f"zone {name!r}: bad unit {item!r}")
+            system, first, last_system, last = match.groups()
+            system, first = int(system), int(first)
+            last = first if last is None else int(last)
+            if (last_system is not None and int(last_system) != system) or last < first:
+                raise ValueError(f"zone {name!r}: bad range {item!r}")
+            for index in range(first, last + 1):
+                if (system, index) not in units:
+                    units.append((system, index))
+        zones[name] = units
+    return zones
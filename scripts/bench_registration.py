@@ -0,0 +1,102 @@
+"""
+Measure how long the climate platform takes to register the devices and
+entities of 64 and 256 indoor units: a cold start (empty registries) and a
+warm restart (devices and entities already registered), best of RUNS.
+
+Needs Home Assistant:  python scripts/bench_registration.py [--units 64 256]
+"""
+import argparse
+import asyncio
+import logging
+import pathlib
+import sys
+import tempfile
+import time
+from datetime import timedelta
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from homeassistant import config_entries, loader  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import device_registry as dr, entity, entity_registry as er  # noqa: E402
+from homeassistant.helpers.entity_platform import EntityPlatform  # noqa: E402
+
+from custom_components.egi import climate, const  # noqa: E402
+from custom_components.egi.adapters import get_adapter  # noqa: E402
+from custom_components.egi.coordinator import EgiAdapterCoordinator  # noqa: E402
+
+RUNS = 3
+
+
+def _entry(entry_id):
+    """A loaded config entry; the constructor signature differs across releases."""
+    params = {
+        "version": 1, "minor_version": 1, "domain": const.DOMAIN, "title": "bench",
+        "data": {"adapter_type": "light"}, "options": {}, "source": "user", "entry_id": entry_id,
+    }
+    try:
+        entry = config_entries.ConfigEntry(**params)
+    except TypeError:
+        params.pop("minor_version")
+        entry = config_entries.ConfigEntry(**params)
+    return entry
+
+
+async def _setup_once(hass, entry, units):
+    """Set up the climate platform of one entry; returns the seconds it took."""
+    adapter = get_adapter("light")
+    coordinator = EgiAdapterCoordinator(hass, None, adapter, units, timedelta(seconds=60))
+    hass.data.setdefault(const.DOMAIN, {})[entry.entry_id] = {
+        "coordinator": coordinator, "adapter": adapter,
+    }
+    platform = EntityPlatform(
+        hass=hass, logger=logging.getLogger("bench"), domain="climate",
+        platform_name=const.DOMAIN, platform=climate, scan_interval=timedelta(seconds=60),
+        entity_namespace=None,
+    )
+    start = time.perf_counter()
+    await platform.async_setup_entry(entry)
+    await hass.async_block_till_done()
+    elapsed = time.perf_counter() - start
+    await platform.async_reset()
+    return elapsed
+
+
+async def _bench(count):
+    units = [(unit // 32, unit % 32) for unit in range(count)]
+    cold, warm = [], []
+    for run in range(RUNS):
+        with tempfile.TemporaryDirectory() as config_dir:
+            hass = HomeAssistant(config_dir)
+            loader.async_setup(hass)
+            entity.async_setup(hass)
+            await dr.async_load(hass)
+            await er.async_load(hass)
+            hass.config_entries = config_entries.ConfigEntries(hass, {})
+            entry = _entry(f"bench{run}")
+            hass.config_entries._entries[entry.entry_id] = entry
+            dr.async_get(hass).async_get_or_create(
+                config_entry_id=entry.entry_id,
+                identifiers={(const.DOMAIN, f"gateway_{entry.entry_id}")},
+                name="Gateway",
+            )
+            cold.append(await _setup_once(hass, entry, units))
+            warm.append(await _setup_once(hass, entry, units))
+            await hass.async_stop(force=True)
+    return min(cold), min(warm)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--units", type=int, nargs="+", default=[64, 256])
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+    print(f"{'units':>6}{'cold ms':>10}{'warm ms':>10}")
+    for count in args.units:
+        cold, warm = asyncio.run(_bench(count))
+        print(f"{count:>6}{cold * 1000:>10.1f}{warm * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
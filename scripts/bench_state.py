@@ -0,0 +1,76 @@
+"""
+Measure memory and allocations of one poll cycle's per-IDU state for 256 units:
+the former per-read status dicts vs. the slotted IduState records.
+
+Runs without Home Assistant:  python scripts/bench_state.py
+"""
+import importlib.util
+import pathlib
+import tracemalloc
+
+UNITS = 256
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+spec = importlib.util.spec_from_file_location(
+    "egi_state", ROOT / "custom_components" / "egi" / "state.py"
+)
+state = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(state)
+
+REGS = [(1, 24, 2, 0x0102, 23, 0)] * UNITS
+DEVICES = [(unit // 32, unit % 32) for unit in range(UNITS)]
+KEYS = {f"{sys}-{idx}": (sys, idx) for sys, idx in DEVICES}
+
+
+def cycle_dicts():
+    results = {}
+    for (system, index), regs in zip(DEVICES, REGS):
+        power, set_temp, mode, fan_wind, room, error = regs
+        results[f"{system}-{index}"] = {
+            "available": True,
+            "power": bool(power),
+            "mode_code": mode & 0xFF,
+            "target_temp": set_temp,
+            "current_temp": room,
+            "fan_code": fan_wind & 0xFF,
+            "wind_code": (fan_wind >> 8) & 0xFF,
+            "error_code": error,
+        }
+    return results
+
+
+def cycle_slots():
+    results = {}
+    for (key, _), regs in zip(KEYS.items(), REGS):
+        power, set_temp, mode, fan_wind, room, error = regs
+        results[key] = state.IduState(
+            available=True,
+            power=bool(power),
+            mode_code=mode & 0xFF,
+            target_temp=set_temp,
+            current_temp=room,
+            fan_code=fan_wind & 0xFF,
+            wind_code=(fan_wind >> 8) & 0xFF,
+            error_code=error,
+        )
+    return results
+
+
+def measure(func):
+    func()  # warm up caches/interned ints
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = func()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "lineno")
+    size = sum(stat.size_diff for stat in stats)
+    count = sum(stat.count_diff for stat in stats)
+    del result
+    return size, count
+
+
+if __name__ == "__main__":
+    for name, func in (("dict records", cycle_dicts), ("IduState records", cycle_slots)):
+        size, count = measure(func)
+        print(f"{name:18s} {UNITS} units: {size / 1024:7.1f} KiB, {count:5d} allocations")
@@ -0,0 +1,94 @@
+"""
+Measure what importing the integration costs: cumulative import time of each
+module below (python -X importtime, fresh interpreter per module, best of
+RUNS) and which heavy dependencies it drags in. Monitor-only setups and the
+modules loaded before any adapter is configured should import neither
+pymodbus nor NumPy; adapter modules are imported in the executor.
+
+Modules that do not need Home Assistant are imported through a bare package
+object, so the package __init__ (which imports Home Assistant) is skipped.
+Pass --full to also import the whole package (needs Home Assistant).
+
+Runs without Home Assistant:  python scripts/importtime.py [--full] [--top N]
+"""
+import argparse
+import pathlib
+import subprocess
+import sys
+
+RUNS = 5
+HEAVY = ("pymodbus", "numpy", "homeassistant")
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PACKAGE_DIR = ROOT / "custom_components" / "egi"
+
+# Import paths relative to the package; "" is the package itself (--full)
+MODULES = (
+    "const",
+    "state",
+    "status_table",
+    "register_map",
+    "adapters",
+    "adapters.vrf_light",
+    "adapters.vrf_pro",
+    "adapters.solo",
+    "modbus_client",
+)
+
+BARE_PACKAGE = (
+    "import sys, types; pkg = types.ModuleType('egi'); "
+    f"pkg.__path__ = [{str(PACKAGE_DIR)!r}]; sys.modules['egi'] = pkg; "
+)
+
+
+def _measure(module, full):
+    """Return ({imported module: (self_us, cumulative_us)}, target cumulative us)."""
+    if full:
+        target = "custom_components.egi" + (f".{module}" if module else "")
+        code = f"import {target}"
+    else:
+        target = f"egi.{module}"
+        code = BARE_PACKAGE + f"import {target}"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=False,
+    )
+    if proc.returncode:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[12:].split("|"))
+        if not self_us.isdigit():
+            continue  # header line
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings, timings.get(target, (0, 0))[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--full", action="store_true", help="import through the real package")
+    parser.add_argument("--top", type=int, default=0, help="show the N slowest imports per module")
+    args = parser.parse_args()
+
+    modules = (("",) if args.full else ()) + MODULES
+    print(f"{'module':<24}{'best ms':>9}" + "".join(f"{dep:>15}" for dep in HEAVY))
+    for module in modules:
+        try:
+            runs = [_measure(module, args.full) for _ in range(RUNS)]
+        except RuntimeError as err:
+            print(f"{module or '(package)':<24}  failed: {err}")
+            continue
+        timings, best = min(runs, key=lambda run: run[1])
+        loaded = {name.split(".")[0] for name in timings}
+        print(f"{module or '(package)':<24}{best / 1000:>9.2f}" + "".join(
+            f"{str(dep in loaded):>15}" for dep in HEAVY
+        ))
+        if args.top:
+            slowest = sorted(timings.items(), key=lambda item: item[1][0], reverse=True)
+            for name, (self_us, _) in slowest[:args.top]:
+                print(f"    {name:<40}{self_us / 1000:>8.2f} ms self")
+
+
+if __name__ == "__main__":
+    main()
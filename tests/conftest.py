@@ -0,0 +1,16 @@
+"""
+The integration's modules are imported through a bare "egi" package object,
+so the package __init__ (which imports Home Assistant) is skipped, as in
+scripts/importtime.py. Tests of modules that need Home Assistant skip
+without it.
+"""
+import pathlib
+import sys
+import types
+
+PACKAGE_DIR = pathlib.Path(__file__).resolve().parents[1] / "custom_components" / "egi"
+
+if "egi" not in sys.modules:
+    package = types.ModuleType("egi")
+    package.__path__ = [str(PACKAGE_DIR)]
+    sys.modules["egi"] = package
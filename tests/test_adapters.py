@@ -0,0 +1,60 @@
+"""Single-unit commands: FC23 write-and-read with its fallback to plain writes."""
+from egi.adapters import get_adapter
+from egi.modbus_client import PROBE_NO_RESPONSE, PROBE_OK, PROBE_UNSUPPORTED
+
+
+class FakeClient:
+    """Answers plain reads and writes; FC23 answers with a fixed outcome."""
+
+    def __init__(self, readwrite_outcome):
+        self.readwrite_outcome = readwrite_outcome
+        self.requests = []
+
+    def read_holding_registers(self, address, count=1):
+        self.requests.append("read")
+        return [0] * count
+
+    def write_register(self, address, value):
+        self.requests.append("write")
+        return True
+
+    def readwrite_registers(self, read_address, read_count, write_address, values):
+        self.requests.append("readwrite")
+        if self.readwrite_outcome == PROBE_OK:
+            return PROBE_OK, [1, 22, 2, 0, 230, 0][:read_count]
+        return self.readwrite_outcome, None
+
+
+def _commands(outcome, count=3):
+    adapter = get_adapter("light")
+    client = FakeClient(outcome)
+    results = [adapter.write_and_read(client, 0, 1, "target_temp", 22) for _ in range(count)]
+    return adapter, client, results
+
+
+def test_fc23_supported():
+    adapter, client, results = _commands(PROBE_OK)
+    assert adapter.supports_readwrite is True
+    assert client.requests == ["readwrite"] * 3
+    assert all(ok and status.target_temp == 22 for ok, status in results)
+
+
+def test_fc23_rejected_is_remembered():
+    adapter, client, results = _commands(PROBE_UNSUPPORTED)
+    assert adapter.supports_readwrite is False
+    assert client.requests == ["readwrite", "write", "write", "write"]
+    assert results == [(True, None)] * 3
+
+
+def test_fc23_silently_dropped_is_remembered():
+    adapter, client, results = _commands(PROBE_NO_RESPONSE)
+    assert adapter.supports_readwrite is False
+    assert client.requests == ["readwrite", "write", "write", "write"]
+    assert results == [(True, None)] * 3
+
+
+def test_fc23_timeout_after_it_worked_is_not_cached():
+    adapter, client, _ = _commands(PROBE_OK, count=1)
+    client.readwrite_outcome = PROBE_NO_RESPONSE
+    assert adapter.write_and_read(client, 0, 1, "target_temp", 22) == (True, None)
+    assert adapter.supports_readwrite is True
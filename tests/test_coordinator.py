@@ -0,0 +1,186 @@
+"""Coordinator behaviour around optimistic commands, with a fake adapter bus."""
+import asyncio
+import logging
+import tempfile
+import time
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from egi.adapters import get_adapter  # noqa: E402
+from egi import coordinator as coordinator_module  # noqa: E402
+from egi.coordinator import EgiAdapterCoordinator  # noqa: E402
+from egi.modbus_client import PROBE_NO_RESPONSE, PROBE_OK  # noqa: E402
+from egi.state import UNAVAILABLE, IduState  # noqa: E402
+
+UNITS = [(0, 0), (0, 1)]
+
+
+class FakeClient:
+    """Light adapter registers in a dict; reads covering a failing address time out."""
+
+    bus_key = "fake"
+    unit_id = 1
+
+    def __init__(self):
+        # Unit 0-0 and 0-1: on, 24 °C target, cool, 22 °C room temperature
+        self.registers = {0: 1, 1: 24, 2: 2, 4: 22, 6: 1, 7: 24, 8: 2, 10: 22}
+        self.failing = set()
+
+    def connect(self):
+        return True
+
+    def read_holding_registers(self, address, count=1):
+        if self.failing.intersection(range(address, address + count)):
+            return None
+        return [self.registers.get(address + i, 0) for i in range(count)]
+
+    def probe_registers(self, address, count):
+        regs = self.read_holding_registers(address, count)
+        return (PROBE_OK if regs else PROBE_NO_RESPONSE), regs, 0.01
+
+
+def _run(test):
+    """Run test(coordinator, client) against a polled Light coordinator."""
+    async def _main():
+        hass = HomeAssistant(tempfile.mkdtemp())
+        client = FakeClient()
+        coordinator = EgiAdapterCoordinator(
+            hass, client, get_adapter("light"), UNITS, timedelta(seconds=60)
+        )
+        await coordinator.async_refresh()
+        try:
+            await test(coordinator, client)
+        finally:
+            await coordinator.async_shutdown()
+            await hass.async_stop(force=True)
+    asyncio.run(_main())
+
+
+def test_command_shows_right_away_and_confirms():
+    async def test(coordinator, client):
+        coordinator.async_apply_optimistic("0-0", {"target_temp": 20})
+        assert coordinator.data["0-0"].target_temp == 20
+        client.registers[1] = 20
+        await coordinator._async_confirm()
+        assert coordinator.data["0-0"].target_temp == 20
+        assert "0-0" not in coordinator._unconfirmed
+    _run(test)
+
+
+def test_contradicting_read_rolls_back(caplog):
+    async def test(coordinator, client):
+        coordinator.async_apply_optimistic("0-0", {"target_temp": 20})
+        with caplog.at_level(logging.WARNING):
+            await coordinator._async_confirm()
+        assert coordinator.data["0-0"].target_temp == 24
+        assert "0-0" not in coordinator._unconfirmed
+        assert "rolled back" in caplog.text
+    _run(test)
+
+
+def test_read_started_before_the_command_is_dropped():
+    async def test(coordinator, client):
+        started = time.monotonic()
+        coordinator.async_apply_optimistic("0-0", {"target_temp": 20})
+        old_read = IduState(available=True, power=True, target_temp=24, mode_code=2)
+        results = coordinator.async_settle_reads(
+            {"0-0": old_read, "0-1": old_read}, {"0-0": started, "0-1": started}
+        )
+        assert results == {"0-1": old_read}
+        assert "0-0" in coordinator._unconfirmed
+        await coordinator.async_refresh()
+        assert coordinator.data["0-0"].target_temp == 24
+    _run(test)
+
+
+@pytest.mark.parametrize("unavailable_after", [0, 3])
+def test_failed_confirmation_read_keeps_the_command_pending(caplog, unavailable_after):
+    async def test(coordinator, client):
+        coordinator.apply_options({"unavailable_after": unavailable_after})
+        coordinator.async_apply_optimistic("0-0", {"target_temp": 20})
+        client.failing = set(range(0, 6))
+        with caplog.at_level(logging.WARNING):
+            await coordinator._async_confirm()
+        assert "rolled back" not in caplog.text
+        assert "0-0" in coordinator._unconfirmed
+        client.failing.clear()
+        client.registers[1] = 20
+        await coordinator._async_confirm()
+        assert coordinator.data["0-0"].target_temp == 20
+        assert "0-0" not in coordinator._unconfirmed
+    _run(test)
+
+
+OK = IduState(available=True, power=True, target_temp=24, mode_code=2)
+
+# (unavailable_after, max_data_age, [(seconds since the last step, read, expected state)])
+# where a read is "ok", "fail" or "same" (read fine, nothing changed)
+HYSTERESIS_CASES = {
+    "both off": (0, 0, [
+        (10, "fail", "unavailable"),
+        (10, "ok", "available"),
+    ]),
+    "failed reads": (3, 0, [
+        (10, "fail", "stale"),
+        (10, "fail", "stale"),
+        (10, "fail", "unavailable"),
+        (10, "fail", "unavailable"),
+        (10, "ok", "available"),
+    ]),
+    "data age": (0, 60, [
+        (10, "fail", "stale"),
+        (40, "fail", "stale"),
+        (20, "fail", "unavailable"),
+        (10, "ok", "available"),
+    ]),
+    "data age first": (5, 60, [
+        (30, "fail", "stale"),
+        (31, "fail", "unavailable"),
+    ]),
+    "unchanged read clears stale": (3, 60, [
+        (10, "fail", "stale"),
+        (10, "same", "available"),
+        (10, "fail", "stale"),
+        (10, "fail", "stale"),
+        (10, "fail", "unavailable"),
+        (10, "same", "unavailable"),
+        (10, "ok", "available"),
+    ]),
+}
+
+
+def _state(record):
+    if not record.get("available"):
+        return "unavailable"
+    return "stale" if record.get("stale") else "available"
+
+
+@pytest.mark.parametrize("case", list(HYSTERESIS_CASES))
+def test_apply_hysteresis(monkeypatch, case):
+    unavailable_after, max_data_age, steps = HYSTERESIS_CASES[case]
+    clock = [1000.0]
+    fake_time = type("FakeTime", (), {
+        "monotonic": staticmethod(lambda: clock[0]), "perf_counter": staticmethod(time.perf_counter),
+    })
+    monkeypatch.setattr(coordinator_module, "time", fake_time)
+
+    async def test(coordinator, client):
+        coordinator.apply_options({
+            "unavailable_after": unavailable_after, "max_data_age": max_data_age,
+        })
+        results = coordinator.apply_hysteresis(["0-0"], {"0-0": OK})
+        coordinator.data = coordinator.data.evolve(results)
+        for number, (seconds, read, expected) in enumerate(steps):
+            clock[0] += seconds
+            results = {"ok": {"0-0": OK}, "fail": {"0-0": UNAVAILABLE}, "same": {}}[read]
+            results = coordinator.apply_hysteresis(["0-0"], results)
+            coordinator.data = coordinator.data.evolve(results)
+            assert _state(coordinator.data["0-0"]) == expected, f"step {number}"
+            if expected == "stale":
+                assert coordinator.data["0-0"].target_temp == 24
+    _run(test)
@@ -0,0 +1,98 @@
+"""Subnet sweep against stand-in Modbus TCP servers on loopback addresses."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from egi import const  # noqa: E402
+from egi.discovery import DISCOVER_SERVICE_SCHEMA, async_sweep_subnet, fingerprint  # noqa: E402
+from egi.modbus_client import PROBE_EXCEPTION, PROBE_OK  # noqa: E402
+
+
+async def _handle(reader, writer):
+    """Stand-in Modbus server: answer every request with an exception reply."""
+    while header := await reader.read(260):
+        writer.write(header[:4] + b"\x00\x03" + header[6:7] + bytes([header[7] | 0x80, 0x02]))
+        await writer.drain()
+    writer.close()
+
+
+async def _sweep_with_servers(hosts, cidr, ports_extra=()):
+    first = await asyncio.start_server(_handle, hosts[0], 0)
+    port = first.sockets[0].getsockname()[1]
+    servers = [first] + [await asyncio.start_server(_handle, host, port) for host in hosts[1:]]
+    try:
+        return port, await async_sweep_subnet(cidr, (port, *ports_extra), limit=8, timeout=0.5)
+    finally:
+        for server in servers:
+            server.close()
+            await server.wait_closed()
+
+
+def test_sweep_finds_listening_hosts():
+    port, found = asyncio.run(
+        _sweep_with_servers(["127.0.0.5", "127.0.0.2"], "127.0.0.0/28")
+    )
+    assert found == [("127.0.0.2", port), ("127.0.0.5", port)]
+
+
+def test_sweep_single_host_network():
+    port, found = asyncio.run(_sweep_with_servers(["127.0.0.9"], "127.0.0.9/32"))
+    assert found == [("127.0.0.9", port)]
+
+
+@pytest.mark.parametrize("cidr", ["10.0.0.0/8", "192.168.0.0/19", "fd00::/64"])
+def test_sweep_refuses_large_ranges(cidr):
+    with pytest.raises(ValueError):
+        asyncio.run(async_sweep_subnet(cidr))
+
+
+def test_largest_allowed_range_is_a_slash_20():
+    assert const.DISCOVERY_MAX_SUBNET_ADDRESSES == 2 ** (32 - 20)
+
+
+class RegisterImage:
+    """Adapter stand-in: answers reads inside its register ranges, an exception elsewhere."""
+
+    def __init__(self, ranges, values):
+        self.ranges = ranges
+        self.values = values
+
+    def probe_registers(self, address, count):
+        if any(start <= address and address + count <= end for start, end in self.ranges):
+            return PROBE_OK, [self.values.get(address + i, 0) for i in range(count)], 0.01
+        return PROBE_EXCEPTION, None, 0.01
+
+
+def _light_image():
+    # IDU 0-2 running with wind code 0x01 (swing off) and fan code 0x01:
+    # its fan/wind word at D0015 looks like a Pro info word of slave 1
+    values = {12: 1, 13: 24, 14: 2, 15: 0x0101, 8000: 0x08, 8001: 0x0F, 8002: 0x27}
+    return RegisterImage([(0, 1536), (4000, 5024), (8000, 8005)], values)
+
+
+def test_fingerprint_light_is_not_taken_for_pro():
+    result = fingerprint(_light_image(), 1)
+    assert result["adapter_type"] == "light"
+    assert result["info"]["brand_code"] == 0x08
+
+
+def test_fingerprint_pro():
+    image = RegisterImage([(15, 16), (24000, 25024)], {15: (3 << 8) | 0x02})
+    result = fingerprint(image, 3)
+    assert result["adapter_type"] == "pro"
+    assert result["info"] == {"brand_code": 0x02, "slave_id": 3}
+    assert fingerprint(image, 1) is None
+
+
+def test_service_schema_coerces_selector_numbers():
+    data = DISCOVER_SERVICE_SCHEMA({
+        "connection_type": "serial", "port": "/dev/ttyUSB0",
+        "baudrate": 9600.0, "stopbits": 1.0, "bytesize": "8", "slave_range": [1.0, 2.0],
+    })
+    assert data == {
+        "connection_type": "serial", "port": "/dev/ttyUSB0",
+        "baudrate": 9600, "stopbits": 1, "bytesize": 8, "slave_range": [1, 2],
+    }
+    assert all(type(data[key]) is int for key in ("baudrate", "stopbits", "bytesize"))
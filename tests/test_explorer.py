@@ -0,0 +1,51 @@
+"""Register sweeps over readable ranges, exception holes and silent holes."""
+from egi.explorer import HOLE_STRIDE, SILENT_STRIDE, RegisterExplorer
+from egi.modbus_client import PROBE_EXCEPTION, PROBE_NO_RESPONSE, PROBE_OK
+
+
+class FakeClient:
+    """Answers reads of readable words; other reads time out or get an exception."""
+
+    def __init__(self, readable, silent):
+        self.readable = readable
+        self.silent = silent
+
+    def probe_registers(self, address, count):
+        if all(self.readable(word) for word in range(address, address + count)):
+            return PROBE_OK, [word & 0xFF for word in range(address, address + count)], 0.01
+        return (PROBE_NO_RESPONSE if self.silent else PROBE_EXCEPTION), None, 0.01
+
+
+def _sweep(start, count, client):
+    explorer = RegisterExplorer(start, count)
+    while not explorer.done:
+        explorer.read_next(client)
+    return explorer.as_dict()
+
+
+def test_exception_hole_is_mapped_exactly():
+    result = _sweep(0, 1000, FakeClient(lambda word: not 300 <= word < 701, silent=False))
+    assert result["complete"]
+    assert result["readable"] == [[0, 299], [701, 999]]
+    assert result["unreadable"] == [[300, 700]]
+
+
+def test_window_inside_exception_hole_is_found():
+    window = range(500, 500 + HOLE_STRIDE)
+    result = _sweep(0, 1000, FakeClient(lambda word: word < 300 or word in window, silent=False))
+    assert [500, 500 + HOLE_STRIDE - 1] in result["readable"]
+
+
+def test_silent_hole_costs_one_timeout_per_silent_stride():
+    hole = 10000
+    result = _sweep(0, 100 + hole + 50, FakeClient(lambda word: word < 100 or word >= 100 + hole, silent=True))
+    assert result["complete"]
+    assert result["unreadable"] == [[100, 100 + hole - 1]]
+    assert result["readable"] == [[0, 99], [100 + hole, 100 + hole + 49]]
+    assert result["timeouts"] <= hole // SILENT_STRIDE + 20
+
+
+def test_offline_adapter_aborts():
+    result = _sweep(0, 10000, FakeClient(lambda word: False, silent=True))
+    assert result["aborted"]
+    assert not result["complete"]
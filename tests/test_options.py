@@ -0,0 +1,80 @@
+"""Option saves that only change live-tunable options apply without a reload."""
+import asyncio
+import importlib
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from egi.options_flow import EgiVrfOptionsFlowHandler  # noqa: E402
+
+# The package __init__ is skipped by the bare "egi" package (see conftest.py)
+integration = importlib.import_module("egi.__init__")
+
+
+class FakeCoordinator:
+    def __init__(self):
+        self.applied = []
+
+    def apply_options(self, options):
+        self.applied.append(dict(options))
+
+
+class FakeHass:
+    def __init__(self, entry, coordinator):
+        self.data = {"egi": {entry.entry_id: {
+            "coordinator": coordinator,
+            "applied": (dict(entry.data), dict(entry.options)),
+        }}}
+        self.reloads = []
+        self.config_entries = SimpleNamespace(async_reload=self._async_reload)
+
+    async def _async_reload(self, entry_id):
+        self.reloads.append(entry_id)
+
+
+def _entry(options=None):
+    return SimpleNamespace(
+        entry_id="entry1",
+        data={"adapter_type": "light", "connection_type": "tcp"},
+        options=dict(options or {}),
+    )
+
+
+async def _save(entry, user_input):
+    """Run the options flow with user_input and store its result on the entry."""
+    flow = EgiVrfOptionsFlowHandler(entry)
+    result = await flow.async_step_init(user_input)
+    entry.options = result["data"]
+
+
+def _save_and_update(entry, user_input):
+    coordinator = FakeCoordinator()
+    hass = FakeHass(entry, coordinator)
+    asyncio.run(_save(entry, user_input))
+    asyncio.run(integration._async_config_entry_updated(hass, entry))
+    return hass, coordinator
+
+
+def test_first_save_of_poll_interval_applies_live():
+    entry = _entry()
+    hass, coordinator = _save_and_update(entry, {"poll_interval": 10})
+    assert hass.reloads == []
+    assert coordinator.applied[-1]["poll_interval"] == 10
+    assert hass.data["egi"]["entry1"]["applied"][1] == entry.options
+
+
+def test_save_without_changes_does_nothing():
+    entry = _entry()
+    hass, coordinator = _save_and_update(entry, {})
+    assert hass.reloads == []
+    assert coordinator.applied == []
+
+
+@pytest.mark.parametrize("user_input", [{"fleet_mode": False}, {"zones": "Lobby: 0-1"}])
+def test_non_live_option_reloads(user_input):
+    entry = _entry()
+    hass, coordinator = _save_and_update(entry, user_input)
+    assert hass.reloads == ["entry1"]
+    assert coordinator.applied == []
@@ -0,0 +1,89 @@
+"""Bulk control writes planned from the register maps of the adapters."""
+from egi.adapters.vrf_light import REGISTER_MAP as LIGHT
+from egi.adapters.vrf_pro import REGISTER_MAP as PRO
+
+
+class FakeClient:
+    """Holding registers in a dict; records every request."""
+
+    def __init__(self, registers=None, fail_reads=False):
+        self.registers = dict(registers or {})
+        self.fail_reads = fail_reads
+        self.requests = []
+
+    def read_holding_registers(self, address, count=1):
+        self.requests.append(("read", address, count))
+        if self.fail_reads:
+            return None
+        return [self.registers.get(address + i, 0) for i in range(count)]
+
+    def write_registers(self, address, values):
+        self.requests.append(("write", address, len(values)))
+        for i, value in enumerate(values):
+            self.registers[address + i] = value
+        return True
+
+
+def test_light_plan_never_bridges_unchanged_words():
+    plan = LIGHT.plan_unit_writes([0, 1, 2], {"power": True})
+    assert plan == [(4000, 1, {0}, False), (4004, 1, {1}, False), (4008, 1, {2}, False)]
+    plan = LIGHT.plan_unit_writes([0], {"power": True, "mode_code": 1})
+    assert plan == [(4000, 1, {0}, False), (4002, 1, {0}, False)]
+
+
+def test_light_plan_merges_adjacent_changed_words():
+    plan = LIGHT.plan_unit_writes([0, 2], {"power": True, "target_temp": 22})
+    assert plan == [(4000, 2, {0}, False), (4008, 2, {2}, False)]
+    changes = {"power": True, "target_temp": 22, "mode_code": 1, "fan_code": 2, "wind_code": 0}
+    plan = LIGHT.plan_unit_writes([0, 1, 2], changes)
+    assert plan == [(4000, 12, {0, 1, 2}, False)]
+
+
+def test_light_plan_reads_shared_register():
+    plan = LIGHT.plan_unit_writes([5], {"fan_code": 2})
+    assert plan == [(4023, 1, {5}, True)]
+    plan = LIGHT.plan_unit_writes([5], {"fan_code": 2, "wind_code": 1})
+    assert plan == [(4023, 1, {5}, False)]
+
+
+def test_light_plan_splits_at_write_limit():
+    changes = {"power": True, "target_temp": 22, "mode_code": 1, "fan_code": 2, "wind_code": 0}
+    plan = LIGHT.plan_unit_writes(range(64), changes)
+    assert [(address, count) for address, count, _, _ in plan] == [(4000, 123), (4123, 123), (4246, 10)]
+    assert set().union(*(slots for _, _, slots, _ in plan)) == set(range(64))
+
+
+def test_pro_plan_never_bridges_read_only_words():
+    plan = PRO.plan_unit_writes([0, 1], {"power": True, "target_temp": 24})
+    assert plan == [(24003, 2, {0}, False), (24019, 2, {1}, False)]
+
+
+def test_write_units_payload_holds_only_changed_words():
+    # Unit 1 was switched off at the wall; none of its other words, and no
+    # word of unit 2 outside the zone, may be written back
+    registers = {4000: 0x01, 4001: 24, 4002: 1, 4003: 0x0302, 4004: 0x02, 4005: 21, 4006: 2, 4007: 0x0101}
+    client = FakeClient(registers)
+    assert LIGHT.write_units(client, [0, 1], {"target_temp": 20, "fan_code": 1}) == {0, 1}
+    written = {address for kind, address, count in client.requests if kind == "write"
+               for address in range(address, address + count)}
+    assert written == {4001, 4003, 4005, 4007}
+    assert client.registers == {**registers, 4001: 20, 4003: 0x0301, 4005: 20, 4007: 0x0101}
+
+
+def test_write_units_shared_register_keeps_neighbour_bits():
+    client = FakeClient({4003: 0x0302})
+    assert LIGHT.write_units(client, [0], {"fan_code": 1}) == {0}
+    assert client.registers[4003] == 0x0301
+
+
+def test_write_units_failed_read_writes_nothing():
+    client = FakeClient(fail_reads=True)
+    assert LIGHT.write_units(client, [0, 1], {"fan_code": 1}) == set()
+    assert all(kind == "read" for kind, _, _ in client.requests)
+
+
+def test_write_units_without_read():
+    client = FakeClient(fail_reads=True)
+    assert PRO.write_units(client, [0, 3], {"power": True, "target_temp": 22}) == {0, 3}
+    assert client.requests == [("write", 24003, 2), ("write", 24051, 2)]
+    assert client.registers == {24003: 1, 24004: 22, 24051: 1, 24052: 22}
@@ -0,0 +1,154 @@
+"""Block reads of status tables around unreadable rows, and table decoding."""
+import random
+
+import pytest
+
+from egi.adapters.vrf_light import REGISTER_MAP as LIGHT
+from egi.adapters.vrf_pro import REGISTER_MAP as PRO
+from egi.modbus_client import PROBE_EXCEPTION, PROBE_NO_RESPONSE, PROBE_OK
+from egi.status_table import (
+    BISECT_MAX_TIMEOUTS,
+    HOLE_RETRY_PASSES,
+    HOLE_TIMEOUT_PASSES,
+    BlockReader,
+    StatusTableDecoder,
+)
+
+STRIDE = 6
+SLOTS = 64
+
+
+class FakeClient:
+    """Answers every read unless it covers a failing address."""
+
+    def __init__(self, failing=(), silent=False, offline=False):
+        self.failing = set(failing)
+        self.silent = silent
+        self.offline = offline
+        self.reads = []
+
+    def probe_registers(self, address, count):
+        self.reads.append((address, count))
+        if self.offline or self.failing.intersection(range(address, address + count)):
+            return (PROBE_NO_RESPONSE if self.silent or self.offline else PROBE_EXCEPTION), None, 0.01
+        return PROBE_OK, [address + i for i in range(count)], 0.01
+
+
+def _reader():
+    return BlockReader(0, STRIDE, SLOTS)
+
+
+def test_healthy_table_reads_in_full_blocks():
+    client = FakeClient()
+    words, valid = _reader().read(client, range(SLOTS))
+    assert valid == set(range(SLOTS))
+    assert client.reads == [(0, 125), (125, 125), (250, 125), (375, 9)]
+    assert words[100] == 100
+
+
+def test_failing_block_is_bisected_to_the_bad_row():
+    reader = _reader()
+    client = FakeClient(failing={10 * STRIDE + 2})
+    words, valid = reader.read(client, range(SLOTS))
+    assert valid == set(range(SLOTS)) - {10}
+    assert reader.holes == {10}
+    # Next pass reads around the hole without failing
+    client.reads.clear()
+    _, valid = reader.read(client, range(SLOTS))
+    assert valid == set(range(SLOTS)) - {10}
+    assert all(not 60 <= address < 66 for address, _ in client.reads)
+    assert all(
+        address + count <= 60 or address >= 66 for address, count in client.reads
+    )
+
+
+def test_silent_row_becomes_a_hole_after_repeated_passes():
+    reader = _reader()
+    client = FakeClient(failing={10 * STRIDE}, silent=True)
+    for _ in range(HOLE_TIMEOUT_PASSES - 1):
+        reader.read(client, range(SLOTS))
+        assert reader.holes == set()
+    _, valid = reader.read(client, range(SLOTS))
+    assert reader.holes == {10}
+    assert 10 not in valid
+
+
+def test_single_lost_reply_is_not_a_hole():
+    reader = _reader()
+    client = FakeClient()
+    calls = []
+    answer = client.probe_registers
+
+    def flaky(address, count):
+        calls.append(address)
+        if len(calls) == 1:
+            return PROBE_NO_RESPONSE, None, 0.01
+        return answer(address, count)
+
+    client.probe_registers = flaky
+    for _ in range(HOLE_TIMEOUT_PASSES + 1):
+        _, valid = reader.read(client, range(SLOTS))
+    assert reader.holes == set()
+    assert valid == set(range(SLOTS))
+
+
+def test_holes_are_retried_and_heal():
+    reader = _reader()
+    client = FakeClient(failing={10 * STRIDE + 2})
+    reader.read(client, range(SLOTS))
+    assert reader.holes == {10}
+    client.failing.clear()
+    passes = 1
+    while reader.holes:
+        client.reads.clear()
+        _, valid = reader.read(client, range(SLOTS))
+        passes += 1
+        assert passes <= HOLE_RETRY_PASSES
+    assert passes == HOLE_RETRY_PASSES
+    assert (60, STRIDE) in client.reads
+    assert 10 in valid
+
+
+def test_bisection_stops_at_the_timeout_cap():
+    reader = _reader()
+    # Every row of the first block is silent; the others answer
+    client = FakeClient(failing=range(0, 125), silent=True)
+    reader.read(client, range(SLOTS))
+    timeouts = [
+        (address, count) for address, count in client.reads
+        if address < 125 and (address, count) != (0, 125)
+    ]
+    assert len(timeouts) <= BISECT_MAX_TIMEOUTS
+
+
+def test_offline_adapter_learns_nothing():
+    reader = _reader()
+    client = FakeClient(offline=True)
+    _, valid = reader.read(client, range(SLOTS))
+    assert valid == set()
+    assert reader.holes == set()
+    assert len(client.reads) == 4
+
+
+def _random_tables(register_map, seed, passes=5):
+    """Random status tables where a few rows change and rows drop in and out between passes."""
+    rng = random.Random(seed)
+    stride, slots = register_map.status_stride, register_map.status_slots
+    words = [rng.randrange(0x10000) for _ in range(stride * slots)]
+    for _ in range(passes):
+        for _ in range(rng.randrange(slots // 4)):
+            words[rng.randrange(len(words))] = rng.randrange(0x10000)
+        valid = {slot for slot in range(slots) if rng.random() > 0.1}
+        yield list(words), valid
+
+
+@pytest.mark.parametrize("register_map", [LIGHT, PRO], ids=lambda register_map: register_map.name)
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_numpy_and_python_decoders_agree(register_map, seed):
+    pytest.importorskip("numpy")
+    python = StatusTableDecoder(register_map.status_stride, register_map.status_fields, use_numpy=False)
+    vectorized = StatusTableDecoder(register_map.status_stride, register_map.status_fields, use_numpy=True)
+    assert not python.use_numpy and vectorized.use_numpy
+    for words, valid in _random_tables(register_map, seed):
+        expected = python.decode(words, valid)
+        assert vectorized.decode(words, valid) == expected
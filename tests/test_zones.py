@@ -0,0 +1,38 @@
+"""Zone definitions parsed from the options text."""
+import pytest
+
+from egi.zones import parse_zones
+
+
+def test_parse_zones_ranges_and_separators():
+    zones = parse_zones("Floor 1: 0-0..3, 1-2\nLobby: 0-9; Meeting rooms: 0-12, 0-14")
+    assert zones == {
+        "Floor 1": [(0, 0), (0, 1), (0, 2), (0, 3), (1, 2)],
+        "Lobby": [(0, 9)],
+        "Meeting rooms": [(0, 12), (0, 14)],
+    }
+    assert list(zones) == ["Floor 1", "Lobby", "Meeting rooms"]
+
+
+def test_parse_zones_range_with_system_and_duplicates():
+    assert parse_zones("A: 1-4..1-6, 1-5") == {"A": [(1, 4), (1, 5), (1, 6)]}
+
+
+def test_parse_zones_empty():
+    assert parse_zones("") == {}
+    assert parse_zones(None) == {}
+    assert parse_zones(" ;\n ") == {}
+
+
+@pytest.mark.parametrize("text", [
+    "0-1, 0-2",
+    ": 0-1",
+    "A: 0-1\nA: 0-2",
+    "A: 0-x",
+    "A: 0-1,",
+    "A: 0-5..3",
+    "A: 0-1..1-3",
+])
+def test_parse_zones_rejects(text):
+    with pytest.raises(ValueError):
+        parse_zones(text)